@@ -269,11 +269,17 @@ class MpmIndicator extends PanelMenu.Button {
              * indicator in the checking state forever. */
             const watchdog = timeout * 4;
             /* Refresh the package indexes first, best-effort: failures will
-             * resurface per manager in the outdated report. */
-            await Mpm.runCommand(
-                Mpm.syncArgv(mpm, timeout), cancellable, watchdog);
+             * resurface per manager in the outdated report. Recent mpm
+             * pipelines each manager's sync with its listing in one call. */
+            const pipelined = Mpm.compareVersions(
+                probe.version, Mpm.MPM_PIPELINED_SYNC_VERSION) >= 0;
+            if (!pipelined) {
+                await Mpm.runCommand(
+                    Mpm.syncArgv(mpm, timeout), cancellable, watchdog);
+            }
             const result = await Mpm.runCommand(
-                Mpm.outdatedArgv(mpm, timeout), cancellable, watchdog);
+                Mpm.outdatedArgv(mpm, timeout, pipelined),
+                cancellable, watchdog);
             if (result.stderr || !result.stdout) {
                 this._setError(result.stderr || _('mpm produced no output.'));
                 return;
@@ -2,7 +2,7 @@
  *
  * This module is the GJS counterpart of the SwiftBar/Xbar plugin launcher
  * (meta_package_manager/bar_plugin.py): locate a runnable mpm, gate on a
- * minimum version, run `sync` then `outdated`, and build the commands behind
+ * minimum version, sync then list `outdated`, and build the commands behind
  * the menu actions. Rendering lives in extension.js.
  *
  * It deliberately imports only gi://Gio and gi://GLib, never any
@@ -22,6 +22,11 @@ export const MPM_MIN_VERSION = [6, 4, 0];
  * invokes (manager selectors, `upgrade --all`, `--no-color`, `--verbosity`,
  * `--timeout`, `sync`) predates that release. */
 
+export const MPM_PIPELINED_SYNC_VERSION = [8, 0, 0];
+/* mpm 8.0.0 added `outdated --sync`, syncing each manager right before listing
+ * its outdated packages in a single call. Older releases get the separate
+ * `sync` then `outdated` pair, like bar_plugin.py. */
+
 export const MPM_TIMEOUT = 60;
 /* Default `--timeout` (seconds), mirroring bar_plugin.py: mpm's own defaults
  * are tuned for interactive runs and are too long for a background refresh. */
@@ -226,16 +231,19 @@ export async function probeMpm(mpm, cancellable, watchdogSeconds = 30) {
  * for every argv mpm itself constructs at runtime. The sync/outdated pair
  * replicates bar_plugin.py's print_menu() contract: sync errors are lowered
  * to ERROR as best-effort noise, while outdated silences everything but
- * CRITICAL since per-manager errors come back inside the JSON payload. */
+ * CRITICAL since per-manager errors come back inside the JSON payload. With
+ * `sync` set, outdatedArgv folds both into one pipelined call, for mpm
+ * releases from MPM_PIPELINED_SYNC_VERSION on. */
 
 export function syncArgv(mpm, timeout = MPM_TIMEOUT) {
     return [...mpm, '--verbosity', 'ERROR', '--timeout', String(timeout), 'sync'];
 }
 
-export function outdatedArgv(mpm, timeout = MPM_TIMEOUT) {
+export function outdatedArgv(mpm, timeout = MPM_TIMEOUT, sync = false) {
     return [
         ...mpm, '--no-color', '--verbosity', 'CRITICAL',
         '--timeout', String(timeout), '--table-format', 'json', 'outdated',
+        ...(sync ? ['--sync'] : []),
     ];
 }
 
@@ -0,0 +1,297 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Fleet-wide aggregation of exported inventories.
+
+`mpm aggregate` reads the inventories collected from many hosts, each file
+standing for one host, in either of the two shapes `mpm` exports:
+
+- the JSON payload of `mpm --table-format json installed`, mapping each
+  manager ID to its `packages` list;
+- the TOML manifest of `mpm dump`, mapping each manager ID to a
+  `{package_id: version}` table.
+
+For each package of each manager, the {class}`FleetInventory` tells which host
+holds which version. From there it reports the version histogram, the newest
+version seen (ranked by {func}`~meta_package_manager.version.parse_version`),
+the hosts lagging behind it, and the hosts lagging on far more packages than
+the rest of the fleet.
+
+Files are parsed by batches of {data}`BATCH_SIZE` in a process pool, each batch
+folded into a partial {class}`FleetInventory` before being merged into the
+final one. Host memberships are stored as arrays of host indices, so the
+memory taken grows with the number of installed packages, at 4 bytes each, and
+at most {data}`BATCHES_IN_FLIGHT` batches per worker are pending at any time.
+"""
+
+from __future__ import annotations
+
+import logging
+import statistics
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Final
+
+from .json_decoder import loads
+from .version import parse_version
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib  # type: ignore[import-not-found]
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from .version import TokenizedString
+
+
+BATCH_SIZE: Final = 64
+"""Number of inventory files parsed by a worker in one go."""
+
+BATCHES_IN_FLIGHT: Final = 4
+"""Batches submitted ahead per worker, bounding the results waiting to be
+merged."""
+
+OUTLIER_THRESHOLD: Final = 3.5
+"""Modified z-score above which a host is reported as an outlier.
+
+The cutoff recommended by Iglewicz and Hoaglin for their median-based z-score,
+which a few badly lagging hosts cannot drag along the way they would a mean.
+"""
+
+
+def _inventory_packages(document: object) -> Iterator[tuple[str, str, str | None]]:
+    """Yield the `(manager_id, package_id, version)` of an inventory document.
+
+    Sections that look like neither an `installed` payload nor a `dump` table
+    are skipped.
+    """
+    if not isinstance(document, dict):
+        raise ValueError("not a mapping of manager IDs")
+    for manager_id, section in document.items():
+        if not isinstance(section, dict):
+            continue
+        packages = section.get("packages")
+        if isinstance(packages, list):
+            for package in packages:
+                if isinstance(package, dict) and package.get("id"):
+                    version = package.get("installed_version")
+                    yield manager_id, package["id"], str(version) if version else None
+        else:
+            for package_id, version in section.items():
+                if isinstance(version, (str, int, float)):
+                    yield manager_id, package_id, str(version) or None
+
+
+def read_inventory(path: Path) -> Iterator[tuple[str, str, str | None]]:
+    """Parse the inventory file at `path`, as JSON or TOML.
+
+    The format is told by the file extension, JSON being tried first for any
+    other one.
+    """
+    content = path.read_bytes()
+    if path.suffix.lower() == ".toml":
+        return _inventory_packages(tomllib.loads(content.decode()))
+    try:
+        document = loads(content)
+    except ValueError:
+        if path.suffix.lower() == ".json":
+            raise
+        document = tomllib.loads(content.decode())
+    return _inventory_packages(document)
+
+
+class FleetInventory:
+    """Which hosts hold which version of each package, per manager.
+
+    Hosts are identified by their index in {attr}`hosts`.
+    """
+
+    def __init__(self) -> None:
+        self.hosts: list[str] = []
+        self.failures: dict[int, str] = {}
+        """Hosts whose inventory could not be read, and why."""
+        self.holders: dict[str, dict[str, dict[str | None, array]]] = {}
+        """Host indices holding each version of each package of each manager."""
+
+    def add(self, host: int, packages: Iterable[tuple[str, str, str | None]]) -> None:
+        """Record the `packages` of `host`."""
+        holders = self.holders
+        for manager_id, package_id, version in packages:
+            versions = holders.setdefault(manager_id, {}).setdefault(package_id, {})
+            hosts = versions.get(version)
+            if hosts is None:
+                hosts = versions[version] = array("I")
+            hosts.append(host)
+
+    def merge(self, other: FleetInventory) -> None:
+        """Fold the memberships of `other`, indexing the same hosts."""
+        self.failures.update(other.failures)
+        for manager_id, packages in other.holders.items():
+            own_packages = self.holders.setdefault(manager_id, {})
+            for package_id, versions in packages.items():
+                own_versions = own_packages.setdefault(package_id, {})
+                for version, hosts in versions.items():
+                    if version in own_versions:
+                        own_versions[version].extend(hosts)
+                    else:
+                        own_versions[version] = hosts
+
+    def newest(self, versions: Iterable[str | None]) -> str | None:
+        """The highest of `versions`, unknown versions never being the newest."""
+        known = [version for version in versions if version is not None]
+        return max(known, key=parse_version) if known else None
+
+    def lagging(self, versions: dict[str | None, array]) -> tuple[str | None, array]:
+        """The newest version of a package, and the hosts holding an older one.
+
+        Hosts with an unknown version are not lagging: nothing tells them apart
+        from the newest.
+        """
+        newest = self.newest(versions)
+        lagging = array("I")
+        if newest is not None:
+            newest_version: TokenizedString = parse_version(newest)
+            for version, hosts in versions.items():
+                if version is not None and parse_version(version) < newest_version:
+                    lagging.extend(hosts)
+        return newest, lagging
+
+    def report(self) -> tuple[dict[str, dict[str, dict]], list[dict]]:
+        """Per-package statistics, and the outlier hosts.
+
+        Each package maps to its host count, its `versions` histogram from the
+        newest to the oldest, its `newest` version and the sorted names of the
+        `lagging` hosts. Outliers are the hosts whose count of lagging packages
+        stands out from the fleet (see {data}`OUTLIER_THRESHOLD`).
+        """
+        lag_counts = [0] * len(self.hosts)
+        packages: dict[str, dict[str, dict]] = {}
+        for manager_id in sorted(self.holders):
+            per_package = packages[manager_id] = {}
+            for package_id in sorted(self.holders[manager_id]):
+                versions = self.holders[manager_id][package_id]
+                newest, lagging = self.lagging(versions)
+                for host in lagging:
+                    lag_counts[host] += 1
+                ranked = sorted(
+                    versions,
+                    key=lambda v: (v is not None, parse_version(v or "")),
+                    reverse=True,
+                )
+                per_package[package_id] = {
+                    "hosts": sum(len(hosts) for hosts in versions.values()),
+                    "newest": newest,
+                    "versions": {str(v): len(versions[v]) for v in ranked},
+                    "lagging": sorted(self.hosts[host] for host in set(lagging)),
+                }
+        return packages, self.outliers(lag_counts)
+
+    def outliers(self, lag_counts: Sequence[int]) -> list[dict]:
+        """Hosts whose lagging package count is an outlier, worst first.
+
+        Scored with the modified z-score, which divides the distance to the
+        median by the median absolute deviation. A fleet mostly up to date has
+        a null deviation, in which case the mean absolute deviation stands in.
+        """
+        counts = {
+            host: count
+            for host, count in enumerate(lag_counts)
+            if host not in self.failures
+        }
+        if len(counts) < 3:
+            return []
+        median = statistics.median(counts.values())
+        deviations = [abs(count - median) for count in counts.values()]
+        median_deviation = statistics.median(deviations)
+        if median_deviation:
+            scale = 0.6745 / median_deviation
+        else:
+            mean_deviation = statistics.fmean(deviations)
+            if not mean_deviation:
+                return []
+            scale = 1 / (1.253314 * mean_deviation)
+        outliers = [
+            {
+                "host": self.hosts[host],
+                "lagging": count,
+                "score": round((count - median) * scale, 2),
+            }
+            for host, count in counts.items()
+            if (count - median) * scale > OUTLIER_THRESHOLD
+        ]
+        return sorted(outliers, key=lambda outlier: -outlier["score"])
+
+
+def read_batch(start: int, paths: Sequence[str]) -> FleetInventory:
+    """Parse the inventories at `paths`, indexing hosts from `start`.
+
+    Runs in a worker process: unreadable files are recorded as failures
+    rather than raised, so one bad file does not lose the batch.
+    """
+    inventory = FleetInventory()
+    for offset, path in enumerate(paths):
+        try:
+            inventory.add(start + offset, read_inventory(Path(path)))
+        except (OSError, ValueError, UnicodeDecodeError) as ex:
+            inventory.failures[start + offset] = str(ex) or type(ex).__name__
+    return inventory
+
+
+def _batches(paths: Sequence[str]) -> Iterator[tuple[int, Sequence[str]]]:
+    for start in range(0, len(paths), BATCH_SIZE):
+        yield start, paths[start : start + BATCH_SIZE]
+
+
+def aggregate_files(
+    paths: Sequence[str], jobs: int = 1, progress: Callable[[int], None] | None = None
+) -> FleetInventory:
+    """Aggregate the inventory files at `paths`, with `jobs` worker processes.
+
+    `progress` is called with the number of files read after each batch.
+    """
+    inventory = FleetInventory()
+    inventory.hosts = list(paths)
+    batches = _batches(inventory.hosts)
+
+    def fold(batch: FleetInventory, size: int) -> None:
+        inventory.merge(batch)
+        if progress:
+            progress(size)
+
+    if jobs <= 1:
+        for start, batch_paths in batches:
+            fold(read_batch(start, batch_paths), len(batch_paths))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pending: deque = deque()
+            for start, batch_paths in batches:
+                future = executor.submit(read_batch, start, batch_paths)
+                pending.append((future, len(batch_paths)))
+                if len(pending) >= jobs * BATCHES_IN_FLIGHT:
+                    future, size = pending.popleft()
+                    fold(future.result(), size)
+            while pending:
+                future, size = pending.popleft()
+                fold(future.result(), size)
+
+    for host, reason in sorted(inventory.failures.items()):
+        logging.warning(f"Cannot read {inventory.hosts[host]}: {reason}")
+    return inventory
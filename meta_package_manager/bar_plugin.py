@@ -34,6 +34,7 @@ quota.
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import re
 import sys
@@ -67,6 +68,14 @@ XBAR_MIN_VERSION = (2, 1, 7)
 MPM_MIN_VERSION = (5, 0, 0)
 """Mpm v5.0.0 was the first version taking care of the complete layout rendering."""
 
+MPM_PIPELINED_SYNC_VERSION = (8, 0, 0)
+"""Mpm v8.0.0 introduced `outdated --sync`.
+
+It syncs each manager right before listing its outdated packages, within the same
+call: the plugin then spawns a single `mpm` process instead of a `sync` followed by
+an `outdated`, and no manager waits on the slowest sync to be listed.
+"""
+
 INSTALL_ARGV = ("uv", "tool", "install", "--upgrade", "meta-package-manager")
 """Bootstrap command offered when no runnable `mpm` is found.
 
@@ -101,6 +110,29 @@ the whole refresh in a minute instead of freezing the menubar for several.
 """
 
 
+RANKING_CACHE_FILENAME = "ranked-mpm.json"
+"""State file persisting the probes of {meth}`MPMPlugin.ranked_mpm` between refreshes.
+
+Lives in {attr}`MPMPlugin.cache_dir`. Every probe starts a full Python interpreter
+for `mpm --version`, so re-probing all candidates on each refresh costs seconds on a
+machine with several virtualenvs and `uv tool` installs.
+"""
+
+PROJECT_FILES = (
+    "Pipfile",
+    "Pipfile.lock",
+    "poetry.lock",
+    "pyproject.toml",
+    "requirements.txt",
+    "setup.py",
+    "uv.lock",
+)
+"""Files of a project folder whose changes invalidate the probe of the `mpm` it runs.
+
+Covers the markers {meth}`MPMPlugin.search_venv` looks for, and their lockfiles.
+"""
+
+
 class MPMPlugin:
     """Implements the minimal code necessary to locate and call the `mpm` CLI on the
     system.
@@ -325,6 +357,136 @@ class MPMPlugin:
             seen.add(normalized)
             yield (normalized, "-m", "meta_package_manager")
 
+    @cached_property
+    def plugin_version(self) -> str:
+        """Version advertised in the `<xbar.version>` header of this script."""
+        match = re.search(
+            r"<xbar\.version>(?P<version>.+?)</xbar\.version>",
+            Path(__file__).read_text(encoding="utf-8"),
+        )
+        return match.group("version") if match else ""
+
+    @cached_property
+    def cache_dir(self) -> Path:
+        """Folder in which the plugin keeps its state between refreshes.
+
+        SwiftBar hands each plugin its own cache folder through the
+        `SWIFTBAR_PLUGIN_CACHE_PATH` environment variable. Xbar has no equivalent,
+        so we fall back to a folder in the user's cache directory.
+        """
+        swiftbar_cache = os.environ.get("SWIFTBAR_PLUGIN_CACHE_PATH")
+        if swiftbar_cache:
+            return Path(swiftbar_cache)
+        if sys.platform == "darwin":
+            user_cache = Path.home() / "Library" / "Caches"
+        else:
+            user_cache = Path(
+                os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            )
+        return user_cache / "mpm-bar-plugin"
+
+    @staticmethod
+    def fingerprint(mpm_cli_args: tuple[str, ...]) -> list[list[str | int | None]]:
+        """Identify the files the `mpm` of a candidate runs from.
+
+        Returns the resolved path, modification time and inode of:
+        - the executable, and the interpreter of its shebang if it is a script,
+        - the {data}`PROJECT_FILES` and `.venv` interpreter of the project folders
+          passed as arguments or environment assignments,
+        - the `site-packages` folders of each interpreter, which change whenever a
+          package is installed, upgraded or removed in there.
+
+        Missing files are recorded too, so their later appearance changes the
+        fingerprint.
+        """
+        paths: list[Path] = []
+        interpreters: list[Path] = []
+        executable = None
+        for arg in mpm_cli_args:
+            # A `VAR='folder'` environment assignment.
+            name, separator, value = arg.partition("=")
+            if separator and name.isidentifier():
+                paths.append(Path(value.strip("'")))
+            elif executable is None:
+                executable = which(arg) or arg
+                paths.append(Path(executable))
+            elif os.sep in arg:
+                paths.append(Path(arg))
+
+        for path in tuple(paths):
+            if path.is_dir():
+                # The folder itself is left out: its modification time follows
+                # any file created in the project.
+                paths.remove(path)
+                paths.extend(path / filename for filename in PROJECT_FILES)
+                interpreters.append(path / ".venv" / "bin" / "python")
+            elif path.is_file():
+                interpreters.append(path)
+                try:
+                    with path.open("rb") as script:
+                        shebang = script.readline(256)
+                except OSError:
+                    continue
+                if shebang.startswith(b"#!"):
+                    command = shebang[2:].decode(errors="replace").split()
+                    # Skip `/usr/bin/env` to the interpreter it looks up.
+                    if len(command) > 1 and Path(command[0]).name == "env":
+                        command = [which(command[1]) or command[1]]
+                    if command:
+                        interpreters.append(Path(command[0]))
+
+        for interpreter in interpreters:
+            paths.append(interpreter)
+            # The prefix of an interpreter is the parent of its `bin` folder. Do not
+            # resolve symlinks first: a virtualenv's interpreter links to its base.
+            paths.extend(interpreter.parent.parent.glob("lib/python*/site-packages"))
+
+        fingerprint: list[list[str | int | None]] = []
+        for path in dict.fromkeys(paths):
+            try:
+                stat = path.stat()
+            except OSError:
+                fingerprint.append([str(path), None, None])
+            else:
+                fingerprint.append([str(path.resolve()), stat.st_mtime_ns, stat.st_ino])
+        return fingerprint
+
+    def load_ranking_cache(self) -> dict[str, dict]:
+        """Probes persisted by a previous refresh, keyed by candidate.
+
+        Returns an empty dictionary if the state file is missing, unreadable, or
+        written by another version of the plugin.
+        """
+        try:
+            state = json.loads(
+                (self.cache_dir / RANKING_CACHE_FILENAME).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(state, dict) or state.get("plugin") != self.plugin_version:
+            return {}
+        candidates = state.get("candidates")
+        return candidates if isinstance(candidates, dict) else {}
+
+    def save_ranking_cache(self, candidates: dict[str, dict]) -> None:
+        """Persist the probes of this refresh, for the next one.
+
+        Written to a temporary file then moved in place, so a concurrent refresh
+        never reads a partial state. Failures are ignored: the cache is only an
+        optimization.
+        """
+        state_file = self.cache_dir / RANKING_CACHE_FILENAME
+        temporary_file = state_file.with_name(f"{state_file.name}.{os.getpid()}")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temporary_file.write_text(
+                json.dumps({"plugin": self.plugin_version, "candidates": candidates}),
+                encoding="utf-8",
+            )
+            os.replace(temporary_file, state_file)
+        except OSError:
+            temporary_file.unlink(missing_ok=True)
+
     def check_mpm(
         self, mpm_cli_args: tuple[str, ...]
     ) -> tuple[bool, bool, tuple[int, ...] | None, str | Exception | None]:
@@ -390,11 +552,31 @@ class MPMPlugin:
         - error
 
         On tie, the order from `search_mpm` is respected.
+
+        Probes are persisted in the {data}`RANKING_CACHE_FILENAME` state file, along
+        with the {meth}`fingerprint` of each candidate and the plugin version. Only
+        the candidates whose fingerprint changed since the last refresh are probed
+        again. Errors are kept as strings, their only rendering.
         """
-        all_mpm = (
-            (mpm_candidate, self.check_mpm(mpm_candidate))
-            for mpm_candidate in self.search_mpm()
-        )
+        cached = self.load_ranking_cache()
+        probes: dict[str, dict] = {}
+        all_mpm = []
+        for mpm_candidate in self.search_mpm():
+            key = json.dumps(mpm_candidate)
+            fingerprint = self.fingerprint(mpm_candidate)
+            entry = cached.get(key)
+            if entry and entry.get("fingerprint") == fingerprint:
+                runnable, up_to_date, version, error = entry["status"]
+                version = tuple(version) if version is not None else None
+            else:
+                runnable, up_to_date, version, error = self.check_mpm(mpm_candidate)
+                error = str(error) if error else None
+            probes[key] = {
+                "fingerprint": fingerprint,
+                "status": [runnable, up_to_date, version, error],
+            }
+            all_mpm.append((mpm_candidate, (runnable, up_to_date, version, error)))
+        self.save_ranking_cache(probes)
         return [
             (mpm_args, *mpm_status)
             for mpm_args, mpm_status in sorted(all_mpm, key=itemgetter(1), reverse=True)
@@ -471,7 +653,7 @@ class MPMPlugin:
                 return
 
         # Check if we have a recent version of mpm.
-        mpm_args, runnable, up_to_date, _version, error = self.best_mpm
+        mpm_args, runnable, up_to_date, version, error = self.best_mpm
         if not runnable or not up_to_date:
             self.print_error_header()
             if error:
@@ -497,11 +679,21 @@ class MPMPlugin:
             )
             return
 
-        # Force a sync of all local package databases.
-        run(
-            (*mpm_args, "--verbosity", "ERROR", "--timeout", str(MPM_TIMEOUT), "sync"),
-            check=False,
-        )
+        # Sync all local package databases. Recent mpm pipelines each manager's
+        # sync with its outdated listing, in the same call.
+        pipelined_sync = bool(version) and version >= MPM_PIPELINED_SYNC_VERSION
+        if not pipelined_sync:
+            run(
+                (
+                    *mpm_args,
+                    "--verbosity",
+                    "ERROR",
+                    "--timeout",
+                    str(MPM_TIMEOUT),
+                    "sync",
+                ),
+                check=False,
+            )
 
         # Fetch outdated packages from all package managers available on the system.
         # We defer all rendering to mpm itself so it can compute more intricate layouts.
@@ -516,6 +708,7 @@ class MPMPlugin:
                 "--timeout",
                 str(MPM_TIMEOUT),
                 "outdated",
+                *(("--sync",) if pipelined_sync else ()),
                 "--plugin-output",
             ),
             capture_output=True,
@@ -36,8 +36,9 @@ routable actions.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 
 from .manager import PackageManager
 
@@ -80,16 +81,8 @@ class Operations(Enum):
         return str(self)
 
 
-def implements(manager: PackageManager | type[PackageManager], op: Operations) -> bool:
-    """Inspect a manager's implementation to check for proper support of an operation.
-
-    Accepts either a manager instance or its class; support is determined from the
-    class hierarchy. The verdict is narrated as a single answered `DEBUG` line
-    (`brew implements installed.`), keyed on the manager ID rather than the raw
-    class repr.
-    """
-    cls = manager if isinstance(manager, type) else type(manager)
-
+def _method_deps(op: Operations) -> tuple[set[str], ...]:
+    """Alternative sets of methods a manager must define to implement `op`."""
     # General case: the operation and the method implementing it shares the same ID.
     method_deps: tuple[set[str], ...] = ({op.name},)
 
@@ -105,6 +98,11 @@ def implements(manager: PackageManager | type[PackageManager], op: Operations) -
     elif op == Operations.upgrade_all:
         method_deps = ({"upgrade_all_cli"}, {"outdated", "upgrade_one_cli"})
 
+    # For `orphans`: the listing is either native, or computed in-process from
+    # the dependency graph of the installed packages.
+    elif op == Operations.orphans:
+        method_deps = ({"orphans"}, {"dependency_graph"})
+
     # For `cleanup`: managers define category methods, never `cleanup()` itself
     # (the base class composes the overridden categories). Any category implies
     # support of the operation.
@@ -116,26 +114,104 @@ def implements(manager: PackageManager | type[PackageManager], op: Operations) -
     elif op == Operations.doctor:
         method_deps = ({"doctor_cli"},)
 
+    return method_deps
+
+
+def _implements(cls: type[PackageManager], op: Operations) -> bool:
+    """Walk the class hierarchy of `cls` to decide if it implements `op`."""
+    method_deps = _method_deps(op)
     # If none of the classes in the inheritance hierarchy up to the base one
     # implements the operation, then we can be certain the manager doesn't implement
     # the operation at all.
-    implemented = None
     for klass in cls.mro():
         if klass is PackageManager:
-            implemented = False
-            break
+            return False
         # Presence of the operation function is not enough to rules out proper
         # implementation, as it can be a method that raises NotImplemented error
         # anyway. See for instance the upgrade_all_cli in pip.py:
         # https://github.com/kdeldycke/meta-package-manager/blob/4acc003/meta_package_manager/managers/pip.py#L271-L279
         if any(method_ids.issubset(klass.__dict__) for method_ids in method_deps):
-            implemented = True
+            return True
+    msg = f"Can't guess {cls} implementation of {op}."
+    raise NotImplementedError(msg)
+
+
+@dataclass(frozen=True)
+class Capabilities:
+    """What a manager class can do, derived once from its definition.
+
+    The answers of {func}`implements`, {func}`implements_method` and the
+    `*_is_synthesized` helpers only depend on the class hierarchy, so
+    {func}`capability_matrix` computes them in one pass per class and serves them
+    from then on. Selecting the managers for an operation is then a membership
+    test per manager, instead of a walk of its MRO for every operation, every
+    command and every selection.
+    """
+
+    operations: frozenset[Operations]
+    """Operations the manager implements, natively or synthesized."""
+
+    methods: frozenset[str]
+    """Names defined by a non-base class of the manager's hierarchy."""
+
+    synthesized: frozenset[str]
+    """Augmentations `mpm` backfills for the manager: `upgrade_all`,
+    `cleanup_orphan`, `exact_search` and `extended_search`."""
+
+
+@lru_cache(maxsize=256)
+def _class_capabilities(cls: type[PackageManager]) -> Capabilities:
+    operations = frozenset(op for op in Operations if _implements(cls, op))
+    methods: set[str] = set()
+    for klass in cls.mro():
+        if klass is PackageManager:
             break
+        methods.update(klass.__dict__)
+    synthesized = set()
+    if Operations.upgrade_all in operations and "upgrade_all_cli" not in methods:
+        synthesized.add("upgrade_all")
+    if (
+        "cleanup_orphan" not in methods
+        and Operations.orphans in operations
+        and Operations.remove in operations
+    ):
+        synthesized.add("cleanup_orphan")
+    # Read the `exact_support`/`extended_support` introspection attribute the
+    # `search_capabilities` decorator (or the config-defined manager builder) sets
+    # on the `search` method. An undecorated `search` carries no attribute and is
+    # read as natively supporting the refinement.
+    if Operations.search in operations:
+        search = getattr(cls, "search", None)
+        for refinement in ("exact", "extended"):
+            if not getattr(search, f"{refinement}_support", True):
+                synthesized.add(f"{refinement}_search")
+    return Capabilities(operations, frozenset(methods), frozenset(synthesized))
+
+
+def capability_matrix(
+    manager: PackageManager | type[PackageManager],
+) -> Capabilities:
+    """The {class}`Capabilities` of a manager instance or class.
+
+    Computed on first request and cached per class. A config-defined manager is
+    its own synthesized class, so gets its own entry: the cache is bounded, so
+    classes synthesized by successive configuration loads do not pile up in it.
+    """
+    return _class_capabilities(
+        manager if isinstance(manager, type) else type(manager)
+    )
 
-    if implemented is None:
-        msg = f"Can't guess {cls} implementation of {op}."
-        raise NotImplementedError(msg)
 
+def implements(manager: PackageManager | type[PackageManager], op: Operations) -> bool:
+    """Inspect a manager's implementation to check for proper support of an operation.
+
+    Accepts either a manager instance or its class; support is determined from the
+    class hierarchy, as precomputed by {func}`capability_matrix`. The verdict is
+    narrated as a single answered `DEBUG` line (`brew implements installed.`),
+    keyed on the manager ID rather than the raw class repr.
+    """
+    cls = manager if isinstance(manager, type) else type(manager)
+    implemented = op in _class_capabilities(cls).operations
     verdict = "Implements" if implemented else "Does not implement"
     logging.debug(f"{verdict} {op}.", extra={"label": cls.id})
     return implemented
@@ -155,9 +231,7 @@ def upgrade_all_is_synthesized(
     Feeds the per-manager table of `docs/augmentations.md`, rendered live by
     `meta_package_manager._docs`.
     """
-    if not implements(manager, Operations.upgrade_all):
-        return False
-    return not implements_method(manager, "upgrade_all_cli")
+    return "upgrade_all" in capability_matrix(manager).synthesized
 
 
 def implements_method(
@@ -172,10 +246,10 @@ def implements_method(
     manager overrides the base's stub for one, delegating the MRO walk to
     {meth}`meta_package_manager.manager.PackageManager._defines` (shared with the
     base `cleanup` composer), so it works for config-defined managers (whose methods
-    live on the synthesized subclass) too.
+    live on the synthesized subclass) too. Answered from the precomputed
+    {attr}`Capabilities.methods`.
     """
-    cls = manager if isinstance(manager, type) else type(manager)
-    return cls._defines(method_name)
+    return method_name in capability_matrix(manager).methods
 
 
 def cleanup_orphan_is_synthesized(
@@ -188,17 +262,16 @@ def cleanup_orphan_is_synthesized(
     `remove`: the base
     {meth}`meta_package_manager.manager.PackageManager.cleanup_orphan` then
     synthesizes the sweep by listing the orphans and removing them one by one, the
-    exact pattern of the synthesized full `upgrade --all`. `False` when a native
-    sweep exists, or when the manager lacks the building blocks.
+    exact pattern of the synthesized full `upgrade --all`, or in one batch when
+    the orphans come from the manager's
+    {meth}`~meta_package_manager.manager.PackageManager.dependency_graph`.
+    `False` when a native sweep exists, or when the manager lacks the building
+    blocks.
 
     Feeds the per-manager table of `docs/augmentations.md`, rendered live by
     `meta_package_manager._docs`.
     """
-    if implements_method(manager, "cleanup_orphan"):
-        return False
-    return implements(manager, Operations.orphans) and implements(
-        manager, Operations.remove
-    )
+    return "cleanup_orphan" in capability_matrix(manager).synthesized
 
 
 def supports_cleanup_cache(
@@ -215,24 +288,6 @@ def supports_cleanup_repair(
     return implements_method(manager, "cleanup_repair")
 
 
-def _search_refinement_is_synthesized(
-    manager: PackageManager | type[PackageManager],
-    flag_name: str,
-) -> bool:
-    """Whether `mpm` backfills one of the manager's search refinements.
-
-    Reads the `exact_support`/`extended_support` introspection attribute the
-    {func}`search_capabilities` decorator (or the config-defined manager builder)
-    sets on the `search` method. An undecorated `search` carries no attribute
-    and is read as natively supporting the refinement. `False` when the manager
-    has no search operation at all.
-    """
-    if not implements(manager, Operations.search):
-        return False
-    cls = manager if isinstance(manager, type) else type(manager)
-    return not getattr(getattr(cls, "search", None), flag_name, True)
-
-
 def exact_search_is_synthesized(
     manager: PackageManager | type[PackageManager],
 ) -> bool:
@@ -243,7 +298,7 @@ def exact_search_is_synthesized(
     narrowing itself. Feeds the per-manager table of `docs/augmentations.md` and
     the per-manager operation tables, rendered live by `meta_package_manager._docs`.
     """
-    return _search_refinement_is_synthesized(manager, "exact_support")
+    return "exact_search" in capability_matrix(manager).synthesized
 
 
 def extended_search_is_synthesized(
@@ -256,7 +311,7 @@ def extended_search_is_synthesized(
     filtering itself. Feeds the per-manager table of `docs/augmentations.md` and
     the per-manager operation tables, rendered live by `meta_package_manager._docs`.
     """
-    return _search_refinement_is_synthesized(manager, "extended_support")
+    return "extended_search" in capability_matrix(manager).synthesized
 
 
 def search_capabilities(extended_support: bool = True, exact_support: bool = True):
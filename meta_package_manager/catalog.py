@@ -0,0 +1,285 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Offline catalog of the packages each manager can install.
+
+`mpm search` forwards the query to every manager's native search, which costs a
+process per manager and, for some, a round-trip to a remote registry. The
+catalog trades that for a local index: `mpm sync --catalog` ingests the full
+listing of each manager implementing
+{attr}`~meta_package_manager.manager.PackageManager.installable`, and
+`mpm search --offline` answers from it without spawning anything.
+
+The index is a SQLite database in the {func}`click.get_app_dir` folder of `mpm`,
+next to the sync state. Package IDs, names and descriptions are indexed by an
+FTS5 table with the `trigram` tokenizer, which serves the case-insensitive
+substring lookups of the fuzzy search. On a SQLite build lacking it
+({data}`fts5_support` is `False`), and for query parts shorter than a trigram,
+the lookup falls back to a table scan. Either way, candidates are refiltered
+by {class}`~meta_package_manager.package.QueryMatcher`, so offline results
+honor `--exact` and `--extended` exactly like the online ones.
+
+Refreshes are incremental per manager: a manager is only re-listed if it synced
+since its last ingestion (see {meth}`Catalog.is_stale`), and its rows are only
+rewritten if the listing changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Final
+
+import click
+
+from .package import Package, QueryMatcher
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+
+CATALOG_FILENAME: Final = "catalog.sqlite"
+"""Name of the catalog database, in the {func}`click.get_app_dir` folder of
+`mpm`."""
+
+TRIGRAM_LENGTH: Final = 3
+"""Shortest query part the `trigram` tokenizer can look up."""
+
+
+def _detect_fts5() -> bool:
+    """Whether the linked SQLite library provides FTS5 and its `trigram`
+    tokenizer (SQLite 3.34+)."""
+    try:
+        with closing(sqlite3.connect(":memory:")) as connection:
+            connection.execute(
+                "CREATE VIRTUAL TABLE probe USING fts5(text, tokenize='trigram')"
+            )
+    except sqlite3.Error:
+        return False
+    return True
+
+
+fts5_support: Final = _detect_fts5()
+"""Whether catalog lookups can go through a full-text index."""
+
+
+def catalog_path() -> Path:
+    """Location of the catalog database."""
+    return Path(click.get_app_dir("mpm")) / CATALOG_FILENAME
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS packages (
+    rowid INTEGER PRIMARY KEY,
+    manager_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    description TEXT,
+    latest_version TEXT
+);
+CREATE INDEX IF NOT EXISTS packages_by_manager ON packages (manager_id);
+CREATE INDEX IF NOT EXISTS packages_by_id ON packages (id);
+CREATE INDEX IF NOT EXISTS packages_by_name ON packages (name);
+CREATE TABLE IF NOT EXISTS refreshes (
+    manager_id TEXT PRIMARY KEY,
+    refreshed TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    count INTEGER NOT NULL
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS packages_fts USING fts5 (
+    id, name, description,
+    content='packages', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS packages_ai AFTER INSERT ON packages BEGIN
+    INSERT INTO packages_fts (rowid, id, name, description)
+    VALUES (new.rowid, new.id, new.name, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS packages_ad AFTER DELETE ON packages BEGIN
+    INSERT INTO packages_fts (packages_fts, rowid, id, name, description)
+    VALUES ('delete', old.rowid, old.id, old.name, old.description);
+END;
+"""
+
+
+def _fts_phrase(part: str) -> str:
+    """Quote `part` as an FTS5 string, so it is looked up verbatim."""
+    return '"' + part.replace('"', '""') + '"'
+
+
+class Catalog:
+    """Persistent index of the packages available to each manager.
+
+    Opens its database lazily, on first use, creating the schema if missing.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path if path is not None else catalog_path()
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            connection.executescript(_SCHEMA)
+            if fts5_support:
+                connection.executescript(_FTS_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> Catalog:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def refreshed(self, manager_id: str) -> datetime | None:
+        """When the listing of `manager_id` was last ingested, if ever."""
+        row = self.connection.execute(
+            "SELECT refreshed FROM refreshes WHERE manager_id = ?", (manager_id,)
+        ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def is_stale(self, manager_id: str, last_synced: datetime | None) -> bool:
+        """Whether `manager_id` needs re-listing: never ingested, or synced since.
+
+        A manager with no recorded sync is only listed once, as nothing tells
+        when its repositories changed.
+        """
+        refreshed = self.refreshed(manager_id)
+        if refreshed is None:
+            return True
+        return last_synced is not None and last_synced > refreshed
+
+    def managers(self) -> set[str]:
+        """IDs of the managers with an ingested listing."""
+        rows = self.connection.execute("SELECT manager_id FROM refreshes")
+        return {manager_id for (manager_id,) in rows}
+
+    def refresh(self, manager_id: str, packages: Iterable[Package]) -> bool:
+        """Replace the listing of `manager_id` by `packages`.
+
+        Returns whether the rows changed. An identical listing only bumps the
+        refresh timestamp.
+        """
+        # Sorted for a stable digest. A package listed by several repositories
+        # yields rows sharing an ID, with `None` in fields that cannot be
+        # compared to strings: `None` sorts first instead.
+        rows = sorted(
+            {
+                (
+                    package.id,
+                    package.name,
+                    package.description,
+                    str(package.latest_version) if package.latest_version else None,
+                )
+                for package in packages
+            },
+            key=lambda row: tuple((field is not None, field or "") for field in row),
+        )
+        digest = hashlib.sha256(repr(rows).encode()).hexdigest()
+        now = datetime.now(timezone.utc).isoformat()
+        connection = self.connection
+        with connection:
+            previous = connection.execute(
+                "SELECT digest FROM refreshes WHERE manager_id = ?", (manager_id,)
+            ).fetchone()
+            changed = previous is None or previous[0] != digest
+            if changed:
+                connection.execute(
+                    "DELETE FROM packages WHERE manager_id = ?", (manager_id,)
+                )
+                connection.executemany(
+                    "INSERT INTO packages "
+                    "(manager_id, id, name, description, latest_version) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    ((manager_id, *row) for row in rows),
+                )
+            connection.execute(
+                "INSERT OR REPLACE INTO refreshes VALUES (?, ?, ?, ?)",
+                (manager_id, now, digest, len(rows)),
+            )
+        logging.debug(
+            f"{len(rows)} packages in catalog"
+            + ("." if changed else ", unchanged since last refresh."),
+            extra={"label": manager_id},
+        )
+        return changed
+
+    def _candidates(
+        self, matcher: QueryMatcher, manager_ids: Sequence[str]
+    ) -> Iterator[tuple]:
+        """Rows possibly matching `matcher`, a superset of the actual matches."""
+        columns = "p.manager_id, p.id, p.name, p.description, p.latest_version"
+        in_managers = f"p.manager_id IN ({', '.join('?' * len(manager_ids))})"
+        if matcher.exact:
+            return self.connection.execute(
+                f"SELECT {columns} FROM packages AS p "
+                f"WHERE (p.id = ? OR p.name = ?) AND {in_managers} ORDER BY p.rowid",
+                (matcher.query, matcher.query, *manager_ids),
+            )
+        if fts5_support and all(len(p) >= TRIGRAM_LENGTH for p in matcher.parts):
+            fields = "{id name description}" if matcher.extended else "{id name}"
+            expression = " OR ".join(
+                f"{fields} : {_fts_phrase(part)}" for part in matcher.parts
+            )
+            return self.connection.execute(
+                f"SELECT {columns} FROM packages_fts "
+                "JOIN packages AS p ON p.rowid = packages_fts.rowid "
+                f"WHERE packages_fts MATCH ? AND {in_managers} ORDER BY p.rowid",
+                (expression, *manager_ids),
+            )
+        return self.connection.execute(
+            f"SELECT {columns} FROM packages AS p WHERE {in_managers} "
+            "ORDER BY p.rowid",
+            manager_ids,
+        )
+
+    def search(
+        self,
+        query: str,
+        extended: bool,
+        exact: bool,
+        manager_ids: Sequence[str],
+    ) -> Iterator[Package]:
+        """Packages of `manager_ids` matching `query`, with the semantics of
+        {meth}`meta_package_manager.manager.PackageManager.refiltered_search`."""
+        matcher = QueryMatcher(query, extended, exact)
+        if not matcher.parts or not manager_ids:
+            return
+        for manager_id, package_id, name, description, version in self._candidates(
+            matcher, manager_ids
+        ):
+            if matcher.matches_fields(package_id, name, description):
+                yield Package(
+                    id=package_id,
+                    manager_id=manager_id,
+                    name=name,
+                    description=description,
+                    latest_version=version,
+                )
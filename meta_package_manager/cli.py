@@ -39,6 +39,7 @@ import sys
 import threading
 from collections.abc import Iterable
 from configparser import RawConfigParser
+from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
@@ -47,6 +48,7 @@ from textwrap import dedent
 from click_extra import (
     STRING,
     Choice,
+    Duration,
     IntRange,
     Section,
     VersionOption,
@@ -74,6 +76,7 @@ from click_extra.table import SERIALIZATION_FORMATS
 from click_extra.theme import get_current_theme as theme
 
 from . import bar_plugin
+from .capabilities import Operations
 from .cooldown import (
     Cooldown,
     CooldownPolicy,
@@ -89,17 +92,21 @@ from .config import (
     print_contribution_hints,
     register_config_managers_from_context,
 )
+from .dispatch import collect_from_managers, effective_jobs
 from .execution import PLAN_RECORDER, CLIError
 from .logo import env_summary, version_screen_params
 from .manager import PackageManager
-from .package import Package
+from .package import Package, QueryMatcher
 from .pool import pool
 from .specifier import VERSION_SEP, Specifier
+from .sudo import prime_sudo
+from .sync_state import SyncState, start_background_sync
 from .tables import SortableField
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
+    from datetime import timedelta
 
     from click_extra import Context, Parameter
 
@@ -791,6 +798,9 @@ def mpm(
             dry_run=dry_run,
             plan=plan,
             timeout=timeout,
+            # Cap each manager's concurrent sub-queries like the fan-out itself,
+            # so --jobs 1 and DEBUG verbosity keep everything sequential.
+            jobs=effective_jobs(ctx, sys.maxsize),
             progress=show_progress,
             # Minimum release age gate and its enforcement policy.
             cooldown=cooldown_window,
@@ -864,16 +874,17 @@ def _filter_matches(
     """Yield only the packages matching `query` on their ID or name.
 
     A transparent pass-through when `query` is `None` (no positional query was
-    given). Shared by the `installed` and `outdated` subcommands to post-filter
-    the fully-materialized package list each manager returns: unlike `search`,
-    these operations already hold the complete inventory, so the query is a local
-    refinement rather than a manager-side lookup. Mirrors the fuzzy/`--exact`
-    semantics of `search` through
-    {meth}`meta_package_manager.package.Package.matches`.
+    given). Post-filters the fully-materialized package list each manager
+    returns: unlike `search`, these operations already hold the complete
+    inventory, so the query is a local refinement rather than a manager-side
+    lookup. Mirrors the fuzzy/`--exact` semantics of `search` through a
+    {class}`meta_package_manager.package.QueryMatcher` compiled once for the whole
+    list.
     """
-    for package in packages:
-        if query is None or package.matches(query, exact=exact):
-            yield package
+    if query is None:
+        yield from packages
+    else:
+        yield from QueryMatcher(query, exact=exact).filter(packages)
 
 
 query_option = option(
@@ -1002,6 +1013,180 @@ def _package_task(
     return task
 
 
+def _announce_level(ctx: Context) -> int:
+    """Log level for a maintenance command's per-manager announcement.
+
+    An explicit `--<id>` selection announces loudly at `INFO`; an implicit
+    "run everything" stays at `DEBUG` so the default view shows only the trail
+    (matching the explicit/implicit levels `select_managers` already uses for
+    its skip messages). Shared by `sync`, `cleanup` and `upgrade --all`.
+    """
+    return logging.INFO if ctx.obj.user_selection else logging.DEBUG
+
+
+def _maintenance_work(
+    announce: int,
+    message: str,
+    operation: Callable[[PackageManager], object],
+) -> Callable[[PackageManager], tuple[str, dict]]:
+    """Build a `work` callable for a maintenance command's fan-out.
+
+    Logs `message` at the `announce` level, tagged with the manager ID (rendered
+    into the level prefix, `info:brew:`), runs `operation(manager)`, and returns
+    ``(id, {"errors": <CLI errors raised during the run>})`` so a manager that grows
+    its error list is marked `✗` in the trail. Shared by `sync` and `cleanup`,
+    whose work differs only in the message and the manager method.
+    """
+
+    def work(manager: PackageManager) -> tuple[str, dict]:
+        logging.log(announce, message, extra={"label": manager.id})
+        before = len(manager.cli_errors)
+        operation(manager)
+        return manager.id, {"errors": manager.cli_errors[before:]}
+
+    return work
+
+
+max_sync_age_option = option(
+    "--max-sync-age",
+    type=Duration(),
+    default=None,
+    metavar="DURATION",
+    help="Only sync the managers whose last successful sync is older than this "
+    "duration ('1h', '30 minutes', 'PT6H'), or was never recorded. Managers a "
+    "background worker is still syncing are skipped too.",
+)
+
+
+def stale_managers(
+    managers: list[PackageManager],
+    max_age: timedelta | None,
+    state: SyncState,
+) -> list[PackageManager]:
+    """Narrow `managers` to those whose `sync` is due under `max_age`.
+
+    A `None` (or zero) `max_age` keeps every manager: no freshness policy. Otherwise
+    a manager is dropped, with a log line saying why, when it synced successfully
+    within `max_age` or when a background worker is syncing it right now.
+    """
+    if not max_age:
+        return managers
+    stale = []
+    for manager in managers:
+        if state.is_pending(manager.id):
+            logging.info(
+                "Sync already running in background.", extra={"label": manager.id}
+            )
+        elif state.is_fresh(manager.id, max_age):
+            logging.info(
+                f"Synced less than {max_age} ago, skipping.",
+                extra={"label": manager.id},
+            )
+        else:
+            stale.append(manager)
+    return stale
+
+
+def run_sync(
+    ctx: Context,
+    managers: list[PackageManager],
+    state: SyncState,
+    *,
+    background: bool = False,
+) -> None:
+    """Sync `managers` and record the successful ones in `state`.
+
+    The engine shared by the `sync` subcommand and `outdated --max-sync-age`. In the
+    foreground, syncs fan out concurrently with a ✓/✗ trail (see
+    {func}`meta_package_manager.dispatch.collect_from_managers`), and only the managers
+    finishing without a CLI error get a fresh timestamp. With `background`, the syncs
+    are handed to a detached worker
+    ({func}`meta_package_manager.sync_state.start_background_sync`) and the call
+    returns right away.
+
+    Primes `sudo` before a foreground fan-out, a no-op when the calling subcommand
+    already did (see {func}`meta_package_manager.sudo.prime_sudo`): `outdated`
+    reaches here without having escalated anything yet.
+    """
+    if not managers:
+        return
+    if background:
+        if any(manager.dry_run or manager.plan for manager in managers):
+            logging.warning("Background sync ignored in dry-run and plan modes.")
+        else:
+            start_background_sync([manager.id for manager in managers], state)
+            return
+
+    prime_sudo(ctx, managers)
+    announce = _announce_level(ctx)
+    results = collect_from_managers(
+        "Syncing",
+        "Synced",
+        managers,
+        _maintenance_work(announce, "Sync package info...", lambda m: m.sync()),
+        report_state=True,
+    )
+    if any(manager.dry_run or manager.plan for manager in managers):
+        return
+    state.record_synced(
+        manager_id for manager_id, data in results if not data.get("errors")
+    )
+    # Always release the markers of a background worker: this invocation is
+    # either that worker, or a foreground sync superseding it.
+    state.clear_pending(manager.id for manager in managers)
+
+
+@contextmanager
+def pipelined_sync(
+    ctx: Context,
+    managers: list[PackageManager],
+    state: SyncState,
+) -> Iterator[Callable[[PackageManager], None]]:
+    """Sync `managers` from inside the lanes of another fan-out.
+
+    The engine of `outdated --sync`. Yields a step to call at the head of each
+    manager's work: it syncs the manager if it is one of `managers`, and does
+    nothing otherwise. The work that follows then runs in the same lane, right
+    after the sync, instead of waiting for the slowest manager to finish syncing.
+    A sync failing with a {class}`~meta_package_manager.execution.CLIError` is
+    logged and does not prevent the rest of the work.
+
+    Like {func}`run_sync`, primes `sudo` up front, and records in `state` the
+    managers whose sync finished without a CLI error once the block exits.
+    """
+    if not managers:
+        yield lambda manager: None
+        return
+
+    prime_sudo(ctx, managers)
+    announce = _announce_level(ctx)
+    pending = {manager.id for manager in managers}
+    synced: list[str] = []
+
+    def sync(manager: PackageManager) -> None:
+        if manager.id not in pending:
+            return
+        logging.log(announce, "Sync package info...", extra={"label": manager.id})
+        before = len(manager.cli_errors)
+        with manager.acting_as(Operations.sync.name):
+            try:
+                manager.sync()
+            except CLIError:
+                logging.warning(
+                    "Could not sync package info.", extra={"label": manager.id}
+                )
+                return
+        if len(manager.cli_errors) == before:
+            synced.append(manager.id)
+
+    yield sync
+
+    if any(manager.dry_run or manager.plan for manager in managers):
+        return
+    state.record_synced(synced)
+    state.clear_pending(pending)
+
+
 def fail_unless_zero_exit(ctx: Context, message: str) -> None:
     """Print the durable `critical: {message}` record, then exit `1` unless
     `-0`/`--zero-exit` opted out of the gate.
@@ -44,6 +44,7 @@ The strategies sketched out were:
 
 from __future__ import annotations
 
+import json
 import logging
 from functools import partial
 from typing import Final
@@ -53,6 +54,7 @@ from boltons.cacheutils import LRI, cached
 from click_extra import (
     STRING,
     Choice,
+    FloatRange,
     Spinner,
     argument,
     columns_option,
@@ -67,22 +69,28 @@ from click_extra.theme import KO_GLYPH, OK_GLYPH, get_current_theme as theme
 from extra_platforms import reduce
 
 from .bar_plugin_renderer import BarPluginRenderer
-from .capabilities import Operations
+from .capabilities import Operations, implements, implements_method
+from .catalog import Catalog
 from .cli import (
     EXPLORE,
     _cli_errors,
     _filter_matches,
     _snapshot_installed,
+    max_sync_age_option,
     mpm,
+    pipelined_sync,
+    run_sync,
+    stale_managers,
 )
 from .config import dump_manager_overrides
 from .dispatch import collect_from_managers
 from .execution import SPINNER_DELAY, CLIError, highlight_cli_name
 from .manager import PackageManager
-from .package import Package, packages_asdict
+from .package import Package, QueryMatcher, packages_asdict
 from .platforms import MAIN_PLATFORMS
 from .pool import pool
 from .summary import package_counts, print_summary
+from .sync_state import SyncState
 from .tables import (
     INSTALLED_COLUMNS,
     MANAGERS_COLUMNS,
@@ -96,6 +104,13 @@ from .tables import (
     print_serialized_and_exit,
 )
 from .version import diff_versions
+from .watch import (
+    WATCH_DEBOUNCE,
+    coalesce,
+    diff_packages,
+    make_watcher,
+    resolve_watch_paths,
+)
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -287,15 +302,22 @@ def _safe_packages(
     source: Callable[[], Iterable[Package]],
     fields: tuple[str, ...],
     action: str,
+    query: str | None = None,
+    exact: bool = False,
 ) -> tuple[dict, ...]:
     """Materialize `source()` into package dicts, tolerating a CLI failure.
 
+    Packages are filtered by `query` (see
+    {func}`meta_package_manager.cli._filter_matches`) and projected to `fields`.
+
     On {class}`meta_package_manager.execution.CLIError` (the manager's query
     subprocess failed), log a one-line ``"Could not {action} from {manager}"``
     warning and return no packages, so one broken manager never aborts the batch.
     """
     try:
-        return tuple(packages_asdict(source(), fields))
+        return tuple(
+            packages_asdict(_filter_matches(source(), query, exact=exact), fields)
+        )
     except CLIError:
         logging.warning(f"Could not {action}.", extra={"label": manager.id})
         return ()
@@ -307,6 +329,8 @@ def _collect_manager_data(
     running: str,
     done: str,
     fetch: Callable[[PackageManager], tuple[str, dict]],
+    *,
+    lock_lanes: bool = False,
 ) -> dict[str, dict]:
     """Select the managers implementing `operation` and fan `fetch` out.
 
@@ -314,12 +338,15 @@ def _collect_manager_data(
     `orphans`, `search`): resolve the selection, run `fetch` concurrently
     through {func}`meta_package_manager.dispatch.collect_from_managers` under
     the `running`/`done` spinner labels, and gather the per-manager payloads
-    keyed by manager ID, in selection order.
+    keyed by manager ID, in selection order. `lock_lanes` is forwarded, for a
+    `fetch` mutating the manager's state first.
     """
     managers = list(ctx.obj.selected_managers(implements_operation=operation))
     return {
         manager_id: data
-        for manager_id, data in collect_from_managers(running, done, managers, fetch)
+        for manager_id, data in collect_from_managers(
+            running, done, managers, fetch, lock_lanes=lock_lanes
+        )
     }
 
 
@@ -359,7 +386,7 @@ def _query_highlighter(query: str | None) -> Callable[[str], str]:
     """
     if not query:
         return lambda value: value
-    patterns = {query}.union(Package.query_parts(query))
+    patterns = QueryMatcher.compile(query).highlight_patterns
     highlighter: Callable[[str], str] = cached(LRI(max_size=1000))(
         partial(
             highlight,
@@ -473,16 +500,64 @@ def installed(ctx, exact, duplicates, query):
     "The layout is dynamic and depends on environment variables set by either Xbar "
     "or SwiftBar.",
 )
+@max_sync_age_option
+@option(
+    "--background-sync",
+    is_flag=True,
+    default=False,
+    help="With --max-sync-age, sync the stale managers in a detached worker "
+    "instead of before the listing. This run reports from the current metadata; "
+    "the next one picks up the refreshed indexes.",
+)
+@option(
+    "--sync",
+    is_flag=True,
+    default=False,
+    help="Sync each manager right before listing its outdated packages, in the "
+    "same pass: a fast manager reports while slower ones are still syncing. With "
+    "--max-sync-age, only sync the stale managers.",
+)
 @columns_option(columns=column_specs(OUTDATED_COLUMNS))
 @argument("query", type=STRING, required=False)
 @pass_context
-def outdated(ctx, exact, plugin_output, query):
+def outdated(ctx, exact, plugin_output, max_sync_age, background_sync, sync, query):
     """List available package upgrades and their versions for each manager.
 
     With an optional `QUERY`, restrict the listing to outdated packages whose ID
     or name matches it. The match is fuzzy by default (case-insensitive, tokenized);
     `--exact` requires a verbatim match on the package ID or name.
+
+    With `--max-sync-age`, first sync the managers whose last successful sync
+    is older than that, so the listing compares against recent indexes without
+    paying for a full `mpm sync` on every run.
+
+    With `--sync`, each manager syncs then lists its outdated packages in a row,
+    instead of all managers syncing before any listing starts.
     """
+    if sync and background_sync:
+        logging.critical("--sync and --background-sync are mutually exclusive.")
+        ctx.exit(2)
+
+    state = SyncState()
+    to_sync: list[PackageManager] = []
+    if sync or max_sync_age:
+        to_sync = stale_managers(
+            [
+                manager
+                for manager in ctx.obj.selected_managers(
+                    implements_operation=Operations.sync
+                )
+                if implements(manager, Operations.outdated)
+            ],
+            max_sync_age,
+            state,
+        )
+    if max_sync_age and not sync:
+        run_sync(ctx, to_sync, state, background=background_sync)
+        to_sync = []
+    elif background_sync:
+        logging.warning("--background-sync has no effect without --max-sync-age.")
+
     # Build-up a global list of outdated packages per manager.
     fields = (
         "id",
@@ -491,18 +566,29 @@ def outdated(ctx, exact, plugin_output, query):
         "latest_version",
     )
 
-    def fetch(manager: PackageManager) -> tuple[str, dict]:
-        packages = _safe_packages(
-            manager,
-            lambda: _filter_matches(manager.refiltered_outdated, query, exact=exact),
-            fields,
-            "list outdated packages",
+    # A manager syncing then listing in one lane takes its lock family's lock.
+    with pipelined_sync(ctx, to_sync, state) as sync_step:
+
+        def fetch(manager: PackageManager) -> tuple[str, dict]:
+            sync_step(manager)
+            packages = _safe_packages(
+                manager,
+                lambda: manager.refiltered_outdated,
+                fields,
+                "list outdated packages",
+                query,
+                exact,
+            )
+            return _manager_result(manager, packages)
+
+        outdated_data = _collect_manager_data(
+            ctx,
+            Operations.outdated,
+            "Checking",
+            "Checked",
+            fetch,
+            lock_lanes=bool(to_sync),
         )
-        return _manager_result(manager, packages)
-
-    outdated_data = _collect_manager_data(
-        ctx, Operations.outdated, "Checking", "Checked", fetch
-    )
 
     # Machine-friendly data rendering.
     print_serialized_and_exit(ctx, outdated_data)
@@ -562,9 +648,11 @@ def orphans(ctx, exact, query):
     def fetch(manager: PackageManager) -> tuple[str, dict]:
         packages = _safe_packages(
             manager,
-            lambda: _filter_matches(manager.orphans, query, exact=exact),
+            lambda: manager.orphans,
             fields,
             "list orphaned packages",
+            query,
+            exact,
         )
         return _manager_result(manager, packages)
 
@@ -601,11 +689,22 @@ def orphans(ctx, exact, query):
     default=True,
     help="Let mpm refilters managers' search results.",
 )
+@option(
+    "--offline",
+    is_flag=True,
+    default=False,
+    help="Answer from the local catalog built by 'sync --catalog' instead of "
+    "querying each manager. Always refilters.",
+)
 @columns_option(columns=column_specs(SEARCH_COLUMNS))
 @argument("query", type=STRING, required=True)
 @pass_context
-def search(ctx, extended, exact, refilter, query):
-    """Search each manager for a package ID, name or description matching the query."""
+def search(ctx, extended, exact, refilter, offline, query):
+    """Search each manager for a package ID, name or description matching the query.
+
+    With `--offline`, no manager is invoked: the query runs against the catalog of
+    available packages, for the managers having one.
+    """
     # --extended implies --description.
     show_description = ctx.obj.description
     if extended and not ctx.obj.description:
@@ -620,20 +719,23 @@ def search(ctx, extended, exact, refilter, query):
         "description",
     )
 
-    search_method = "refiltered_search" if refilter else "search"
+    if offline:
+        matches = _catalog_search(ctx, query, extended, exact, fields)
+    else:
+        search_method = "refiltered_search" if refilter else "search"
+
+        def fetch(manager: PackageManager) -> tuple[str, dict]:
+            packages = _safe_packages(
+                manager,
+                lambda: getattr(manager, search_method)(query, extended, exact),
+                fields,
+                "search packages",
+            )
+            return _manager_result(manager, packages)
 
-    def fetch(manager: PackageManager) -> tuple[str, dict]:
-        packages = _safe_packages(
-            manager,
-            lambda: getattr(manager, search_method)(query, extended, exact),
-            fields,
-            "search packages",
+        matches = _collect_manager_data(
+            ctx, Operations.search, "Searching", "Searched", fetch
         )
-        return _manager_result(manager, packages)
-
-    matches = _collect_manager_data(
-        ctx, Operations.search, "Searching", "Searched", fetch
-    )
 
     # Machine-friendly data rendering.
     print_serialized_and_exit(ctx, matches)
@@ -668,6 +770,150 @@ def search(ctx, extended, exact, refilter, query):
         print_summary(package_counts(matches))
 
 
+def _catalog_search(
+    ctx: Context,
+    query: str,
+    extended: bool,
+    exact: bool,
+    fields: tuple[str, ...],
+) -> dict[str, dict]:
+    """Run `query` against the offline catalog, for the selected managers.
+
+    Returns the same per-manager payloads as an online search (see
+    {func}`_manager_result`), so both render identically. Selected managers
+    missing from the catalog are dropped with a warning.
+    """
+    managers = {manager.id: manager for manager in ctx.obj.selected_managers()}
+    with Catalog() as catalog:
+        cataloged = catalog.managers()
+        for manager_id in managers.keys() - cataloged:
+            if implements_method(managers[manager_id], "installable"):
+                logging.warning(
+                    "Not in catalog yet: run 'mpm sync --catalog' first.",
+                    extra={"label": manager_id},
+                )
+        manager_ids = [manager_id for manager_id in managers if manager_id in cataloged]
+        per_manager: dict[str, list[Package]] = {id_: [] for id_ in manager_ids}
+        for package in catalog.search(query, extended, exact, manager_ids):
+            per_manager[package.manager_id].append(package)
+    return dict(
+        _manager_result(
+            managers[manager_id],
+            tuple(packages_asdict(packages, fields)),
+        )
+        for manager_id, packages in per_manager.items()
+    )
+
+
+@mpm.command(
+    short_help="Stream changes to installed and outdated packages.", section=EXPLORE
+)
+@option(
+    "--debounce",
+    type=FloatRange(min=0),
+    default=WATCH_DEBOUNCE,
+    show_default=True,
+    help="Seconds without changes to wait for before re-querying a manager, so a "
+    "transaction touching its files many times is reported once.",
+)
+@option(
+    "--outdated/--installed-only",
+    "check_outdated",
+    default=True,
+    help="Also report changes to outdated packages of the re-queried managers.",
+)
+@pass_context
+def watch(ctx, debounce, check_outdated):
+    """Watch the files in which managers record their packages, and print the
+    changes to their installed and outdated packages as they happen.
+
+    Each event is a JSON object on its own line. The first one, `watching`, maps
+    each manager to the paths watched for it. Then, whenever one of these paths
+    changes, the manager is queried again, and every difference with its previous
+    snapshot is printed as an `installed` or `outdated` event listing the `added`,
+    `removed` and `changed` packages.
+
+    Only managers declaring watch paths can be watched. Runs until interrupted.
+    """
+    targets = {}
+    managers = []
+    for manager in ctx.obj.selected_managers(implements_operation=Operations.installed):
+        paths = resolve_watch_paths(manager)
+        if paths:
+            targets[manager.id] = paths
+            managers.append(manager)
+        else:
+            logging.info("No path to watch.", extra={"label": manager.id})
+    if not managers:
+        logging.critical("No manager to watch.")
+        ctx.exit(2)
+
+    def snapshot(manager: PackageManager) -> tuple[str, dict]:
+        # The errors of this snapshot only: the previous ones were reported.
+        manager.cli_errors.clear()
+        inventories = {
+            "installed": {
+                package["id"]: package["installed_version"]
+                for package in _safe_packages(
+                    manager,
+                    lambda: manager.installed,
+                    ("id", "installed_version"),
+                    "list installed packages",
+                )
+            },
+        }
+        if check_outdated and implements(manager, Operations.outdated):
+            inventories["outdated"] = {
+                package["id"]: package["latest_version"]
+                for package in _safe_packages(
+                    manager,
+                    lambda: manager.refiltered_outdated,
+                    ("id", "latest_version"),
+                    "list outdated packages",
+                )
+            }
+        return manager.id, {
+            "inventories": inventories,
+            "errors": _cli_errors(manager),
+        }
+
+    def emit(event: dict) -> None:
+        echo(json.dumps(event))
+
+    snapshots = {
+        manager_id: data["inventories"]
+        for manager_id, data in collect_from_managers(
+            "Reading", "Read", managers, snapshot
+        )
+    }
+    emit({
+        "event": "watching",
+        "managers": {
+            manager_id: [str(path) for path in paths]
+            for manager_id, paths in targets.items()
+        },
+    })
+
+    try:
+        with make_watcher(targets) as watcher:
+            for changed in coalesce(watcher, debounce):
+                requeried = [m for m in managers if m.id in changed]
+                for manager_id, data in collect_from_managers(
+                    "Checking", "Checked", requeried, snapshot
+                ):
+                    # A failed query lists nothing: diffing it would report every
+                    # package as removed.
+                    if data["errors"]:
+                        continue
+                    for kind, packages in data["inventories"].items():
+                        diff = diff_packages(snapshots[manager_id][kind], packages)
+                        if any(diff.values()):
+                            emit({"event": kind, "manager_id": manager_id, **diff})
+                    snapshots[manager_id] = data["inventories"]
+    except KeyboardInterrupt:
+        logging.debug("Watch interrupted.")
+
+
 @mpm.command(aliases=["locate"], short_help="Locate CLIs on system.", section=EXPLORE)
 @columns_option(columns=column_specs(WHICH_COLUMNS))
 @argument("cli_names", type=STRING, nargs=-1, required=True)
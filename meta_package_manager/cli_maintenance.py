@@ -43,15 +43,21 @@ from .capabilities import (
     supports_cleanup_cache,
     supports_cleanup_repair,
 )
+from .catalog import Catalog
 from .cli import (
     MAINTENANCE,
+    _announce_level,
     _install_action,
+    _maintenance_work,
     _package_task,
     _run_manager_action,
     exit_on_failures,
     fail_unless_zero_exit,
+    max_sync_age_option,
     mpm,
     package_label,
+    run_sync,
+    stale_managers,
 )
 from .cooldown import CooldownPolicy
 from .dispatch import (
@@ -65,6 +71,7 @@ from .manager import PackageManager
 from .pool import pool
 from .specifier import Solver, Specifier
 from .sudo import prime_sudo
+from .sync_state import SyncState
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -106,40 +113,6 @@ def cooldown_permits(manager: PackageManager) -> bool:
     return False
 
 
-def _announce_level(ctx: Context) -> int:
-    """Log level for a maintenance command's per-manager announcement.
-
-    An explicit `--<id>` selection announces loudly at `INFO`; an implicit
-    "run everything" stays at `DEBUG` so the default view shows only the trail
-    (matching the explicit/implicit levels `select_managers` already uses for
-    its skip messages). Shared by `sync`, `cleanup` and `upgrade --all`.
-    """
-    return logging.INFO if ctx.obj.user_selection else logging.DEBUG
-
-
-def _maintenance_work(
-    announce: int,
-    message: str,
-    operation: Callable[[PackageManager], object],
-) -> Callable[[PackageManager], tuple[str, dict]]:
-    """Build a `work` callable for a maintenance command's fan-out.
-
-    Logs `message` at the `announce` level, tagged with the manager ID (rendered
-    into the level prefix, `info:brew:`), runs `operation(manager)`, and returns
-    ``(id, {"errors": <CLI errors raised during the run>})`` so a manager that grows
-    its error list is marked `✗` in the trail. Shared by `sync` and `cleanup`,
-    whose work differs only in the message and the manager method.
-    """
-
-    def work(manager: PackageManager) -> tuple[str, dict]:
-        logging.log(announce, message, extra={"label": manager.id})
-        before = len(manager.cli_errors)
-        operation(manager)
-        return manager.id, {"errors": manager.cli_errors[before:]}
-
-    return work
-
-
 def _dispatch_sourced_operation(
     ctx: Context,
     packages_specs: tuple[str, ...],
@@ -634,22 +607,85 @@ def remove(ctx, orphans, packages_specs):
 
 
 @mpm.command(short_help="Sync local package info.", section=MAINTENANCE)
+@max_sync_age_option
+@option(
+    "--background",
+    is_flag=True,
+    default=False,
+    help="Run the syncs in a detached worker and return immediately. Its results "
+    "are recorded for the next invocation to pick up through --max-sync-age.",
+)
+@option(
+    "--catalog",
+    is_flag=True,
+    default=False,
+    help="Also ingest the packages available to each manager into the local catalog "
+    "queried by 'search --offline'. Only managers synced since their last ingestion "
+    "are listed again.",
+)
 @pass_context
-def sync(ctx):
-    """Sync local package metadata and info from external sources."""
-    managers = list(ctx.obj.selected_managers(implements_operation=Operations.sync))
-    prime_sudo(ctx, managers)
-    announce = _announce_level(ctx)
+def sync(ctx, max_sync_age, background, catalog):
+    """Sync local package metadata and info from external sources.
 
-    # Sync is independent per manager, so fan out concurrently with a ✓/✗ trail and
-    # a success-count finisher (see collect_from_managers).
-    collect_from_managers(
-        "Syncing",
-        "Synced",
-        managers,
-        _maintenance_work(announce, "Sync package info...", lambda m: m.sync()),
-        report_state=True,
+    Each manager's last successful sync is recorded, so `--max-sync-age` can
+    skip the ones synced recently enough.
+    """
+    state = SyncState()
+    managers = stale_managers(
+        list(ctx.obj.selected_managers(implements_operation=Operations.sync)),
+        max_sync_age,
+        state,
     )
+    if not background:
+        prime_sudo(ctx, managers)
+    run_sync(ctx, managers, state, background=background)
+    if catalog:
+        refresh_catalog(ctx, state)
+
+
+def refresh_catalog(ctx: Context, state: SyncState) -> None:
+    """Ingest the {attr}`~meta_package_manager.manager.PackageManager.installable`
+    listing of the selected managers into the offline catalog.
+
+    Managers whose catalog is still current (see
+    {meth}`meta_package_manager.catalog.Catalog.is_stale`) are skipped. The
+    listings are fetched concurrently, then written one manager at a time, as
+    SQLite serializes writers anyway.
+    """
+    with Catalog() as catalog:
+        managers = []
+        for manager in ctx.obj.selected_managers():
+            if not implements_method(manager, "installable"):
+                continue
+            if catalog.is_stale(manager.id, state.last_synced(manager.id)):
+                managers.append(manager)
+            else:
+                logging.info(
+                    "Catalog up to date, skipping.", extra={"label": manager.id}
+                )
+
+        def fetch(manager: PackageManager) -> tuple[str, dict]:
+            logging.info("List available packages...", extra={"label": manager.id})
+            before = len(manager.cli_errors)
+            try:
+                packages = list(manager.installable)
+            except CLIError:
+                packages = None
+            return manager.id, {
+                "packages": packages,
+                "errors": manager.cli_errors[before:],
+            }
+
+        for manager_id, data in collect_from_managers(
+            "Cataloging", "Cataloged", managers, fetch, report_state=True
+        ):
+            # Never replace a listing by the partial output of a failed call.
+            if data["packages"] is None or data["errors"]:
+                logging.warning(
+                    "Could not list available packages.", extra={"label": manager_id}
+                )
+                continue
+            catalog.refresh(manager_id, data["packages"])
 
 
 CLEANUP_CATEGORIES = ("orphans", "cache", "repair")
@@ -58,7 +58,7 @@ from click_extra import (
     prep_path,
 )
 
-from .capabilities import Operations
+from .capabilities import Operations, implements_method
 from .cli import (
     SBOM_SECTION,
     _cli_errors,
@@ -69,7 +69,7 @@ from .cli import (
     query_exact_option,
     query_option,
 )
-from .dispatch import collect_from_managers
+from .dispatch import collect_from_managers, effective_jobs
 from .sbom.base import SBOM, ExportFormat
 from .summary import print_summary, sbom_summary
 
@@ -128,7 +128,12 @@ def sbom(ctx, spdx, export_format, overwrite, bundled, query, exact, export_path
     # importing them at module level would tax every other subcommand. See the
     # module docstring for the measurement and the rule it deliberately breaks.
     from .sbom.cyclonedx import CycloneDX, cyclonedx_support
-    from .sbom.spdx import SPDX, spdx_support
+    from .sbom.spdx import (
+        SPDX,
+        preload_upstream_sboms,
+        spdx_support,
+        upstream_cache_dir,
+    )
 
     standard = "SPDX" if spdx else "CycloneDX"
 
@@ -193,10 +198,22 @@ def sbom(ctx, spdx, export_format, overwrite, bundled, query, exact, export_path
         ctx.obj.selected_managers(implements_operation=Operations.installed)
     )
     by_id = {manager.id: manager for manager in managers}
+    # Only the SPDX writer splices upstream per-package documents into its own;
+    # CycloneDX merely references them by path, so has nothing to preload.
+    preload_upstream = spdx and bundled
+    upstream_cache = upstream_cache_dir() if preload_upstream else None
 
     def fetch(manager: PackageManager) -> tuple[str, dict]:
         logging.info("Export packages...", extra={"label": manager.id})
-        installed_packages = _snapshot_installed(manager, query, exact=exact)
+        if bundled and implements_method(manager, "bulk_metadata"):
+            # The bulk metadata query does not depend on the listing: build the
+            # manager's metadata index while its inventory is being read.
+            installed_packages, _ = manager.gather(
+                lambda: _snapshot_installed(manager, query, exact=exact),
+                lambda: manager.metadata_index,
+            )
+        else:
+            installed_packages = _snapshot_installed(manager, query, exact=exact)
         # In --bundled mode, enrich each package with its metadata here too, so the
         # slow per-manager metadata fetch parallelizes alongside the listing.
         enriched = None
@@ -208,9 +225,25 @@ def sbom(ctx, spdx, export_format, overwrite, bundled, query, exact, export_path
                     f"Falling back to minimal SBOM data: {exc}",
                     extra={"label": manager.id},
                 )
+        # Read and parse the upstream SBOM files the metadata points at while
+        # still in this manager's lane, rather than one by one at merge time.
+        upstream: dict = {}
+        if preload_upstream and enriched:
+            sbom_paths = [
+                metadata.external_sbom_path
+                for _package, metadata in enriched
+                if metadata.external_sbom_path is not None
+            ]
+            if sbom_paths:
+                upstream = preload_upstream_sboms(
+                    sbom_paths,
+                    jobs=effective_jobs(ctx, len(sbom_paths)),
+                    cache_dir=upstream_cache,
+                )
         return manager.id, {
             "packages": installed_packages,
             "enriched": enriched,
+            "upstream": upstream,
             "errors": _cli_errors(manager),
         }
 
@@ -223,6 +256,8 @@ def sbom(ctx, spdx, export_format, overwrite, bundled, query, exact, export_path
         if not installed_packages:
             continue
         manager = by_id[manager_id]
+        if data["upstream"] and isinstance(sbom, SPDX):
+            sbom.upstream_sboms.update(data["upstream"])
         if data["enriched"] is not None:
             for package, metadata in data["enriched"]:
                 sbom.add_package(manager, package, metadata)
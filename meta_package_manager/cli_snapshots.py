@@ -15,9 +15,10 @@
 # Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
 """The package snapshots subcommands: manifest export and replay.
 
-`dump` (TOML manifest or Brewfile) and `restore` (install back the
+`dump` (TOML manifest or Brewfile), `restore` (install back the
 packages a TOML manifest references, through the shared per-package action
-engine).
+engine), `diff` (compare a manifest to another or to the live system) and
+`aggregate` (summarize the snapshots of a whole fleet).
 
 The `mpm` group itself, and the plumbing shared with the other subcommand
 modules, live in {mod}`meta_package_manager.cli`.
@@ -33,30 +34,36 @@ from datetime import datetime, timezone
 from io import TextIOWrapper
 from pathlib import Path
 
+import click
 import tomli_w
 from click_extra import (
     File,
     argument,
+    columns_option,
     echo,
     file_path,
     is_stdout,
     option,
     pass_context,
+    path,
     prep_path,
 )
 from click_extra.theme import get_current_theme as theme
 from extra_platforms import current_platform
 
 from . import __version__
+from .aggregate import aggregate_files
 from .brewfile import build_brewfile
 from .capabilities import Operations
 from .cli import (
     SNAPSHOTS,
+    _announce_level,
     _cli_errors,
     _install_action,
     _package_task,
     _snapshot_installed,
     exit_on_failures,
+    fail_unless_zero_exit,
     guard_existing_output,
     mpm,
     overwrite_option,
@@ -64,12 +71,21 @@ from .cli import (
     query_exact_option,
     query_option,
 )
-from .dispatch import collect_from_managers, collect_per_package
+from .config import INVALIDATED_CACHED_PROPS
+from .dispatch import collect_from_managers, collect_per_package, effective_jobs
 from .package import packages_asdict
 from .pool import pool
 from .specifier import VERSION_SEP, Specifier
 from .sudo import prime_sudo
 from .summary import print_summary
+from .tables import (
+    AGGREGATE_COLUMNS,
+    DIFF_COLUMNS,
+    column_specs,
+    print_projected_table,
+    print_serialized_and_exit,
+)
+from .version import parse_version
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -78,9 +94,11 @@ else:
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
+    from typing import Any
 
     from .manager import PackageManager
+    from .version import TokenizedString
 
 
 @mpm.command(
@@ -398,37 +416,18 @@ def _dump_brewfile(
 @pass_context
 def restore(ctx, toml_files):
     """Read TOML files then install or upgrade each package referenced in them."""
-    # The sections are independent (each ties its packages to one manager), so restore
-    # fans out across managers (see collect_per_package). The one ordering need is a
-    # not-yet-built feature: install cask's mas binary before the [mas] section runs
-    # (use-case: dotfiles). When it lands it must become parallel-within-dependency-
-    # levels rather than this flat fan-out.
-
-    # Cast generator to tuple because of reuse across TOML files and the trail.
+    # Keep the managers whose CLI is missing: one may be installed by the section of
+    # another (cask's mas binary before the [mas] section, the dotfiles use-case).
     selected_managers = tuple(
-        ctx.obj.selected_managers(implements_operation=Operations.install),
+        ctx.obj.selected_managers(
+            implements_operation=Operations.install, drop_not_found=False
+        ),
     )
-    prime_sudo(ctx, selected_managers)
-
-    # Collect every package a manager failed to install, to raise a non-zero exit code
-    # at the end (matching install, remove and upgrade).
-    restore_failures: list[str] = []
-    failures_lock = threading.Lock()
 
-    # Gather one task per referenced (package, manager) across all the input files.
-    tasks: list[tuple[PackageManager, Callable[[], tuple[bool, str]]]] = []
+    # Gather the specs of each selected manager across all the input files.
+    specs: dict[str, list[Specifier]] = {}
     for toml_input in toml_files:
-        is_stdin = isinstance(toml_input, TextIOWrapper)
-        if is_stdin:
-            toml_input.reconfigure(encoding="utf-8")
-            toml_filepath = toml_input.name
-            toml_content = toml_input.read()
-        else:
-            toml_filepath = Path(toml_input.name).resolve()
-            toml_content = toml_filepath.read_text(encoding="utf-8")
-
-        logging.info(f"Load package list from {toml_filepath}")
-        doc = tomllib.loads(toml_content)
+        doc = _read_manifest(toml_input)
 
         # List unrecognized sections.
         ignored_sections = [
@@ -445,14 +444,91 @@ def restore(ctx, toml_files):
                     f"No [{theme().invoked_command(manager.id)}] section found.",
                 )
                 continue
-            logging.info("Restore packages...", extra={"label": manager.id})
-            for package_id, version in doc[manager.id].items():
-                spec = Specifier(
+            specs.setdefault(manager.id, []).extend(
+                Specifier(
                     raw_spec=f"pkg:{manager.id}/{package_id}{VERSION_SEP}{version}",
                     package_id=package_id,
                     manager_id=manager.id,
                     version=str(version),
                 )
+                for package_id, version in doc[manager.id].items()
+            )
+
+    # Plan the available managers, plus the missing ones another section bootstraps.
+    dependencies: dict[str, set[str]] = {}
+    for manager in selected_managers:
+        if manager.available:
+            if manager.id in specs:
+                dependencies[manager.id] = set()
+            continue
+        provider_id = _bootstrap_provider(manager, specs)
+        if provider_id is None or manager.id not in specs:
+            logging.log(
+                _announce_level(ctx),
+                f"Skipped: {manager.unavailable_reason or 'unavailable'}.",
+                extra={"label": manager.id},
+            )
+            continue
+        logging.info(
+            f"Restore after {theme().invoked_command(provider_id)} installs its CLI.",
+            extra={"label": manager.id},
+        )
+        dependencies[manager.id] = {provider_id}
+    planned = [m for m in selected_managers if m.id in dependencies]
+    if not planned and not any(m.available for m in selected_managers):
+        logging.critical("No manager selected.")
+        ctx.exit(2)
+    prime_sudo(ctx, planned)
+
+    for manager in planned:
+        logging.info("Restore packages...", extra={"label": manager.id})
+
+    # Diff the manifest against one concurrent snapshot of the installed packages.
+    def fetch(manager: PackageManager) -> tuple[str, dict]:
+        with manager.acting_as(Operations.installed.name):
+            installed = {
+                package.id: package.installed_version
+                for package in manager.installed_or_empty()
+            }
+        return manager.id, {"installed": installed, "errors": _cli_errors(manager)}
+
+    inventoried = [m for m in planned if m.available and specs[m.id]]
+    installed = {
+        manager_id: data["installed"]
+        for manager_id, data in collect_from_managers(
+            "Reading", "Read", inventoried, fetch
+        )
+    }
+
+    # Collect every package a manager failed to install, to raise a non-zero exit code
+    # at the end (matching install, remove and upgrade).
+    restore_failures: list[str] = []
+    failures_lock = threading.Lock()
+
+    # Sections of a level only depend on the levels before it, so each level fans
+    # out across managers (see collect_per_package) once the previous one is done.
+    managers_by_id = {manager.id: manager for manager in planned}
+    for level in _restore_levels(dependencies):
+        tasks: list[tuple[PackageManager, Callable[[], tuple[bool, str]]]] = []
+        for manager_id in level:
+            manager = managers_by_id[manager_id]
+            if dependencies[manager_id]:
+                # Probe the manager again, now that its CLI may have been installed.
+                for prop in INVALIDATED_CACHED_PROPS:
+                    manager.__dict__.pop(prop, None)
+                if not manager.available:
+                    logging.warning(
+                        f"Skipped: {manager.unavailable_reason or 'unavailable'}.",
+                        extra={"label": manager_id},
+                    )
+                    continue
+            for spec in specs[manager_id]:
+                if _already_installed(spec, installed.get(manager_id, {})):
+                    logging.info(
+                        f"{package_label(spec)} already installed.",
+                        extra={"label": manager_id},
+                    )
+                    continue
                 tasks.append((
                     manager,
                     _package_task(
@@ -469,8 +545,294 @@ def restore(ctx, toml_files):
                         ),
                     ),
                 ))
-
-    collect_per_package("Restoring", "Restored", tasks)
+        if tasks:
+            collect_per_package("Restoring", "Restored", tasks)
 
     # Fail with a non-zero exit code if any referenced package could not be installed.
     exit_on_failures(ctx, "restore", restore_failures)
+
+
+def _read_manifest(toml_input) -> dict[str, Any]:
+    """Parse the TOML manifest opened as `toml_input`, which may be `stdin`."""
+    if isinstance(toml_input, TextIOWrapper):
+        toml_input.reconfigure(encoding="utf-8")
+        toml_filepath = toml_input.name
+        toml_content = toml_input.read()
+    else:
+        toml_filepath = Path(toml_input.name).resolve()
+        toml_content = toml_filepath.read_text(encoding="utf-8")
+    logging.info(f"Load package list from {toml_filepath}")
+    return tomllib.loads(toml_content)
+
+
+def _bootstrap_provider(
+    manager: PackageManager,
+    specs: dict[str, list[Specifier]],
+) -> str | None:
+    """ID of the manager whose restored section installs the missing CLI of
+    `manager`, or `None` if no section does.
+
+    Reads {attr}`~meta_package_manager.manager.PackageManager.bootstrapped_by`.
+    """
+    if manager.bootstrapped_by is None or not manager.supported:
+        return None
+    provider_id, package_id = manager.bootstrapped_by
+    if any(spec.package_id == package_id for spec in specs.get(provider_id, ())):
+        return provider_id
+    return None
+
+
+def _restore_levels(dependencies: dict[str, set[str]]) -> list[list[str]]:
+    """Sort the manager IDs of `dependencies` into levels.
+
+    Each level only depends on the levels before it, so its managers can be
+    restored concurrently. IDs keep their order within a level. Dependencies on
+    IDs absent from `dependencies` are ignored, and the members of a cycle are
+    all pushed to a last level.
+    """
+    levels: list[list[str]] = []
+    placed: set[str] = set()
+    pending = list(dependencies)
+    while pending:
+        level = [
+            manager_id
+            for manager_id in pending
+            if all(
+                dep in placed or dep not in dependencies
+                for dep in dependencies[manager_id]
+            )
+        ] or pending
+        levels.append(level)
+        placed.update(level)
+        pending = [manager_id for manager_id in pending if manager_id not in placed]
+    return levels
+
+
+def _already_installed(
+    spec: Specifier,
+    installed: dict[str, TokenizedString | str | None],
+) -> bool:
+    """Whether the package of `spec` is in `installed`, at its requested version
+    if it has one."""
+    if spec.package_id not in installed:
+        return False
+    return not spec.version or str(installed[spec.package_id]) == spec.version
+
+
+def diff_inventories(
+    old: Mapping[str, Mapping[str, Any]],
+    new: Mapping[str, Mapping[str, Any]],
+) -> list[dict[str, str | None]]:
+    """Compare two `{manager_id: {package_id: version}}` inventories.
+
+    Both sides are indexed by `(manager_id, package_id)`, then each package is
+    classified as `added`, `removed`, `upgraded` or `downgraded`, versions being
+    ordered by {func}`~meta_package_manager.version.parse_version`. Packages
+    whose versions are equal, or unknown on either side, are not reported.
+
+    Changes are sorted by manager, then package ID.
+    """
+
+    def index(inventory):
+        return {
+            (manager_id, package_id): str(version) if version else None
+            for manager_id, packages in inventory.items()
+            if isinstance(packages, dict)
+            for package_id, version in packages.items()
+        }
+
+    old_index, new_index = index(old), index(new)
+    changes = []
+    for key in old_index.keys() | new_index.keys():
+        old_version = old_index.get(key)
+        new_version = new_index.get(key)
+        if key not in new_index:
+            change = "removed"
+        elif key not in old_index:
+            change = "added"
+        elif old_version is None or new_version is None or old_version == new_version:
+            continue
+        elif parse_version(new_version) > parse_version(old_version):
+            change = "upgraded"
+        elif parse_version(new_version) < parse_version(old_version):
+            change = "downgraded"
+        else:
+            continue
+        changes.append({
+            "manager_id": key[0],
+            "package_id": key[1],
+            "change": change,
+            "old_version": old_version,
+            "new_version": new_version,
+        })
+    return sorted(changes, key=lambda c: (c["manager_id"], c["package_id"]))
+
+
+@mpm.command(
+    short_help="Compare a TOML snapshot to another, or to installed packages.",
+    section=SNAPSHOTS,
+)
+@columns_option(columns=column_specs(DIFF_COLUMNS))
+@argument("old_snapshot", type=File("r"))
+@argument("new_snapshot", type=File("r"), required=False)
+@pass_context
+def diff(ctx, old_snapshot, new_snapshot):
+    """List the packages added, removed, upgraded or downgraded between two TOML
+    snapshots produced by `mpm dump`.
+
+    Without `NEW_SNAPSHOT`, compare `OLD_SNAPSHOT` to the packages currently
+    installed. Only the managers having a section in `OLD_SNAPSHOT` are queried.
+    """
+    old = _read_manifest(old_snapshot)
+    errored: list[str] = []
+
+    if new_snapshot is not None:
+        new = _read_manifest(new_snapshot)
+        # Honor the manager selection without probing any manager.
+        selection = ctx.obj.user_selection
+        drops = ctx.obj.user_drops or set()
+        for inventory in (old, new):
+            for manager_id in tuple(inventory):
+                if manager_id in drops or (selection and manager_id not in selection):
+                    del inventory[manager_id]
+    else:
+        # Narrow the selection to the snapshot's managers, so a snapshot of two
+        # managers does not probe every one of the pool.
+        keep = [
+            manager_id
+            for manager_id in ctx.obj.user_selection or pool.all_manager_ids
+            if manager_id in old
+        ]
+        managers = list(
+            ctx.obj.selected_managers(
+                keep=keep, implements_operation=Operations.installed
+            )
+        )
+
+        def fetch(manager: PackageManager) -> tuple[str, dict]:
+            packages = {
+                package.id: package.installed_version
+                for package in manager.installed_or_empty()
+            }
+            return manager.id, {"packages": packages, "errors": _cli_errors(manager)}
+
+        new = {}
+        for manager_id, data in collect_from_managers(
+            "Reading", "Read", managers, fetch
+        ):
+            # A failed query lists nothing: diffing it would report every
+            # package as removed.
+            if data["errors"]:
+                errored.append(manager_id)
+            else:
+                new[manager_id] = data["packages"]
+        # Sections of managers that were not queried, or failed to, are not
+        # reported as removed.
+        old = {manager_id: old[manager_id] for manager_id in new}
+
+    changes = diff_inventories(old, new)
+
+    try:
+        print_serialized_and_exit(ctx, changes)
+    except click.exceptions.Exit:
+        # The failure gate below also applies to serialized output.
+        if not errored:
+            raise
+    else:
+        print_projected_table(ctx, DIFF_COLUMNS, changes)
+
+        if ctx.obj.summary:
+            print_summary(Counter(change["manager_id"] for change in changes))
+
+    if errored:
+        fail_unless_zero_exit(
+            ctx,
+            "Could not compare the installed packages of "
+            f"{', '.join(sorted(errored))}.",
+        )
+
+
+INVENTORY_SUFFIXES = (".json", ".toml")
+"""Extensions of the inventory files collected from a directory by `aggregate`."""
+
+
+def _inventory_paths(inputs: tuple[Path, ...]) -> list[str]:
+    """Expand the `inputs` of `aggregate`, directories to the inventories they hold.
+
+    Passing a directory keeps the command line short, whatever the fleet size.
+    """
+    paths: list[str] = []
+    for input_path in inputs:
+        if input_path.is_dir():
+            paths.extend(
+                str(child)
+                for child in sorted(input_path.iterdir())
+                if child.suffix.lower() in INVENTORY_SUFFIXES and child.is_file()
+            )
+        else:
+            paths.append(str(input_path))
+    return paths
+
+
+@mpm.command(
+    short_help="Summarize the inventories exported from a fleet of hosts.",
+    section=SNAPSHOTS,
+)
+@columns_option(columns=column_specs(AGGREGATE_COLUMNS))
+@argument(
+    "inventories",
+    type=path(exists=True, path_type=Path),
+    required=True,
+    nargs=-1,
+)
+@pass_context
+def aggregate(ctx, inventories):
+    """Aggregate the package inventories of many hosts, one file per host.
+
+    Each file is either a TOML manifest from `mpm dump`, or the output of
+    `mpm --table-format json installed`. A directory stands for all the
+    `*.json` and `*.toml` files it contains.
+
+    For each package, reports the number of hosts carrying each version, the
+    newest version seen and the hosts lagging behind it. Hosts lagging on far
+    more packages than the rest of the fleet are reported as outliers.
+
+    Files are parsed in parallel by `--jobs` processes.
+    """
+    paths = _inventory_paths(inventories)
+    if not paths:
+        logging.critical("No inventory to aggregate.")
+        ctx.exit(2)
+
+    # Batches of files are read by worker processes, so thousands of inventories
+    # are not bound by a single core.
+    fleet = aggregate_files(paths, jobs=effective_jobs(ctx, len(paths)))
+    packages, outliers = fleet.report()
+    logging.info(
+        f"Aggregated {len(paths) - len(fleet.failures)} inventories "
+        f"out of {len(paths)}."
+    )
+
+    print_serialized_and_exit(ctx, {"packages": packages, "outliers": outliers})
+
+    for outlier in outliers:
+        logging.warning(
+            f"{outlier['host']} lags on {outlier['lagging']} packages "
+            f"(modified z-score: {outlier['score']})."
+        )
+
+    table = [
+        {
+            "manager_id": manager_id,
+            "package_id": package_id,
+            "newest_version": stats["newest"],
+            "hosts": str(stats["hosts"]),
+            "lagging": str(len(stats["lagging"])),
+            "versions": ", ".join(
+                f"{version}: {count}" for version, count in stats["versions"].items()
+            ),
+        }
+        for manager_id, per_package in packages.items()
+        for package_id, stats in per_package.items()
+    ]
+    print_projected_table(ctx, AGGREGATE_COLUMNS, table)
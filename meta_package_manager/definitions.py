@@ -46,10 +46,12 @@ from __future__ import annotations
 
 import importlib.resources
 import logging
+import os
 import re
 import sys
 from dataclasses import dataclass
 from functools import cache
+from pathlib import Path
 from typing import cast
 
 from click_extra.config import ValidationError
@@ -66,7 +68,6 @@ else:
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator, Mapping
-    from pathlib import Path
     from typing import Any, Final
 
     from .package import Package
@@ -160,6 +161,7 @@ OVERRIDABLE_FIELDS: Final[Mapping[str, Callable[[Any], Any]]] = {
     "unmaintained": _to_bool,
     "version_cli_options": _to_str_tuple,
     "version_regexes": _to_str_tuple,
+    "watch_paths": _to_str_tuple,
 }
 """Per-manager attributes a user is allowed to override from the `[mpm.managers.<id>]`
 configuration section.
@@ -203,6 +205,7 @@ DEFINITION_CLI_FIELDS: Final[Mapping[str, Callable[[Any], Any]]] = {
             "unmaintained",
             "version_cli_options",
             "version_regexes",
+            "watch_paths",
         )
     },
     # Definition-only fields, with no OVERRIDABLE_FIELDS counterpart: a built-in
@@ -378,14 +381,29 @@ ARG_PLACEHOLDER_REGEX: Final = re.compile(r"\{([a-z_]+)\}")
 
 
 QUERY_OPERATION_KEYS: Final[frozenset[str]] = frozenset(
-    {"args", "cli", "regex", "format", "fields", "list_path", "sudo"},
+    {"args", "cli", "regex", "format", "fields", "list_path", "sudo", "file"},
 )
 """Keys allowed in a query operation's table.
 
 `cli` is the same alternate-binary hook as on command operations. `sudo = true`
 marks the query as privileged, for the rare tool that gates even its read-only
 listings behind root (`deb-get`'s upgradable check); escalation then follows the
-usual per-manager policy.
+usual per-manager policy. `file` declares a file to read in place of running the
+CLI (see {data}`FILE_SOURCE_KEYS`).
+"""
+
+
+FILE_SOURCE_KEYS: Final[frozenset[str]] = frozenset(
+    {"paths", "regex", "format", "fields", "list_path"},
+)
+"""Keys allowed in the `file` table of a query operation.
+
+Some tools keep the listing a query prints in a plain file, and booting the tool
+costs far more than reading that file. `paths` lists the file's candidate
+locations, expanded like
+{attr}`~meta_package_manager.manager.PackageManager.watch_paths`. The file
+carries its own `regex` or JSON parser, as its format is rarely the one of the
+CLI output. The CLI still runs when the file cannot be read.
 """
 
 
@@ -485,6 +503,21 @@ class OperationSpec:
     (`versions[0]`); see {data}`JSON_FIELD_SELECTOR_REGEX`.
     """
 
+    file: OperationSpec | None = None
+    """Parser of the file a query reads in place of running the CLI, or `None`.
+
+    Its {attr}`args` are empty: the file is located from {attr}`paths` instead.
+    See {data}`FILE_SOURCE_KEYS`.
+    """
+
+    paths: tuple[str, ...] = ()
+    """Candidate locations of the file read by a `file` parser.
+
+    The first path whose environment variables are all set is the file, so that
+    `["$CARGO_HOME/x", "~/.cargo/x"]` only falls back to the default location
+    when `CARGO_HOME` is unset, not when the file is missing.
+    """
+
 
 @dataclass(frozen=True)
 class ManagerDefinition:
@@ -765,6 +798,8 @@ def _parse_operation_spec(
 
     common = _parse_search_refinements(path, args, raw, found_placeholders)
     common.update(cli=cli, sudo=sudo)
+    if "file" in raw:
+        common["file"] = _parse_file_spec(path, op_name, raw["file"])
 
     if is_query:
         return _parse_query_spec(path, op_name, args, raw, common)
@@ -905,6 +940,37 @@ def _parse_query_spec(
     )
 
 
+def _parse_file_spec(path: str, op_name: str, raw: Any) -> OperationSpec:
+    """Validate the `file` table of a query operation.
+
+    Its parser is validated like the operation's own, against the same required
+    fields.
+    """
+    path = f"{path}.file"
+    if not isinstance(raw, dict):
+        raise ValidationError(
+            path, f"expected a table, got {type(raw).__name__}", code="invalid_type"
+        )
+    for key in raw:
+        if key not in FILE_SOURCE_KEYS:
+            raise ValidationError(
+                f"{path}.{key}",
+                f"unknown key. Allowed: {', '.join(sorted(FILE_SOURCE_KEYS))}.",
+                code="unknown_field",
+            )
+    if "paths" not in raw:
+        raise ValidationError(f"{path}.paths", "required.", code="missing_field")
+    try:
+        paths = _to_str_tuple(raw["paths"])
+    except TypeError as ex:
+        raise ValidationError(f"{path}.paths", str(ex), code="invalid_type") from ex
+    if not paths:
+        raise ValidationError(
+            f"{path}.paths", "must be a non-empty list.", code="invalid_value"
+        )
+    return _parse_query_spec(path, op_name, (), raw, {"paths": paths})
+
+
 def _check_parse_fields(path: str, present: set[str], required: frozenset[str]) -> None:
     """Reject unrecognized parse fields and require the mandatory ones."""
     unknown = present - RECOGNIZED_PARSE_FIELDS
@@ -963,6 +1029,35 @@ def _parse_spec_output(
     )
 
 
+def _compile(spec: OperationSpec) -> re.Pattern[str] | None:
+    """Compile the regex of a `"regex"`-mode parser, `None` for other modes."""
+    if spec.parse_mode != "regex":
+        return None
+    assert spec.regex is not None
+    return re.compile(spec.regex, re.MULTILINE)
+
+
+def _read_spec_file(manager: PackageManager, spec: OperationSpec) -> str | None:
+    """Read the file of a `file` parser, or `None` for the CLI to run instead.
+
+    Only the first of {attr}`OperationSpec.paths` whose variables are all set is
+    tried.
+    """
+    for raw_path in spec.paths:
+        expanded = os.path.expandvars(os.path.expanduser(raw_path))
+        if "$" in expanded:
+            continue
+        try:
+            return Path(expanded).read_text(encoding="UTF-8")
+        except (OSError, UnicodeDecodeError) as ex:
+            logging.debug(
+                f"Cannot read {expanded}, running the CLI instead: {ex}",
+                extra={"label": manager.id},
+            )
+            return None
+    return None
+
+
 def _op_cli_path(manager: PackageManager, spec: OperationSpec) -> Path | None:
     """Resolve the operation's alternate binary, or `None` for the main CLI.
 
@@ -979,9 +1074,18 @@ def _op_cli_path(manager: PackageManager, spec: OperationSpec) -> Path | None:
 def _make_query_property(
     spec: OperationSpec, compiled: re.Pattern[str] | None
 ) -> property:
-    """Build an `installed`/`outdated` property that runs the CLI and parses it."""
+    """Build an `installed`/`outdated` property that runs the CLI and parses it.
+
+    A query declaring a `file` parses the file instead, whenever it can be read.
+    """
+    file_compiled = _compile(spec.file) if spec.file else None
 
     def query(self: PackageManager) -> Iterator[Package]:
+        if spec.file:
+            content = _read_spec_file(self, spec.file)
+            if content is not None:
+                yield from _parse_spec_output(self, content, spec.file, file_compiled)
+                return
         output = self.run_cli(
             *spec.args,
             override_cli_path=_op_cli_path(self, spec),
@@ -1026,11 +1130,18 @@ def _make_search(
     render the tool's native exact/extended switches when declared;
     {meth}`~meta_package_manager.manager.PackageManager.refiltered_search`
     refilters the raw results either way, exactly as for the built-in managers.
+    A declared `file` is read in place of the CLI, as for the other queries.
     """
+    file_compiled = _compile(spec.file) if spec.file else None
 
     def search(
         self: PackageManager, query: str, extended: bool, exact: bool
     ) -> Iterator[Package]:
+        if spec.file:
+            content = _read_spec_file(self, spec.file)
+            if content is not None:
+                yield from _parse_spec_output(self, content, spec.file, file_compiled)
+                return
         output = self.run_cli(
             *_expand_search_args(spec, query, extended, exact),
             override_cli_path=_op_cli_path(self, spec),
@@ -1168,10 +1279,7 @@ def build_manager_class(definition: ManagerDefinition) -> type[ConfigDrivenManag
     namespace.update(definition.cli_fields)
 
     for op_name, spec in definition.operations.items():
-        compiled = None
-        if spec.parse_mode == "regex":
-            assert spec.regex is not None
-            compiled = re.compile(spec.regex, re.MULTILINE)
+        compiled = _compile(spec)
         if op_name == "installed":
             namespace["installed"] = _make_query_property(spec, compiled)
         elif op_name == "outdated":
@@ -0,0 +1,142 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""In-process dependency graph of a manager's installed packages.
+
+Most managers with an orphan concept answer the question natively
+(`pacman --query --deps --unrequired`, `brew autoremove --dry-run`). For the
+others, {program}`mpm` can still decide locally, provided the manager's metadata
+records two facts about each installed package: the packages it depends on
+({attr}`meta_package_manager.package.PackageMetadata.dependencies`), and whether
+it was installed on request or only to satisfy another package
+({attr}`meta_package_manager.package.PackageMetadata.installed_on_request`).
+
+A package is then required if a package installed on request reaches it through
+dependency edges, and orphaned otherwise. One traversal from the roots yields
+the whole transitive closure of orphans, dependency cycles included, where
+re-querying a native listing after each removal round only peels one layer of
+leaves at a time.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .package import Package, PackageMetadata
+
+
+class DependencyGraph:
+    """Installed packages of one manager, linked by their declared dependencies.
+
+    Nodes are keyed by package ID, passed through the optional `key` function so
+    dependency targets spelled differently from the inventory IDs still resolve
+    (Python distributions normalize `Foo_Bar` and `foo-bar` to the same name, for
+    instance). Edges pointing to packages that are not installed are ignored.
+
+    The graph errs on the side of keeping packages: a package whose install
+    reason is unknown counts as installed on request, and every dependency edge
+    counts whatever its {class}`meta_package_manager.package.DependencyScope`.
+    """
+
+    def __init__(self, key: Callable[[str], str] | None = None) -> None:
+        self._key = key or str
+        self.packages: dict[str, Package] = {}
+        """Installed packages, by node key."""
+        self.requires: dict[str, set[str]] = {}
+        """Node keys of the declared dependencies of each node, installed or not."""
+        self.roots: set[str] = set()
+        """Node keys of the packages not known to be installed as a dependency."""
+
+    @classmethod
+    def from_metadata(
+        cls,
+        pairs: Iterable[tuple[Package, PackageMetadata]],
+        key: Callable[[str], str] | None = None,
+    ) -> DependencyGraph:
+        """Build the graph from the output of
+        {meth}`meta_package_manager.manager.PackageManager.package_metadata_batch`.
+        """
+        graph = cls(key)
+        for package, metadata in pairs:
+            graph.add(
+                package,
+                (dependency.target_id for dependency in metadata.dependencies),
+                installed_on_request=metadata.installed_on_request,
+            )
+        return graph
+
+    def add(
+        self,
+        package: Package,
+        dependencies: Iterable[str] = (),
+        installed_on_request: bool | None = None,
+    ) -> None:
+        """Register an installed package and the IDs of its dependencies."""
+        node = self._key(package.id)
+        self.packages[node] = package
+        self.requires.setdefault(node, set()).update(map(self._key, dependencies))
+        if installed_on_request is not False:
+            self.roots.add(node)
+
+    def __len__(self) -> int:
+        return len(self.packages)
+
+    def required(self) -> set[str]:
+        """Node keys reachable from the roots, themselves included."""
+        seen = {node for node in self.roots if node in self.packages}
+        queue = deque(seen)
+        while queue:
+            for dependency in self.requires[queue.popleft()]:
+                if dependency in self.packages and dependency not in seen:
+                    seen.add(dependency)
+                    queue.append(dependency)
+        return seen
+
+    def removal_order(self, nodes: Iterable[str]) -> list[str]:
+        """Order `nodes` so every package comes before its own dependencies.
+
+        The order a manager refusing to break installed dependents needs: by the
+        time a package is removed, nothing among `nodes` still depends on it.
+        Members of a dependency cycle have no such order and come last, sorted.
+        """
+        pending = set(nodes)
+        dependents = dict.fromkeys(pending, 0)
+        for node in pending:
+            for dependency in self.requires.get(node, ()):
+                if dependency in pending and dependency != node:
+                    dependents[dependency] += 1
+        # Kahn's algorithm, with a heap to break ties alphabetically.
+        ready = [node for node, count in dependents.items() if not count]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            node = heapq.heappop(ready)
+            order.append(node)
+            for dependency in self.requires.get(node, ()):
+                if dependency in pending and dependency != node:
+                    dependents[dependency] -= 1
+                    if not dependents[dependency]:
+                        heapq.heappush(ready, dependency)
+        return order + sorted(pending.difference(order))
+
+    def orphans(self) -> list[Package]:
+        """Installed packages no root requires anymore, in removal order."""
+        orphaned = self.packages.keys() - self.required()
+        return [self.packages[node] for node in self.removal_order(orphaned)]
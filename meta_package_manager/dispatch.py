@@ -251,8 +251,10 @@ class FanOut:
 
 
 COMMAND_FAN_OUT: Final[tuple[FanOut, ...]] = (
+    FanOut("aggregate", FAN_OUT_NONE),
     FanOut("cleanup", FAN_OUT_GROUPED),
     FanOut("config-template", FAN_OUT_NONE),
+    FanOut("diff", FAN_OUT_CONCURRENT),
     FanOut("doctor", FAN_OUT_GROUPED),
     FanOut("dump", FAN_OUT_CONCURRENT),
     FanOut("help", FAN_OUT_NONE),
@@ -262,12 +264,14 @@ COMMAND_FAN_OUT: Final[tuple[FanOut, ...]] = (
     FanOut("managers", FAN_OUT_NONE),
     FanOut("orphans", FAN_OUT_CONCURRENT),
     FanOut("outdated", FAN_OUT_CONCURRENT),
+    FanOut("outdated --sync", FAN_OUT_GROUPED),
     FanOut("remove", FAN_OUT_GROUPED),
     FanOut("restore", FAN_OUT_GROUPED),
     FanOut("sbom", FAN_OUT_CONCURRENT),
     FanOut("search", FAN_OUT_CONCURRENT),
     FanOut("sync", FAN_OUT_GROUPED),
     FanOut("upgrade", FAN_OUT_GROUPED),
+    FanOut("watch", FAN_OUT_CONCURRENT),
     FanOut("which", FAN_OUT_NONE),
 )
 """Fan-out mode of every `mpm` subcommand, rendered on `docs/concurrency.md`.
@@ -603,9 +607,9 @@ def merge_into_lock_lanes(
     and within a lane's task list.
 
     Used by the mutating fan-outs only: the state changers through
-    {func}`collect_per_package`, and `sync`/`cleanup`/`upgrade --all` through
-    {func}`collect_from_managers`. The read commands take no backend lock and skip this,
-    keeping one lane per manager.
+    {func}`collect_per_package`, and `sync`/`cleanup`/`upgrade --all`/`outdated
+    --sync` through {func}`collect_from_managers`. The read commands take no backend
+    lock and skip this, keeping one lane per manager.
     """
     lanes: dict[
         object, tuple[list[PackageManager], list[Callable[[], tuple[bool, str]]]]
@@ -627,6 +631,7 @@ def collect_from_managers(
     work: Callable[[PackageManager], tuple[str, dict]],
     *,
     report_state: bool = False,
+    lock_lanes: bool = False,
     ctx: Context | None = None,
 ) -> list[tuple[str, dict]]:
     """Run `work(manager)` for every manager concurrently, results in input order.
@@ -652,6 +657,9 @@ def collect_from_managers(
         `False`: their table is the output, so the sequential fallback is silent and
         the finisher reports coverage. Passed to {func}`dispatch` as the inverse of
         `coverage`.
+    :param lock_lanes: merge lock-family members into shared serial lanes, like
+        `report_state` does, while keeping the finisher of a read command. Set by
+        `outdated --sync`, whose work starts with a sync.
     """
     results: list[tuple[str, dict]] = [("", {})] * len(managers)
 
@@ -670,7 +678,7 @@ def collect_from_managers(
     # Mutating fan-outs (report_state) serialize lock families into shared lanes; the
     # read commands take no backend lock and keep one lane per manager.
     lanes: list[tuple[tuple[PackageManager, ...], list[Callable[[], tuple[bool, str]]]]]
-    if report_state:
+    if report_state or lock_lanes:
         lanes = merge_into_lock_lanes(pairs)
     else:
         lanes = [((manager,), [unit]) for manager, unit in pairs]
@@ -696,7 +704,8 @@ def collect_per_package(
     `(ok, message)` after doing its CLI call and recording its own outcome. The
     unmatched-package priority search of `install` is *not* routed here: it has genuine
     cross-manager ordering (stop at the first manager that has the package) and stays
-    sequential on its own.
+    sequential on its own. `restore` calls it once per level of its manager
+    sections, so a manager bootstrapped by another section waits for it.
     """
     dispatch(label, done_label, "packages", merge_into_lock_lanes(tasks), ctx=ctx)
 
@@ -55,6 +55,7 @@ import stat
 import subprocess
 import sys
 import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from functools import cached_property
@@ -73,9 +74,10 @@ from click_extra.execution import (
 )
 from click_extra.spinner import Spinner
 from click_extra.theme import get_current_theme as theme
-from extra_platforms import UNIX, current_platform, is_any_windows
+from extra_platforms import UNIX, current_platform, is_any_windows, is_macos
 
 from .cooldown import CooldownPolicy
+from .session import CLISession, SessionError
 from .sudo import (
     _STALL_NOTICE_OPERATIONS,
     _SUDO_CACHE_WARM,
@@ -276,6 +278,100 @@ where the click context is not reliably reachable. See {class}`_PlanRecorder`.
 """
 
 
+_RACY_LISTING_NS: Final = 2_000_000_000
+"""Age under which a directory's modification time is too fresh to trust.
+
+Coarse-grained filesystems (FAT, HFS+) tick their timestamps every second or two,
+so an entry added right after a listing can leave the directory's mtime
+unchanged. A listing of a directory modified this recently is served but not
+cached, the way Git treats its racily-clean index entries.
+"""
+
+
+def _fold_case(filename: str) -> str:
+    """Fold the case of `filename` where the filesystem ignores it.
+
+    `os.path.normcase` only folds case on Windows, but the default filesystems of
+    macOS (APFS and HFS+) are case-insensitive too. On a case-sensitive macOS
+    volume, a name matched this way is still weeded out by the on-disk probe.
+    """
+    if is_macos():
+        return filename.lower()
+    return os.path.normcase(filename)
+
+
+class _PathIndex:
+    """Process-wide index of the directories CLIs are searched in.
+
+    {meth}`CLIExecutor.search_all_cli` runs once per manager and per lookup (main
+    CLI, version binary, siblings). Resolving every search directory and probing
+    each candidate filename in each of them costs thousands of `realpath` and
+    `stat` calls at startup, with 80+ managers and a long `PATH`. The index
+    resolves each directory once and lists it with a single `os.scandir`, so a
+    lookup costs one `stat` per directory (to check its listing is current) and a
+    set lookup per candidate filename. Only the hits are then probed on disk.
+
+    A listing is dropped as soon as its directory's modification time changes,
+    which it does whenever an entry is added, removed or renamed. Resolutions are
+    keyed on the raw directory string, so a changed `PATH` simply misses.
+    Concurrent lookups from the fan-out's worker threads race benignly: two
+    threads listing the same directory store equivalent results.
+    """
+
+    def __init__(self) -> None:
+        self._normalized: dict[str, str] = {}
+        self._listings: dict[str, tuple[int, frozenset[str]]] = {}
+
+    def clear(self) -> None:
+        """Forget every resolution and listing."""
+        self._normalized.clear()
+        self._listings.clear()
+
+    def normalize(self, directory: str) -> str:
+        """Resolve symlinks and produce a normalized absolute path string.
+
+        Also folds case with `os.path.normcase` on Windows, to deduplicate
+        directories of case-insensitive filesystems.
+        """
+        normalized = self._normalized.get(directory)
+        if normalized is None:
+            normalized = os.path.normcase(os.path.realpath(directory))
+            self._normalized[directory] = normalized
+        return normalized
+
+    def entries(self, directory: str) -> frozenset[str] | None:
+        """Names of the entries of the normalized `directory`, case-folded by
+        {func}`_fold_case`.
+
+        Empty if `directory` does not exist or is not a directory. Returns `None`
+        for a directory that cannot be listed, but may still be searched: its
+        candidates have to be probed one by one.
+        """
+        try:
+            dir_stat = os.stat(directory)
+        except OSError:
+            return frozenset()
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            return frozenset()
+        mtime = dir_stat.st_mtime_ns
+        cached = self._listings.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with os.scandir(directory) as scan:
+                names = frozenset(_fold_case(entry.name) for entry in scan)
+        except OSError:
+            return None
+        if time.time_ns() - mtime > _RACY_LISTING_NS:
+            self._listings[directory] = (mtime, names)
+        return names
+
+
+PATH_INDEX: Final = _PathIndex()
+"""Process-wide directory index shared by every manager's
+{meth}`CLIExecutor.search_all_cli`. See {class}`_PathIndex`."""
+
+
 def highlight_cli_name(path: Path | None, match_names: Iterable[str]) -> str | None:
     """Highlight the binary name in the provided `path`.
 
@@ -507,6 +603,24 @@ class CLIExecutor:
     programmatic use stays silent.
     """
 
+    concurrent_reads: bool = True
+    """Whether two read-only queries of this manager may run at the same time.
+
+    Operations composed of several independent queries (an `outdated` listing
+    plus the installed versions it lacks, a `sbom` inventory plus its metadata)
+    run them concurrently through
+    {meth}`meta_package_manager.manager.PackageManager.gather`. Set to `False` on
+    a manager whose reads contend for a lock of their own, to keep its queries
+    strictly sequential.
+    """
+
+    jobs: int | None = None
+    """Cap on the number of this manager's queries running at once.
+
+    Set by the CLI from `--jobs`, so `--jobs 1` (and `DEBUG` verbosity) also keep
+    each manager's own sub-queries sequential. `None` leaves them uncapped.
+    """
+
     cooldown: timedelta | None = None
     """Minimum age a release must have before it can be installed or upgraded.
 
@@ -616,6 +730,26 @@ class CLIExecutor:
     No-op on non-Windows platforms.
     """
 
+    session_args: tuple[str, ...] | None = None
+    """Arguments starting the CLI as a long-lived interpreter, if it can be one.
+
+    `None` (the default) spawns the CLI anew for each {meth}`run`. Managers whose
+    CLI is slow to start set it to keep a single
+    {class}`~meta_package_manager.session.CLISession` for the whole
+    {program}`mpm` invocation instead, fed by {meth}`session_script`.
+    """
+
+    _sessions: dict[tuple, CLISession] | None = None
+    """Running sessions of this manager, keyed on their environment."""
+
+    _sessions_lock = threading.Lock()
+    """Guards the lookup and start of sessions, so concurrent reads of a manager
+    share one session instead of each starting their own."""
+
+    _session_failed: bool = False
+    """Set once a session failed to start or died, so the rest of the invocation
+    sticks to one-shot spawns rather than retrying."""
+
     cli_errors: list[CLIError]
     """Accumulate all CLI errors encountered by the package manager.
 
@@ -742,7 +876,9 @@ class CLIExecutor:
         * then in all the default places specified by the environment variable (i.e.
           `os.getenv("PATH")`).
 
-        Only returns files that exists and are not empty.
+        Only returns files that exists and are not empty. Directories are read
+        through the shared {data}`PATH_INDEX`, so only the filenames a directory
+        actually contains are probed.
 
         ```{caution}
 
@@ -790,20 +926,12 @@ class CLIExecutor:
                     search_filenames.extend(f"{cli_name}{ext}" for ext in pathext)
         search_filenames = unique(search_filenames)
 
-        def normalize_path(path: Path) -> str:
-            """Resolves symlinks and produces a normalized absolute path string.
-
-            Additonnaly use `os.path.normcase` on Windows to exclude duplicates
-            produced by case-insensitive filesystems.
-            """
-            return os.path.normcase(path.resolve())
-
         # Deduplicate search paths while keeping their order and original value, as the
         # normalization process happens with the `key` lookup.
         search_path_list: list[Path] = unique(
             # Manager-specific search path takes precedence over default environment.
             (Path(p) for p in (*self.cli_search_path, *os.get_exec_path(env=env))),
-            key=normalize_path,
+            key=lambda path: PATH_INDEX.normalize(str(path)),
         )
 
         logging.debug(
@@ -814,10 +942,15 @@ class CLIExecutor:
         )
 
         for search_path in search_path_list:
-            if not search_path.is_dir():
+            # Only probe the files the directory listing knows about, or all of
+            # them in a directory that cannot be listed.
+            entries = PATH_INDEX.entries(PATH_INDEX.normalize(str(search_path)))
+            if entries is not None and not entries:
                 continue
 
             for filename in search_filenames:
+                if entries is not None and _fold_case(filename) not in entries:
+                    continue
                 file = search_path / filename
                 # On Windows, check for reparse points (e.g., Windows App Execution Aliases like winget).
                 # These return False for is_file() and 0 for getsize(), so we detect them separately.
@@ -1047,6 +1180,67 @@ class CLIExecutor:
                 check=False,
             )
 
+    def session_script(self, args: tuple[str, ...]) -> str | None:
+        """Translate the command line `args` into a request for the session.
+
+        Returns `None` for a command the session cannot run, which is then
+        spawned on its own. Only called on managers with {attr}`session_args`.
+        """
+        return None
+
+    def session_trailer(self, marker: str) -> str:
+        """Code appended to each request, printing `marker` on both `<stdout>`
+        and `<stderr>`, followed on `<stdout>` by the request's exit code.
+        """
+        raise NotImplementedError
+
+    def _run_in_session(
+        self,
+        args: tuple[str, ...],
+        extra_env: TEnvVars | None,
+        timeout: float,
+        cli_msg: str,
+        command_level: int,
+    ) -> subprocess.CompletedProcess[str] | None:
+        """Run `args` in this manager's session, or return `None` to spawn them.
+
+        A session that cannot start, or dies before answering, is given up for
+        the rest of the invocation, and its request is spawned instead. A timeout
+        propagates like the one of a spawn, after the session is killed.
+        """
+        if self.session_args is None or self._session_failed or not self.cli_path:
+            return None
+        script = self.session_script(args)
+        if script is None:
+            return None
+        # `id` is declared on the `PackageManager` subclass, not this mixin.
+        manager_id: str = self.id  # type: ignore[attr-defined]
+        key = tuple(sorted((extra_env or {}).items()))
+        try:
+            with self._sessions_lock:
+                if self._sessions is None:
+                    self._sessions = {}
+                session = self._sessions.get(key)
+                if session is None or not session.alive:
+                    session = self._sessions[key] = CLISession(
+                        (str(self.cli_path), *self.session_args),
+                        extra_env=extra_env,
+                        label=manager_id,
+                    )
+            logging.log(command_level, cli_msg, extra={"label": manager_id})
+            return session.request(
+                script + self.session_trailer(session.marker), args, timeout
+            )
+        except (OSError, SessionError) as ex:
+            logging.debug(
+                f"Session unusable, falling back to one-shot runs: {ex}",
+                extra={"label": manager_id},
+            )
+            self._session_failed = True
+            if self._sessions is not None:
+                self._sessions.pop(key, None)
+            return None
+
     def run(
         self,
         *args: TArg | TNestedArgs,
@@ -1173,7 +1367,18 @@ class CLIExecutor:
                 # keeps it invisible while the invocation line is disclosed.
                 try:
                     with spinner:
-                        result = run_cli(
+                        # A session answers in place of the spawn when the manager
+                        # has one, for calls that need no terminal of their own.
+                        result = None
+                        if watchdog is None and not is_escalation:
+                            result = self._run_in_session(
+                                clean_args,
+                                extra_env,
+                                effective_timeout,
+                                cli_msg,
+                                command_level,
+                            )
+                        result = result or run_cli(
                             clean_args,
                             extra_env=extra_env,
                             timeout=effective_timeout,
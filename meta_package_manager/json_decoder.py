@@ -0,0 +1,149 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Decoding of the JSON payloads printed by package managers.
+
+Some of these payloads are large: `conda list --json` or `npm ls --json --all`
+on a well-stocked machine print megabytes of JSON. Two helpers keep their
+decoding cheap:
+
+- {func}`loads` decodes a whole document with `orjson` or `msgspec` when one of
+  them is installed ({data}`orjson_support`, {data}`msgspec_support`), and
+  with the standard library otherwise.
+- {func}`iter_json_items` walks to the array of package objects without
+  building the document around it, and yields its items one by one. Only the
+  item being decoded is held in memory, instead of the whole tree.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import Final
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Any
+
+orjson_support = True
+try:
+    import orjson
+except ImportError:
+    orjson_support = False
+
+msgspec_support = True
+try:
+    import msgspec
+except ImportError:
+    msgspec_support = False
+
+if not orjson_support and not msgspec_support:
+    logging.getLogger("meta_package_manager").debug(
+        "Accelerated JSON decoding disabled: install orjson or msgspec to enable it."
+    )
+
+
+def loads(document: str | bytes) -> Any:
+    """Decode a whole JSON `document`, with the fastest decoder available.
+
+    Raises {exc}`ValueError` on malformed input, whatever the decoder.
+    """
+    if orjson_support:
+        return orjson.loads(document)
+    if msgspec_support:
+        try:
+            return msgspec.json.decode(document)
+        except msgspec.DecodeError as ex:
+            raise ValueError(str(ex)) from ex
+    return json.loads(document)
+
+
+_WHITESPACE: Final = re.compile(r"[ \t\n\r]*")
+"""Insignificant whitespace between JSON tokens, as {mod}`json` defines it."""
+
+_raw_decode: Final = json.JSONDecoder().raw_decode
+"""Decode the JSON value starting at an index of a document, and return the index
+following it. Runs on the C scanner of {mod}`json`."""
+
+
+def _skip(document: str, index: int) -> int:
+    match = _WHITESPACE.match(document, index)
+    assert match is not None
+    return match.end()
+
+
+def _expect(document: str, index: int, delimiter: str) -> int:
+    """Index following `delimiter` at `index`, after whitespace."""
+    if not document.startswith(delimiter, index):
+        raise json.JSONDecodeError(f"Expecting {delimiter!r}", document, index)
+    return _skip(document, index + 1)
+
+
+def _find_key(document: str, index: int, key: str) -> int | None:
+    """Start of the value of `key` in the object at `index`.
+
+    `None` if there is no object at `index`, or it has no such key. The values of
+    the keys before it are decoded to be skipped, then dropped.
+    """
+    if not document.startswith("{", index):
+        return None
+    index = _skip(document, index + 1)
+    if document.startswith("}", index):
+        return None
+    while True:
+        name, index = _raw_decode(document, index)
+        if not isinstance(name, str):
+            raise json.JSONDecodeError("Expecting property name", document, index)
+        index = _expect(document, _skip(document, index), ":")
+        if name == key:
+            return index
+        _, index = _raw_decode(document, index)
+        index = _skip(document, index)
+        if document.startswith("}", index):
+            return None
+        index = _expect(document, index, ",")
+
+
+def iter_json_items(document: str, list_path: str | None = None) -> Iterator[Any]:
+    """Yield the items of the array at `list_path` in the JSON `document`.
+
+    `list_path` is a dot-separated path of object keys, `None` for a document
+    that is itself the array. Yields nothing if the path does not lead to an
+    array, so an unexpected payload yields no packages rather than raising.
+
+    The document is decoded lazily: a malformed item raises {exc}`ValueError`
+    once the items before it were yielded, and whatever follows the array is
+    never read.
+    """
+    index = _skip(document, 0)
+    for key in list_path.split(".") if list_path else ():
+        found = _find_key(document, index, key)
+        if found is None:
+            return
+        index = found
+    if not document.startswith("[", index):
+        return
+    index = _skip(document, index + 1)
+    if document.startswith("]", index):
+        return
+    while True:
+        item, index = _raw_decode(document, index)
+        yield item
+        index = _skip(document, index)
+        if document.startswith("]", index):
+            return
+        index = _expect(document, index, ",")
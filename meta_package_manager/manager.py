@@ -31,13 +31,13 @@ availability policy: whether the manager is supported, fresh, and ready to use.
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from enum import Enum
 from functools import cached_property
 from typing import ClassVar, cast
 
+from click_extra.execution import run_jobs
 from extra_platforms import (
     Group,
     Platform,
@@ -46,15 +46,17 @@ from extra_platforms import (
 )
 
 from .execution import CLIError, CLIExecutor, highlight_cli_name
-from .package import EMPTY_METADATA, Package, PackageMetadata
+from .json_decoder import iter_json_items, loads
+from .package import EMPTY_METADATA, Package, PackageMetadata, QueryMatcher
 from .version import VersionRange
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
     from pathlib import Path
     from typing import Any
 
+    from .dependency_graph import DependencyGraph
     from .version import TokenizedString
 
 
@@ -282,6 +284,25 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
     `frozenset` of `Platform` instances at instantiation.
     """
 
+    bootstrapped_by: ClassVar[tuple[str, str] | None] = None
+    """`(manager_id, package_id)` of the package another manager installs to
+    provide this manager's CLI, or `None` if it has no such bootstrap.
+
+    Consumed by `mpm restore`: on a machine where this manager is not available
+    yet, its section is restored after the section of `manager_id`, provided that
+    section lists `package_id`. The manager is then probed again and restored if
+    its CLI showed up.
+    """
+
+    watch_paths: tuple[str, ...] = ()
+    """Files and directories holding the manager's record of installed packages.
+
+    Consumed by `mpm watch`, which re-queries the manager when one of them changes.
+    A path may start with `~` and reference environment variables: it is expanded
+    at watch time, and skipped if a variable is unset or the path's parent does not
+    exist. List every conventional location, as only the existing ones are watched.
+    """
+
     requirement: str | None = None
     """Version requirement specifier.
 
@@ -352,8 +373,8 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         if not output:
             return None
         try:
-            return json.loads(output)
-        except json.JSONDecodeError as ex:
+            return loads(output)
+        except ValueError as ex:
             logging.warning(
                 f"Could not parse JSON output: {ex}",
                 extra={"label": self.id},
@@ -398,6 +419,7 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         *,
         list_path: str | None = None,
         fields: Mapping[str, str],
+        stream: bool = False,
     ) -> Iterator[Package]:
         """Yield one package per item of a JSON listing.
 
@@ -413,24 +435,58 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         index, like `version` or `versions[0]` (see
         {data}`JSON_FIELD_SELECTOR_REGEX`). Items missing their `package_id`
         and fields resolving to `None` are dropped.
+
+        `stream` trades decoding speed for memory, for managers whose listings
+        run into megabytes of fields mpm never reads: items are then decoded one
+        at a time by {func}`~meta_package_manager.json_decoder.iter_json_items`,
+        and only the packages mapped from them are kept. The whole document is
+        still decoded before the first package is yielded, so a malformed
+        payload yields nothing either way.
         """
+        if stream:
+            if not output:
+                return
+            try:
+                packages = [
+                    package
+                    for item in iter_json_items(output, list_path)
+                    if (package := self._json_package(item, fields)) is not None
+                ]
+            except ValueError as ex:
+                logging.warning(
+                    f"Could not parse JSON output: {ex}",
+                    extra={"label": self.id},
+                )
+                return
+            yield from packages
+            return
+
         data = self.parse_json(output)
         if data is None:
             return
         for item in _navigate_json(data, list_path):
-            if not isinstance(item, dict):
-                continue
-            raw_id = _json_field(item, fields["package_id"])
-            if not raw_id:
+            package = self._json_package(item, fields)
+            if package is not None:
+                yield package
+
+    def _json_package(self, item: object, fields: Mapping[str, str]) -> Package | None:
+        """Map one JSON `item` of a listing to a package, per `fields`.
+
+        `None` for an item that is not an object, or is missing its `package_id`.
+        """
+        if not isinstance(item, dict):
+            return None
+        raw_id = _json_field(item, fields["package_id"])
+        if not raw_id:
+            return None
+        kwargs = {"id": str(raw_id)}
+        for field, selector in fields.items():
+            if field == "package_id":
                 continue
-            kwargs = {"id": str(raw_id)}
-            for field, selector in fields.items():
-                if field == "package_id":
-                    continue
-                value = _json_field(item, selector)
-                if value is not None:
-                    kwargs[field] = str(value)
-            yield self.package(**kwargs)
+            value = _json_field(item, selector)
+            if value is not None:
+                kwargs[field] = str(value)
+        return self.package(**kwargs)
 
     def package(self, **kwargs) -> Package:
         """Instantiate a `Package` object from the manager.
@@ -589,6 +645,61 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         """
         return {pkg.id: pkg.installed_version for pkg in self.installed}
 
+    def gather(self, *queries: Callable[[], Any]) -> tuple[Any, ...]:
+        """Run independent read-only sub-queries, concurrently when allowed.
+
+        For operations composed of several CLI calls that do not depend on each
+        other's output, like an `outdated` listing lacking installed versions
+        and the {attr}`installed_version_map` filling them in. Run in sequence,
+        they cost the sum of their latencies; run here, the slowest of them.
+
+        Queries run in a thread pool sized to their count, capped by {attr}`jobs`,
+        and fall back to the given order, one at a time, when the manager does not
+        allow {attr}`concurrent_reads`. Results come back in argument order, and
+        an exception raised by any query propagates to the caller.
+        """
+        jobs = len(queries) if self.concurrent_reads else 1
+        if self.jobs is not None:
+            jobs = min(jobs, self.jobs)
+        return tuple(run_jobs(lambda query: query(), queries, jobs=jobs))
+
+    def bulk_metadata(self) -> dict[str, PackageMetadata]:
+        """Rich metadata for every installed package, keyed by package ID.
+
+        Optional. The extension point behind the base
+        {meth}`package_metadata_batch`: a manager that can describe its whole
+        inventory in **one** go (a single CLI call, or a single scan of an
+        on-disk database) implements this and inherits the batching, caching
+        and error handling for free.
+
+        Implementations must never spawn per package. The hook is read from
+        inside the manager's own `sbom` fetch lane, so a process per package
+        would serialize hundreds of calls behind each other and make
+        `--bundled` scale with the inventory size instead of with the number
+        of managers.
+        """
+        raise NotImplementedError
+
+    @cached_property
+    def metadata_index(self) -> dict[str, PackageMetadata]:
+        """{meth}`bulk_metadata` materialized once per manager instance.
+
+        Empty for managers not implementing the hook, and for those whose bulk
+        query failed: enrichment is best-effort, and a broken extractor must
+        degrade its packages to {data}`meta_package_manager.package.EMPTY_METADATA`
+        rather than abort the export.
+        """
+        if not self._defines("bulk_metadata"):
+            return {}
+        try:
+            return self.bulk_metadata()
+        except Exception as exc:  # noqa: BLE001
+            logging.debug(
+                f"Bulk metadata extraction failed: {exc}",
+                extra={"label": self.id},
+            )
+            return {}
+
     def package_metadata_batch(
         self,
         packages: Iterable[Package],
@@ -598,13 +709,15 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
 
         Called by `mpm sbom` in `--bundled` mode to populate licenses,
         checksums, download URLs, supplier/originator, and the declared
-        dependency graph. The base implementation yields
-        {data}`meta_package_manager.package.EMPTY_METADATA` for each package and stays compatible
-        with managers that do not (yet) expose richer metadata: their SBOM
-        entries stay at the minimal `Package` level, matching the
-        historical and `--minimal` modes.
+        dependency graph. The base implementation looks each package up in
+        {attr}`metadata_index`, falling back to
+        {data}`meta_package_manager.package.EMPTY_METADATA` for the ones it
+        does not cover. Managers not implementing {meth}`bulk_metadata` thus
+        stay at the minimal `Package` level, matching the historical and
+        `--minimal` modes.
 
-        Manager subclasses override this with their native query path:
+        Managers whose native query path does not fit the all-inventory
+        {meth}`bulk_metadata` shape override this directly instead:
 
         - bulk shell-outs when the CLI accepts a package list
           (`brew info --json=v2 --installed`, `dpkg-query -W`,
@@ -613,6 +726,10 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
           (pip's `.dist-info` directories, Homebrew's per-formula
           `sbom.spdx.json`, dpkg's `.md5sums`).
 
+        Either way, the number of processes spawned must not depend on the
+        number of packages: `tests.test_managers.test_bulk_metadata_process_count`
+        holds every {meth}`bulk_metadata` implementation to that.
+
         The yielded pairs do not need to preserve the input order; the SBOM
         renderer matches by `Package` identity. Implementations are
         expected to swallow per-package extraction errors and yield
@@ -634,8 +751,12 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         `--bundled`.
         ```
         """
-        for package in packages:
-            yield package, EMPTY_METADATA
+        package_list = list(packages)
+        if not package_list:
+            return
+        index = self.metadata_index
+        for package in package_list:
+            yield package, index.get(package.id, EMPTY_METADATA)
 
     @property
     def outdated(self) -> Iterator[Package]:
@@ -670,11 +791,44 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         `mpm cleanup --orphans` removes the orphans, this query only reports them,
         through the manager's native listing (`pacman --query --deps --unrequired`,
         `brew autoremove --dry-run`, `dnf repoquery --unneeded`, ...).
-        {program}`mpm` builds no dependency graph: the manager decides what is
-        orphaned.
+
+        A manager with no native listing but implementing {meth}`dependency_graph`
+        is backfilled by this base implementation, which computes the orphans
+        in-process and lists them in removal order.
 
         Optional. Will be simply skipped by {program}`mpm` if not implemented.
         """
+        if not self._defines("dependency_graph"):
+            raise NotImplementedError
+        return iter(self.dependency_graph().orphans())
+
+    def dependency_graph(self) -> DependencyGraph:
+        """Link the installed packages by their declared dependencies.
+
+        Optional. The extension point behind the in-process orphan detection of
+        {mod}`meta_package_manager.dependency_graph`. A manager whose metadata
+        records both the dependencies of each installed package and its
+        {attr}`~meta_package_manager.package.PackageMetadata.installed_on_request`
+        reason implements this, typically as a
+        {meth}`~meta_package_manager.dependency_graph.DependencyGraph.from_metadata`
+        call over {meth}`package_metadata_batch`. It then inherits the
+        {attr}`orphans` query and the {meth}`cleanup_orphan` sweep.
+
+        Like {meth}`bulk_metadata`, implementations must never spawn per package.
+        """
+        raise NotImplementedError
+
+    @property
+    def installable(self) -> Iterator[Package]:
+        """List every package installable from the manager's synced repositories.
+
+        Optional. The feed of the offline catalog of
+        {mod}`meta_package_manager.catalog`, ingested by `mpm sync --catalog` and
+        queried by `mpm search --offline`. Must read the local copy of the
+        repository indexes, as refreshed by {meth}`sync`, in a single call: never
+        a remote registry, never a call per package. Packages only need their
+        `id`, and if known their `name`, `description` and `latest_version`.
+        """
         raise NotImplementedError
 
     def search(self, query: str, extended: bool, exact: bool) -> Iterator[Package]:
@@ -719,11 +873,11 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         capabilities of the package manager CLI.
         ```
         """
-        for match in self.search(query, extended, exact):
-            # The per-package match decision lives on the data model, shared with
-            # the `installed` and `outdated` query filters.
-            if match.matches(query, extended, exact):
-                yield match
+        # The per-package match decision lives on the data model, shared with
+        # the `installed` and `outdated` query filters.
+        yield from QueryMatcher(query, extended, exact).filter(
+            self.search(query, extended, exact)
+        )
 
     def install(self, package_id: str, version: str | None = None) -> str:
         """Install one package and one only.
@@ -747,6 +901,16 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         """
         raise NotImplementedError
 
+    def upgrade_many_cli(self, package_ids: Sequence[str]) -> tuple[str, ...]:
+        """Returns the complete CLI to upgrade all the packages given, in one call.
+
+        Optional. For managers with no full upgrade one-liner, but whose upgrade
+        command accepts several package IDs. The synthesized full upgrade of
+        {meth}`upgrade` then upgrades every outdated package in a single call (one
+        dependency resolution, one process) instead of one call per package.
+        """
+        raise NotImplementedError
+
     def upgrade(self, package_id: str | None = None, version: str | None = None) -> str:
         """Perform an upgrade of either all or one package.
 
@@ -761,6 +925,11 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         each package will be updated one by one by calling
         {meth}`meta_package_manager.manager.PackageManager.upgrade_one_cli`.
 
+        Managers implementing
+        {meth}`meta_package_manager.manager.PackageManager.upgrade_many_cli` get
+        all outdated packages upgraded in a single call instead, bisected on
+        failure to isolate the packages that cannot upgrade.
+
         See for example the case of
         {meth}`meta_package_manager.managers.pip.Pip.upgrade_one_cli`.
         """
@@ -781,6 +950,11 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
                 # the plan lists the actual per-package upgrade commands.
                 with self.acting_as("outdated"):
                     outdated_packages = tuple(self.refiltered_outdated)
+                if self._defines("upgrade_many_cli"):
+                    return self._upgrade_batch(
+                        [package.id for package in outdated_packages],
+                        stop_on_error=self.stop_on_error,
+                    )
                 logs = []
                 for package in outdated_packages:
                     output = self.upgrade(package.id)
@@ -790,6 +964,44 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
 
         return self.run(cli, extra_env=self.extra_env)
 
+    def _upgrade_batch(self, package_ids: Sequence[str], stop_on_error: bool) -> str:
+        """Upgrade `package_ids` with {meth}`upgrade_many_cli`, bisecting failures.
+
+        A failed batch is split in halves, each retried on its own, until the
+        failures are narrowed down to the packages that cannot upgrade: a single
+        broken package costs about `2 log2(n)` extra calls, instead of holding back
+        every other package or falling back to `n` calls. The errors of the
+        intermediate batches are dropped once bisected, so only the culprits are
+        reported, and raised if `stop_on_error` is set. A timeout or an interrupt
+        is not bisected: smaller batches would only time out again.
+        """
+        if not package_ids:
+            return ""
+        mark = len(self.cli_errors)
+        try:
+            # Strict failure detection: a non-zero exit fails the batch, even when
+            # the manager left <stderr> empty.
+            with self.acting_as(stop_on_error=True):
+                return self.run(
+                    self.upgrade_many_cli(package_ids), extra_env=self.extra_env
+                )
+        except CLIError as ex:
+            if len(package_ids) == 1 or ex.code is None:
+                if stop_on_error:
+                    raise
+                return ""
+        del self.cli_errors[mark:]
+        middle = len(package_ids) // 2
+        logging.info(
+            f"Upgrade of {len(package_ids)} packages failed. Retry in two batches.",
+            extra={"label": self.id},
+        )
+        logs = (
+            self._upgrade_batch(package_ids[:middle], stop_on_error),
+            self._upgrade_batch(package_ids[middle:], stop_on_error),
+        )
+        return "\n".join(log for log in logs if log)
+
     def remove(self, package_id: str) -> str:
         """Remove one package and one only.
 
@@ -797,6 +1009,16 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         """
         raise NotImplementedError
 
+    def remove_many(self, package_ids: Sequence[str]) -> str:
+        """Remove several packages in a single call, in the order given.
+
+        Optional. Managers whose removal command accepts several package IDs
+        implement this, so a batched removal like the synthesized
+        {meth}`cleanup_orphan` costs one process instead of one per package.
+        Callers fall back to {meth}`remove` in a loop when it is not implemented.
+        """
+        raise NotImplementedError
+
     def remove_orphan(self, package_id: str) -> str:
         """Remove one package together with the dependencies it alone pulled in.
 
@@ -868,11 +1090,16 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
 
         Distinct from
         {meth}`meta_package_manager.manager.PackageManager.remove_orphan`, which is
-        scoped to one package's own orphaned dependencies. As with {meth}`cleanup`,
-        {program}`mpm` builds no dependency graph: the manager decides what is orphaned.
+        scoped to one package's own orphaned dependencies.
+
+        A manager with no native sweep verb but implementing
+        {meth}`dependency_graph` gets the sweep computed in-process: the whole
+        transitive closure of orphans is removed in one batch, each package before
+        its own dependencies, through {meth}`remove_many` when available.
 
-        A manager with no native sweep verb is backfilled by this base implementation
-        when it supports both the {attr}`orphans` query and package removal: list
+        Otherwise, a manager with no native sweep verb is backfilled by this base
+        implementation when it supports both the {attr}`orphans` query and package
+        removal: list
         the orphans, remove each one (with {meth}`remove_orphan` when available, so
         every listed root takes its own now-orphaned subtree along), then re-query and
         repeat until the listing settles, since removing an orphan can orphan its own
@@ -885,6 +1112,18 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
         query propagates {exc}`NotImplementedError`, and `mpm cleanup --orphans`
         simply skips it.
         """
+        if self._defines("dependency_graph"):
+            logging.debug(
+                "No native orphan sweep. Remove orphans of the dependency graph.",
+                extra={"label": self.id},
+            )
+            # A read-only query, like the orphans listing below.
+            with self.acting_as("orphans"):
+                orphans = self.dependency_graph().orphans()
+            if orphans:
+                self._remove_packages([package.id for package in orphans])
+            return
+
         logging.debug(
             "No native orphan sweep. Remove listed orphans one by one.",
             extra={"label": self.id},
@@ -908,6 +1147,14 @@ class PackageManager(CLIExecutor, metaclass=MetaPackageManager):
                 except NotImplementedError:
                     self.remove(package_id)
 
+    def _remove_packages(self, package_ids: Sequence[str]) -> None:
+        """Remove `package_ids` in one {meth}`remove_many` call, or one by one."""
+        try:
+            self.remove_many(package_ids)
+        except NotImplementedError:
+            for package_id in package_ids:
+                self.remove(package_id)
+
     def cleanup_cache(self) -> None:
         """Prune the manager's caches, downloads and other left-over artifacts.
 
@@ -38,9 +38,10 @@ class APT(PackageManager):
     Command equivalences with other managers are listed in
     [Pacman/Rosetta](https://wiki.archlinux.org/title/Pacman/Rosetta).
 
-    mpm drives the high-level `apt` binary, not `apt-get` or `apt-cache`,
-    over system-wide packages. Mutations escalate through `sudo` and force
-    `--yes` to stay non-interactive. {class}`APT_Mint` retargets Linux
+    mpm drives the high-level `apt` binary, not `apt-get` or `apt-cache`, over
+    system-wide packages: only {meth}`doctor_cli` and the catalog listing of
+    {attr}`installable` borrow those siblings. Mutations escalate through `sudo`
+    and force `--yes` to stay non-interactive. {class}`APT_Mint` retargets Linux
     Mint's same-named but differently-behaved `apt`.
 
     ```{note}
@@ -66,6 +67,9 @@ class APT(PackageManager):
 
     platforms = UNIX_WITHOUT_MACOS
 
+    watch_paths = ("/var/lib/dpkg/status",)
+    """dpkg's database, rewritten by every transaction."""
+
     default_sudo = True
 
     requirement = ">=1.0.0"
@@ -181,6 +185,51 @@ class APT(PackageManager):
         output = self.run_cli("autoremove", "--simulate")
         yield from self.parse_regex_lines(self._ORPHANS_REGEXP, output)
 
+    @property
+    def installable(self) -> Iterator[Package]:
+        """Fetch all packages available from the synced repositories.
+
+        `apt-cache dumpavail` prints the record of the candidate version of each
+        package, straight from the local package lists. Only the first line of
+        the description, its synopsis, is kept.
+
+        ```{code-block} shell-session
+
+        $ apt-cache --quiet dumpavail
+        Package: sed
+        Architecture: amd64
+        Version: 4.9-2
+        Priority: required
+        Section: utils
+        Description: GNU stream editor for filtering/transforming text
+         sed reads the specified files or the standard input if no
+         files are specified.
+
+        Package: sendmail-bin
+        Architecture: amd64
+        Version: 8.17.1.9-2
+        Priority: optional
+        Section: mail
+        Description: powerful, efficient, and scalable Mail Transport Agent
+         Sendmail is an alternative Mail Transport Agent (MTA) for Debian.
+        ```
+        """
+        output = self.run_cli(
+            "dumpavail", override_cli_path=self.sibling_cli("apt-cache")
+        )
+        for stanza in output.split("\n\n"):
+            fields = {}
+            for line in stanza.splitlines():
+                key, sep, value = line.partition(": ")
+                if sep and not line[0].isspace():
+                    fields[key] = value.strip()
+            if "Package" in fields:
+                yield self.package(
+                    id=fields["Package"],
+                    description=fields.get("Description"),
+                    latest_version=fields.get("Version"),
+                )
+
     def search(self, query: str, extended: bool, exact: bool) -> Iterator[Package]:
         """Fetch matching packages.
 
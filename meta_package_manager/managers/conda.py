@@ -16,10 +16,24 @@
 
 from __future__ import annotations
 
+import json
+import logging
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlparse
+
 from extra_platforms import LINUX_LIKE, MACOS, WINDOWS
 
 from ..capabilities import search_capabilities
 from ..manager import PackageManager
+from ..package import (
+    Checksum,
+    ChecksumAlgorithm,
+    Dependency,
+    PackageMetadata,
+    Supplier,
+)
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -87,6 +101,8 @@ class Conda(PackageManager):
     ```
     """
 
+    _SUBDIR_REGEXP = re.compile(r"^(noarch|[a-z]+-[a-z0-9_]+)$")
+
     @property
     def installed(self) -> Iterator[Package]:
         """Fetch installed packages.
@@ -119,9 +135,124 @@ class Conda(PackageManager):
         ```
         """
         output = self.run_cli("list", "--json", must_succeed=True)
+        # Environments of thousands of packages print megabytes of records, of
+        # which only two fields are read.
         yield from self.parse_json_items(
             output,
             fields={"package_id": "name", "installed_version": "version"},
+            stream=True,
+        )
+
+    def bulk_metadata(self) -> dict[str, PackageMetadata]:
+        """Rich metadata of all packages of the active environment, read from its
+        `conda-meta` directory.
+
+        `conda list --json` only carries the channel coordinates. The license,
+        the checksums, the download URL and the declared dependencies live in
+        the per-package records conda keeps under `<prefix>/conda-meta/`, so the
+        whole inventory costs one `conda info` call to resolve the prefix, then
+        a directory scan:
+
+        ```{code-block} shell-session
+
+        $ conda info --json
+        {
+          "active_prefix": null,
+          "default_prefix": "/opt/miniconda",
+          (...)
+        }
+        $ cat /opt/miniconda/conda-meta/pip-25.1-pyhc872135_2.json
+        {
+          "build": "pyhc872135_2",
+          "channel": "https://repo.anaconda.com/pkgs/main/noarch",
+          "depends": ["python >=3.9,<3.14.0a0", "setuptools", "wheel"],
+          "license": "MIT",
+          "md5": "2778327d2a700153fefe0e69438b18e1",
+          "name": "pip",
+          "sha256": "dc705c852ed94395f0b75cf65aa0f230adfb74cda46c9daca6df94fca0b90bb7",
+          "subdir": "noarch",
+          "timestamp": 1746204037000,
+          "url": "https://repo.anaconda.com/pkgs/main/noarch/pip-25.1-pyhc872135_2.conda",
+          "version": "25.1",
+          (...)
+        }
+        ```
+        """
+        info = self.parse_json(self.run_cli("info", "--json", must_succeed=True))
+        prefix = None
+        if isinstance(info, dict):
+            prefix = info.get("active_prefix") or info.get("default_prefix")
+        if not prefix:
+            return {}
+
+        metadata: dict[str, PackageMetadata] = {}
+        for record_path in Path(prefix).joinpath("conda-meta").glob("*.json"):
+            try:
+                record = json.loads(record_path.read_bytes())
+            except (OSError, ValueError) as exc:
+                logging.debug(
+                    f"Skip unreadable {record_path}: {exc}", extra={"label": self.id}
+                )
+                continue
+            if isinstance(record, dict) and record.get("name"):
+                metadata[record["name"]] = self._record_metadata(record)
+        return metadata
+
+    @staticmethod
+    def _record_metadata(record: dict) -> PackageMetadata:
+        """Map one `conda-meta` package record into the portable
+        {class}`PackageMetadata`.
+        """
+        supplier = None
+        channel_url = record.get("channel")
+        if channel_url:
+            # Reduce the channel URL to its canonical name (`conda-forge`,
+            # `pkgs/main`) by dropping the host and the platform subdir. The
+            # latter is not always the record's own `subdir`: a `noarch` package
+            # is recorded against the channel of the platform it was solved for.
+            parts = urlparse(channel_url).path.strip("/").split("/")
+            if len(parts) > 1 and Conda._SUBDIR_REGEXP.match(parts[-1]):
+                parts.pop()
+            supplier = Supplier(name="/".join(parts) or channel_url, url=channel_url)
+
+        checksums = tuple(
+            Checksum(algorithm, record[key])
+            for key, algorithm in (
+                ("sha256", ChecksumAlgorithm.SHA256),
+                ("md5", ChecksumAlgorithm.MD5),
+            )
+            if record.get(key)
+        )
+
+        # Match specs are `<name> [<version constraint> [<build>]]`.
+        dependencies = []
+        for spec in record.get("depends") or ():
+            target_id, _, constraint = spec.partition(" ")
+            dependencies.append(
+                Dependency(target_id=target_id, version_constraint=constraint or None)
+            )
+
+        build_date = None
+        if record.get("timestamp"):
+            # Milliseconds since the epoch.
+            build_date = datetime.fromtimestamp(
+                record["timestamp"] / 1000, tz=timezone.utc
+            )
+
+        extras: dict[str, object] = {}
+        for key in ("build", "subdir", "license_family"):
+            if record.get(key):
+                extras[f"conda.{key}"] = record[key]
+
+        return PackageMetadata(
+            download_url=record.get("url") or None,
+            distribution_url=channel_url or None,
+            license_declared=record.get("license") or None,
+            supplier=supplier,
+            dependencies=tuple(dependencies),
+            checksums=checksums,
+            build_date=build_date,
+            extras=extras,
         )
 
     @property
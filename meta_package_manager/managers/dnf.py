@@ -69,6 +69,9 @@ class DNF(PackageManager):
 
     platforms = UNIX_WITHOUT_MACOS
 
+    watch_paths = ("/var/lib/rpm", "/usr/lib/sysimage/rpm")
+    """The RPM database, moved under `/usr` by recent Fedora releases."""
+
     default_sudo = True
 
     requirement = ">=4.0.0"
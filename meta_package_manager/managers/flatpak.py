@@ -22,6 +22,7 @@ from extra_platforms import UNIX_WITHOUT_MACOS
 
 from ..capabilities import search_capabilities, version_not_implemented
 from ..manager import PackageManager
+from ..package import PackageMetadata, Supplier
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -36,8 +37,7 @@ class Flatpak(PackageManager):
 
     mpm covers applications only: every listing passes `--app`, so runtimes
     and SDKs stay out of scope. Listings are requested with
-    `--columns=name,application,version --ostree-verbose` and parsed as
-    tab-separated rows.
+    `--columns=name,application,version` and parsed as tab-separated rows.
 
     ```{note}
     All operations target the system-wide scope except `cleanup` which only
@@ -78,6 +78,9 @@ class Flatpak(PackageManager):
 
     platforms = UNIX_WITHOUT_MACOS
 
+    watch_paths = ("/var/lib/flatpak/app",)
+    """The system installation's applications, the scope mpm targets."""
+
     requirement = ">=1.2.0"
 
     _LIST_REGEXP = re.compile(
@@ -110,8 +113,7 @@ class Flatpak(PackageManager):
 
         ```{code-block} shell-session
 
-        $ flatpak list --app --columns=name,application,version \
-        > --ostree-verbose
+        $ flatpak list --app --columns=name,application,version
         Peek	com.uploadedlobster.peek	1.3.1
         Fragments	de.haeckerfelix.Fragments	1.4
         GNOME MPV	io.github.GnomeMpv	0.16
@@ -123,7 +125,6 @@ class Flatpak(PackageManager):
             "list",
             "--app",
             "--columns=name,application,version",
-            "--ostree-verbose",
         )
 
         for package in output.splitlines():
@@ -136,14 +137,62 @@ class Flatpak(PackageManager):
                     installed_version=installed_version,
                 )
 
+    def bulk_metadata(self) -> dict[str, PackageMetadata]:
+        """Rich metadata of all installed applications, from a single
+        `flatpak list` call.
+
+        The listing exposes more columns than the inventory needs, which is
+        enough to tell where each application came from and which commit of
+        which branch is deployed:
+
+        ```{code-block} shell-session
+
+        $ flatpak list --app \
+        > --columns=application,description,origin,installation,branch,arch,active
+        com.uploadedlobster.peek	Simple screen recorder	flathub	system	stable	x86_64	8c5a1a6c1b05
+        de.haeckerfelix.Fragments	A BitTorrent Client	flathub	user	stable	x86_64	0e3b4d1c4c2a
+        ```
+        """
+        output = self.run_cli(
+            "list",
+            "--app",
+            "--columns=application,description,origin,installation,branch,arch,active",
+        )
+
+        metadata: dict[str, PackageMetadata] = {}
+        for line in output.splitlines():
+            columns = line.split("\t")
+            if len(columns) != 7 or not columns[0]:
+                continue
+            package_id, description, origin, installation, branch, arch, commit = (
+                column.strip() for column in columns
+            )
+            extras: dict[str, object] = {
+                key: value
+                for key, value in (
+                    ("flatpak.origin", origin),
+                    ("flatpak.installation", installation),
+                    ("flatpak.branch", branch),
+                    ("flatpak.arch", arch),
+                    ("flatpak.commit", commit),
+                )
+                if value
+            }
+            metadata[package_id] = PackageMetadata(
+                supplier=Supplier(name=origin) if origin else None,
+                description=description or None,
+                summary=description or None,
+                extras=extras,
+            )
+        return metadata
+
     @property
     def outdated(self) -> Iterator[Package]:
         """Fetch outdated packages.
 
         ```{code-block} shell-session
 
-        $ flatpak remote-ls --app --updates --columns=name,application,version \
-            --ostree-verbose
+        $ flatpak remote-ls --app --updates --columns=name,application,version
         GNOME Dictionary	org.gnome.Dictionary	3.26.0
         Files	org.gnome.Nautilus	42.2
         ```
@@ -153,7 +202,6 @@ class Flatpak(PackageManager):
             "--app",
             "--updates",
             "--columns=name,application,version",
-            "--ostree-verbose",
         )
 
         for package in output.splitlines():
@@ -161,11 +209,7 @@ class Flatpak(PackageManager):
             if match:
                 name, package_id, latest_version = match.groups()
 
-                info_installed_output = self.run_cli(
-                    "info",
-                    "--ostree-verbose",
-                    package_id,
-                )
+                info_installed_output = self.run_cli("info", package_id)
 
                 current_version = re.search(
                     r"version:\s(?P<version>\S.*?)\n",
@@ -184,6 +228,39 @@ class Flatpak(PackageManager):
                     installed_version=installed_version,
                 )
 
+    @property
+    def installable(self) -> Iterator[Package]:
+        """Fetch all applications available from the configured remotes.
+
+        Reads the remotes' summaries as cached by the last {meth}`sync`.
+
+        ```{code-block} shell-session
+
+        $ flatpak remote-ls --app --cached \
+        > --columns=name,description,application,version
+        gitg	GUI for git	org.gnome.gitg	3.32.1
+        Peek	Simple animated GIF screen recorder	com.uploadedlobster.peek	1.5.1
+        ```
+        """
+        output = self.run_cli(
+            "remote-ls",
+            "--app",
+            "--cached",
+            "--columns=name,description,application,version",
+        )
+
+        for line in output.splitlines():
+            fields = line.split("\t")
+            if len(fields) != 4 or not fields[2]:
+                continue
+            name, description, package_id, version = fields
+            yield self.package(
+                id=package_id,
+                name=name or None,
+                description=description or None,
+                latest_version=version or None,
+            )
+
     @search_capabilities(extended_support=False, exact_support=False)
     def search(self, query: str, extended: bool, exact: bool) -> Iterator[Package]:
         """Fetch matching packages.
@@ -197,11 +274,11 @@ class Flatpak(PackageManager):
 
         ```{code-block} shell-session
 
-        $ flatpak search gitg --ostree-verbose
+        $ flatpak search gitg
         gitg    GUI for git        org.gnome.gitg  3.32.1  stable  flathub
         ```
         """
-        output = self.run_cli("search", query, "--ostree-verbose")
+        output = self.run_cli("search", query)
 
         for (
             package_name,
@@ -16,12 +16,16 @@
 
 from __future__ import annotations
 
+import logging
+import os
 import re
+from pathlib import Path
 
 from extra_platforms import ALL_PLATFORMS
 
 from ..capabilities import search_capabilities, version_not_implemented
 from ..manager import PackageManager
+from ..package import Originator, PackageMetadata, Supplier
 from ..version import parse_version
 
 TYPE_CHECKING = False
@@ -92,6 +96,12 @@ class Gem(PackageManager):
     _VERSION_SPLITTER = re.compile(r",|default:| ")
     _INSTALLED_REGEXP = re.compile(r"(\S+) \((.+)\)")
     _OUTDATED_REGEXP = re.compile(r"(\S+) \((\S+) < (\S+)\)")
+    _DETAILS_FIELD_REGEXP = re.compile(
+        r"^ {4}(?P<field>Authors?|Homepage|Licenses?|Installed at|Platform)"
+        r"(?: \([^)]*\))?: ?(?P<value>.*)$"
+    )
+    _STUB_PREFIX = "# stub: "
+    _GEMRC_PATH_REGEXP = re.compile(r"^:?gem(?:home|path):", re.MULTILINE)
     _SEARCH_REGEXP = re.compile(
         r"""
         (?P<package_id>\S+)     # Any string.
@@ -104,10 +114,125 @@ class Gem(PackageManager):
         re.VERBOSE,
     )
 
+    def _gem_dirs(self) -> tuple[Path, ...] | None:
+        """Gem directories searched by `gem list`, default directory last.
+
+        Ruby installs `gem` as `<prefix>/bin/gem`, next to a single default gem
+        directory, `<prefix>/lib/ruby/gems/<ABI version>`. RubyGems searches the
+        user directory before it, `~/.gem/ruby/<ABI version>` (or its XDG
+        counterpart when `~/.gem` does not exist).
+
+        Returns `None` whenever the search path may differ from this default:
+        `GEM_HOME` or `GEM_PATH` set, a `gemhome` or `gempath` in a `gemrc`, a
+        Ruby patched by its distribution through `operating_system.rb` (like
+        Debian's), or several ABI versions under the same prefix.
+        """
+        if not self.cli_path or self.cli_path.resolve().parent.name != "bin":
+            return None
+        env = {**os.environ, **(self.extra_env or {})}
+        if env.get("GEM_HOME") or env.get("GEM_PATH"):
+            return None
+        prefix = self.cli_path.resolve().parent.parent
+        for gemrc in (Path.home() / ".gemrc", prefix / "etc" / "gemrc"):
+            try:
+                content = gemrc.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            except (OSError, UnicodeDecodeError):
+                return None
+            if self._GEMRC_PATH_REGEXP.search(content):
+                return None
+        for pattern in (
+            "lib/ruby/*/rubygems/defaults/operating_system.rb",
+            "lib/ruby/*/*/rubygems/defaults/operating_system.rb",
+            "lib/ruby/vendor_ruby/rubygems/defaults/operating_system.rb",
+        ):
+            if any(prefix.glob(pattern)):
+                return None
+        abi_dirs = list((prefix / "lib" / "ruby" / "gems").glob("*"))
+        if len(abi_dirs) != 1 or not abi_dirs[0].is_dir():
+            return None
+        default_dir = abi_dirs[0]
+
+        home = Path.home()
+        if (home / ".gem").is_dir():
+            user_root = home / ".gem"
+        else:
+            data_home = os.environ.get("XDG_DATA_HOME") or home / ".local" / "share"
+            user_root = Path(data_home) / "gem"
+        return user_root / "ruby" / default_dir.name, default_dir
+
+    def _read_stub(self, spec_path: Path) -> tuple[str, str, str]:
+        """Name, version and platform of the gem specification at `spec_path`.
+
+        RubyGems writes them on a comment line at the top of each installed
+        specification, so it never has to evaluate the Ruby code below just to
+        list gems:
+
+        ```{code-block} ruby
+
+        # -*- encoding: utf-8 -*-
+        # stub: nokogiri 1.15.4 x86_64-linux lib
+        ```
+
+        Raises {exc}`ValueError` on a specification without that line.
+        """
+        with spec_path.open(encoding="utf-8") as spec:
+            for line in (spec.readline(), spec.readline()):
+                if line.startswith(self._STUB_PREFIX):
+                    name, version, platform, *_ = line[
+                        len(self._STUB_PREFIX) :
+                    ].split()
+                    return name, version, platform
+        msg = f"no stub line in {spec_path}"
+        raise ValueError(msg)
+
+    def _list_specifications(self) -> str | None:
+        """Render the output of `gem list` from the installed specifications.
+
+        Each gem directory holds one `specifications/<gem>-<version>.gemspec`
+        per installed gem, and the default directory a
+        `specifications/default` subdirectory for the gems bundled with Ruby.
+
+        Returns `None` if the gem directories are not the default ones, or if a
+        specification has no stub line.
+        """
+        gem_dirs = self._gem_dirs()
+        if gem_dirs is None:
+            return None
+        versions: dict[str, dict[str, str]] = {}
+        try:
+            spec_dirs = [
+                (gem_dir / "specifications", "") for gem_dir in gem_dirs
+            ] + [(gem_dirs[-1] / "specifications" / "default", "default: ")]
+            for spec_dir, label in spec_dirs:
+                if not spec_dir.is_dir():
+                    continue
+                for spec_path in spec_dir.glob("*.gemspec"):
+                    name, version, platform = self._read_stub(spec_path)
+                    if platform != "ruby":
+                        version = f"{version} {platform}"
+                    versions.setdefault(name, {}).setdefault(
+                        f"{label}{version}", version
+                    )
+        except (OSError, UnicodeDecodeError, ValueError) as exc:
+            logging.debug(
+                f"Unrecognized gem specifications: {exc}", extra={"label": self.id}
+            )
+            return None
+        return "\n".join(
+            f"{name} ({', '.join(versions[name])})"
+            for name in sorted(versions, key=str.lower)
+        )
+
     @property
     def installed(self) -> Iterator[Package]:
         """Fetch installed packages.
 
+        Listed from the specifications of the installed gems, which saves the
+        boot of Ruby. `gem` is only asked when its gem directories are not
+        recognized:
+
         ```{code-block} shell-session
 
         $ gem list --quiet
@@ -129,7 +254,9 @@ class Gem(PackageManager):
         test-unit (2.0.0.0)
         ```
         """
-        output = self.run_cli("list")
+        output = self._list_specifications()
+        if output is None:
+            output = self.run_cli("list")
 
         for package in output.splitlines():
             match = self._INSTALLED_REGEXP.match(package)
@@ -143,6 +270,95 @@ class Gem(PackageManager):
                 )
                 yield self.package(id=package_id, installed_version=version)
 
+    def bulk_metadata(self) -> dict[str, PackageMetadata]:
+        """Rich metadata of all installed gems, from a single `gem list` call.
+
+        `--details` prints each gem's specification summary under its listing
+        line. Long fields wrap on continuation lines of the same indentation,
+        and the free-form summary comes last, after a blank line:
+
+        ```{code-block} shell-session
+
+        $ gem list --details --quiet
+        bundler (2.4.10, default: 2.4.1)
+            Authors: André Arko, Samuel Giddins, Colby Swandale, Hiroshi
+            Shibata, David Rodríguez
+            Homepage: https://bundler.io
+            License: MIT
+            Installed at (2.4.10): /usr/lib/ruby/gems/3.2.0
+                         (default): /usr/lib/ruby/gems/3.2.0
+
+            The best way to manage your application's dependencies
+
+        rake (13.0.6)
+            Author: Hiroshi SHIBATA, Eric Hodel, Jim Weirich
+            Homepage: https://github.com/ruby/rake
+            License: MIT
+            Installed at: /usr/lib/ruby/gems/3.2.0
+
+            Rake is a Make-like program implemented in Ruby
+        ```
+        """
+        output = self.run_cli("list", "--details")
+
+        metadata: dict[str, PackageMetadata] = {}
+        for block in re.split(r"\n(?=\S)", output):
+            lines = block.splitlines()
+            if not lines:
+                continue
+            match = self._INSTALLED_REGEXP.match(lines[0])
+            if not match:
+                continue
+            fields: dict[str, str] = {}
+            summary: list[str] = []
+            current = None
+            for line in lines[1:]:
+                if not line.strip():
+                    # The blank line closes the fields, the summary follows.
+                    current = None
+                    summary.append("")
+                    continue
+                if summary:
+                    summary.append(line.strip())
+                    continue
+                field_match = self._DETAILS_FIELD_REGEXP.match(line)
+                if field_match:
+                    current = field_match.group("field").rstrip("s")
+                    fields[current] = field_match.group("value").strip()
+                # Only the first of the per-version install paths is kept.
+                elif current and current != "Installed at":
+                    fields[current] = f"{fields[current]} {line.strip()}"
+            metadata[match.group(1)] = self._details_metadata(
+                fields, " ".join(s for s in summary if s)
+            )
+        return metadata
+
+    @staticmethod
+    def _details_metadata(fields: dict[str, str], summary: str) -> PackageMetadata:
+        """Map the fields of one `gem list --details` entry into the portable
+        {class}`PackageMetadata`.
+        """
+        # RubyGems lets a gem be distributed under any of its listed licenses.
+        licenses = [
+            lic.strip() for lic in fields.get("License", "").split(",") if lic.strip()
+        ]
+        extras: dict[str, object] = {}
+        if fields.get("Installed at"):
+            extras["gem.installed_at"] = fields["Installed at"]
+        if fields.get("Platform"):
+            extras["gem.platform"] = fields["Platform"]
+        return PackageMetadata(
+            homepage=fields.get("Homepage") or None,
+            license_declared=" OR ".join(licenses) or None,
+            supplier=Supplier(name="RubyGems", url="https://rubygems.org"),
+            originator=(
+                Originator(name=fields["Author"]) if fields.get("Author") else None
+            ),
+            description=summary or None,
+            summary=summary or None,
+            extras=extras,
+        )
+
     @property
     def outdated(self) -> Iterator[Package]:
         """Fetch outdated packages.
@@ -19,6 +19,7 @@ from __future__ import annotations
 import json
 import logging
 import re
+from dataclasses import dataclass
 from functools import cached_property
 from operator import methodcaller
 from pathlib import Path
@@ -27,6 +28,7 @@ from typing import ClassVar
 from extra_platforms import LINUX_LIKE, MACOS
 
 from ..capabilities import version_not_implemented
+from ..json_decoder import loads
 from ..manager import PackageManager
 from ..package import (
     EMPTY_METADATA,
@@ -46,6 +48,48 @@ if TYPE_CHECKING:
     from ..package import Package
 
 
+@dataclass(frozen=True)
+class InstallReceipt:
+    """What Homebrew recorded on disk about an installed formula or cask.
+
+    Read from the prefix by {meth}`Brew.install_receipts` and
+    {meth}`Cask.install_receipts`, without running `brew`.
+    """
+
+    package_id: str
+    version: str
+    """Version of the most recent install, as named in the prefix."""
+
+    tap: str | None = None
+    pinned: bool | None = None
+    """`None` when pins are not recorded in the prefix, as for casks."""
+
+    installed_on_request: bool | None = None
+    poured_from_bottle: bool | None = None
+    runtime_dependencies: tuple[str, ...] = ()
+
+    @property
+    def metadata(self) -> PackageMetadata:
+        """The subset of {class}`PackageMetadata` a receipt can fill in."""
+        extras: dict[str, object] = {}
+        if self.tap:
+            extras["brew.tap"] = self.tap
+        if self.pinned is not None:
+            extras["brew.pinned"] = self.pinned
+        if self.installed_on_request is not None:
+            extras["brew.installed_on_request"] = self.installed_on_request
+        if self.poured_from_bottle is not None:
+            extras["brew.poured_from_bottle"] = self.poured_from_bottle
+        return PackageMetadata(
+            dependencies=tuple(
+                Dependency(target_id=target_id, scope=DependencyScope.RUNTIME)
+                for target_id in self.runtime_dependencies
+            ),
+            installed_on_request=self.installed_on_request,
+            extras=extras,
+        )
+
+
 class Homebrew(PackageManager):
     """Virtual base shared by the {class}`Brew` and {class}`Cask` managers.
 
@@ -137,6 +181,10 @@ class Homebrew(PackageManager):
     def installed(self) -> Iterator[Package]:
         """Fetch installed packages.
 
+        Read straight from the prefix by {meth}`install_receipts`, which saves
+        the second or more `brew` takes to boot Ruby. Falls back to `brew list`
+        when the prefix layout is not recognized:
+
         ```{code-block} shell-session
 
         $ brew list --versions --formula
@@ -174,6 +222,14 @@ class Homebrew(PackageManager):
         [#17](https://github.com/kdeldycke/meta-package-manager/issues/17).
         ```
         """
+        receipts = self.install_receipts()
+        if receipts is not None:
+            for receipt in receipts.values():
+                yield self.package(
+                    id=receipt.package_id, installed_version=receipt.version
+                )
+            return
+
         output = self.run_cli("list", "--quiet", "--versions")
 
         for package_id, _removed, versions in map(
@@ -186,14 +242,23 @@ class Homebrew(PackageManager):
 
     @cached_property
     def _brew_prefix(self) -> Path | None:
-        """Resolve `brew --prefix` once.
-
-        Used to locate per-formula `<prefix>/Cellar/<formula>/<version>`
-        directories where Homebrew writes `sbom.spdx.json` when
-        installed under `HOMEBREW_SBOM=1`. Returns `None` if the
-        prefix cannot be determined, in which case the extractor falls
-        back to API-only metadata.
+        """Resolve the Homebrew prefix once.
+
+        Used to locate the install receipts read by {meth}`install_receipts`,
+        and the per-formula `<prefix>/Cellar/<formula>/<version>` directories
+        where Homebrew writes `sbom.spdx.json` when installed under
+        `HOMEBREW_SBOM=1`.
+
+        `brew` is installed as `<prefix>/bin/brew` in every default prefix, so
+        the prefix is the grandparent of {attr}`cli_path` whenever it holds a
+        `Cellar` or a `Caskroom`. `brew --prefix` is only asked otherwise.
+        Returns `None` if the prefix cannot be determined, in which case the
+        extractors fall back to the CLI and to API-only metadata.
         """
+        if self.cli_path and self.cli_path.parent.name == "bin":
+            prefix = self.cli_path.parent.parent
+            if (prefix / "Cellar").is_dir() or (prefix / "Caskroom").is_dir():
+                return prefix
         try:
             output = self.run_cli(
                 "--prefix",
@@ -205,6 +270,14 @@ class Homebrew(PackageManager):
         prefix = output.strip()
         return Path(prefix) if prefix else None
 
+    def install_receipts(self) -> dict[str, InstallReceipt] | None:
+        """Read the install receipts of all packages from the prefix, by ID.
+
+        Returns `None` if the prefix is unknown or its layout is not the one
+        expected, for callers to fall back to the `brew` CLI.
+        """
+        raise NotImplementedError
+
     def package_metadata_batch(
         self,
         packages: Iterable[Package],
@@ -222,28 +295,25 @@ class Homebrew(PackageManager):
         Casks reuse the same JSON payload through the `casks` array but
         do not get the SBOM-file treatment (Homebrew does not emit one
         for casks).
+
+        Packages missing from the payload, like formulae from an untapped
+        repository, or all of them if the bulk query fails, get the leaner
+        metadata of their {meth}`install_receipts`.
         """
         package_list = list(packages)
         if not package_list:
             return
 
+        payload = {}
         try:
             output = self.run_cli("info", "--json=v2", "--installed", must_succeed=True)
         except Exception as exc:  # noqa: BLE001
-            # If the bulk query fails, fall back to empty metadata for
-            # every package; the renderer will emit minimal entries.
             logging.debug(f"brew info --json=v2 --installed failed: {exc}")
-            for package in package_list:
-                yield package, EMPTY_METADATA
-            return
-
-        try:
-            payload = json.loads(output) if output else {}
-        except json.JSONDecodeError as exc:
-            logging.debug(f"brew info JSON decode failed: {exc}")
-            for package in package_list:
-                yield package, EMPTY_METADATA
-            return
+        else:
+            try:
+                payload = json.loads(output) if output else {}
+            except json.JSONDecodeError as exc:
+                logging.debug(f"brew info JSON decode failed: {exc}")
 
         formulae_by_name: dict[str, dict] = {}
         for formula in payload.get("formulae") or ():
@@ -263,6 +333,7 @@ class Homebrew(PackageManager):
             if full_token:
                 casks_by_token.setdefault(full_token, cask)
 
+        receipts = None
         for package in package_list:
             formula = formulae_by_name.get(package.id)
             cask = casks_by_token.get(package.id) if not formula else None
@@ -271,7 +342,10 @@ class Homebrew(PackageManager):
             elif cask:
                 yield package, self._cask_metadata(cask)
             else:
-                yield package, EMPTY_METADATA
+                if receipts is None:
+                    receipts = self.install_receipts() or {}
+                receipt = receipts.get(package.id)
+                yield package, receipt.metadata if receipt else EMPTY_METADATA
 
     def _formula_metadata(self, formula: dict) -> PackageMetadata:
         """Map one entry from `brew info --json=v2`'s `formulae` array
@@ -333,6 +407,8 @@ class Homebrew(PackageManager):
             extras["brew.installed_on_request"] = installed["installed_on_request"]
         if installed.get("poured_from_bottle") is not None:
             extras["brew.poured_from_bottle"] = installed["poured_from_bottle"]
+        if formula.get("pinned") is not None:
+            extras["brew.pinned"] = formula["pinned"]
         if formula.get("keg_only"):
             extras["brew.keg_only"] = True
             kor = formula.get("keg_only_reason") or {}
@@ -348,6 +424,7 @@ class Homebrew(PackageManager):
             description=formula.get("desc"),
             summary=formula.get("desc"),
             dependencies=tuple(deps),
+            installed_on_request=installed.get("installed_on_request"),
             checksums=tuple(checksums),
             external_sbom_path=external_sbom_path,
             extras=extras,
@@ -938,10 +1015,97 @@ class Brew(Homebrew):
 
     brewfile_entry_type = "brew"
 
+    watch_paths = (
+        "$HOMEBREW_CELLAR",
+        "/opt/homebrew/Cellar",
+        "/usr/local/Cellar",
+        "/home/linuxbrew/.linuxbrew/Cellar",
+        "~/.linuxbrew/Cellar",
+    )
+    """The Cellar of each default prefix, holding one directory per formula."""
+
     cli_names = ("brew",)
 
     post_args = ("--formula",)
 
+    def install_receipts(self) -> dict[str, InstallReceipt] | None:
+        """Read the receipt of the latest keg of each formula in the Cellar.
+
+        Each installed version of a formula is a keg,
+        `<prefix>/Cellar/<formula>/<version>`, holding an `INSTALL_RECEIPT.json`
+        of how it got installed. Pinned
+        formulae have a symlink to their keg in `<prefix>/var/homebrew/pinned`:
+
+        ```{code-block} shell-session
+
+        $ ls /opt/homebrew/Cellar/wget /opt/homebrew/var/homebrew/pinned
+        /opt/homebrew/Cellar/wget:
+        1.21.4  1.24.5
+
+        /opt/homebrew/var/homebrew/pinned:
+        wget
+        $ cat /opt/homebrew/Cellar/wget/1.24.5/INSTALL_RECEIPT.json
+        {
+          "homebrew_version": "4.3.5",
+          "installed_as_dependency": false,
+          "installed_on_request": true,
+          "poured_from_bottle": true,
+          "runtime_dependencies": [
+            {"full_name": "openssl@3", "version": "3.3.1", (...)},
+            (...)
+          ],
+          "source": {"tap": "homebrew/core", (...)},
+          (...)
+        }
+        ```
+
+        Like `brew list`, hidden entries and formulae without any keg are
+        skipped. A keg without a readable receipt is not a layout mpm knows,
+        and makes the whole read return `None`.
+        """
+        prefix = self._brew_prefix
+        if not prefix:
+            return None
+        pinned_dir = prefix / "var" / "homebrew" / "pinned"
+        receipts: dict[str, InstallReceipt] = {}
+        try:
+            for rack in sorted((prefix / "Cellar").iterdir()):
+                if rack.name.startswith(".") or rack.is_symlink() or not rack.is_dir():
+                    continue
+                kegs = [
+                    keg
+                    for keg in rack.iterdir()
+                    if not keg.name.startswith(".") and keg.is_dir()
+                ]
+                if not kegs:
+                    continue
+                keg = max(kegs, key=lambda keg: parse_version(keg.name))
+                receipt_path = keg / "INSTALL_RECEIPT.json"
+                receipt = loads(receipt_path.read_bytes())
+                if not isinstance(receipt, dict):
+                    msg = f"{receipt_path} is not a JSON object"
+                    raise ValueError(msg)
+                source = receipt.get("source") or {}
+                receipts[rack.name] = InstallReceipt(
+                    package_id=rack.name,
+                    version=keg.name,
+                    tap=source.get("tap"),
+                    pinned=(pinned_dir / rack.name).is_symlink(),
+                    installed_on_request=receipt.get("installed_on_request"),
+                    poured_from_bottle=receipt.get("poured_from_bottle"),
+                    runtime_dependencies=tuple(
+                        dependency["full_name"]
+                        for dependency in receipt.get("runtime_dependencies") or ()
+                        if dependency.get("full_name")
+                    ),
+                )
+        except (AttributeError, OSError, ValueError) as exc:
+            logging.debug(
+                f"Unrecognized Cellar layout: {exc}", extra={"label": self.id}
+            )
+            return None
+        return receipts
+
     @property
     def orphans(self) -> Iterator[Package]:
         """Fetch formulae installed as dependencies that nothing requires anymore.
@@ -1015,6 +1179,9 @@ class Cask(Homebrew):
     platforms = MACOS  # type: ignore[assignment]
     """Casks are only available on macOS, not Linux or WSL."""
 
+    watch_paths = ("/opt/homebrew/Caskroom", "/usr/local/Caskroom")
+    """The Caskroom of each default prefix, holding one directory per cask."""
+
     internal_sudo = True
     """Cask artifacts (`.pkg` installers, kernel extensions) run `sudo` from
     inside `brew`."""
@@ -1023,6 +1190,70 @@ class Cask(Homebrew):
 
     post_args = ("--cask",)
 
+    def install_receipts(self) -> dict[str, InstallReceipt] | None:
+        """Read the install records of each cask in the Caskroom.
+
+        Each install of a cask leaves a `<version>/<timestamp>` directory in
+        `<prefix>/Caskroom/<cask>/.metadata`, the latest timestamp telling the
+        installed version. Recent Homebrew releases also write an
+        `INSTALL_RECEIPT.json` there, carrying the tap:
+
+        ```{code-block} shell-session
+
+        $ cd /opt/homebrew/Caskroom/firefox/.metadata
+        $ ls . *
+        126.0  127.0  INSTALL_RECEIPT.json
+
+        126.0:
+        20240517091511.296
+
+        127.0:
+        20240612174218.101
+        ```
+
+        A cask without any install record is not a layout mpm knows, and
+        makes the whole read return `None`.
+        """
+        prefix = self._brew_prefix
+        if not prefix:
+            return None
+        receipts: dict[str, InstallReceipt] = {}
+        try:
+            for cask_dir in sorted((prefix / "Caskroom").iterdir()):
+                if cask_dir.name.startswith(".") or not cask_dir.is_dir():
+                    continue
+                metadata_dir = cask_dir / ".metadata"
+                installs = [
+                    (timestamp.name, version.name)
+                    for version in metadata_dir.iterdir()
+                    if version.is_dir()
+                    for timestamp in version.iterdir()
+                    if timestamp.is_dir()
+                ]
+                if not installs:
+                    msg = f"no install recorded in {metadata_dir}"
+                    raise ValueError(msg)
+                _, version = max(installs)
+                receipt = {}
+                receipt_path = metadata_dir / "INSTALL_RECEIPT.json"
+                if receipt_path.is_file():
+                    receipt = loads(receipt_path.read_bytes())
+                    if not isinstance(receipt, dict):
+                        msg = f"{receipt_path} is not a JSON object"
+                        raise ValueError(msg)
+                receipts[cask_dir.name] = InstallReceipt(
+                    package_id=cask_dir.name,
+                    version=version,
+                    tap=(receipt.get("source") or {}).get("tap"),
+                    installed_on_request=receipt.get("installed_on_request"),
+                )
+        except (AttributeError, OSError, ValueError) as exc:
+            logging.debug(
+                f"Unrecognized Caskroom layout: {exc}", extra={"label": self.id}
+            )
+            return None
+        return receipts
+
     def upgrade_all_cli(self) -> tuple[str, ...]:
         """Generates the CLI to upgrade all outdated packages.
 
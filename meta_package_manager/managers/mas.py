@@ -71,6 +71,8 @@ class MAS(PackageManager):
 
     platforms = MACOS
 
+    bootstrapped_by = ("brew", "mas")
+
     requirement = ">=7.0.0"
     """[7.0.0](https://github.com/mas-cli/mas/releases/tag/v7.0.0) introduces
     the `--json` flag on `config`, `list`, `lookup`/`info`,
@@ -16,10 +16,26 @@
 
 from __future__ import annotations
 
-from extra_platforms import ALL_PLATFORMS
+import base64
+import binascii
+import logging
+import os
+import re
+from pathlib import Path
+
+from extra_platforms import ALL_PLATFORMS, is_any_windows
 
 from ..capabilities import search_capabilities, version_not_implemented
+from ..json_decoder import loads
 from ..manager import PackageManager
+from ..package import (
+    Checksum,
+    ChecksumAlgorithm,
+    Dependency,
+    Originator,
+    PackageMetadata,
+    Supplier,
+)
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -118,6 +134,19 @@ class NPM(PackageManager):
     ```
     """
 
+    _AUTHOR_REGEXP = re.compile(
+        r"^(?P<name>[^<(]*?)\s*(?:<(?P<email>[^>]+)>)?\s*(?:\(.*\))?$"
+    )
+    _PREFIX_SETTING_REGEXP = re.compile(r"^\s*prefix\s*=", re.MULTILINE)
+    _PREFIX_ENV_VARS = frozenset({
+        "prefix",
+        "npm_config_prefix",
+        "npm_config_userconfig",
+        "npm_config_globalconfig",
+    })
+    """Environment variables moving the global prefix, or the configuration
+    files that may set it, compared lowercased."""
+
     def cooldown_env_value(self) -> str:
         """Render {attr}`meta_package_manager.execution.CLIExecutor.cooldown` as an
         integer day count for npm's `min-release-age`.
@@ -156,10 +185,96 @@ class NPM(PackageManager):
 
         return output
 
+    def _global_packages(self) -> dict[str, str] | None:
+        """Read the version of each global package from its `package.json`.
+
+        npm installs itself as a global package, `<prefix>/lib/node_modules/npm`,
+        and links `<prefix>/bin/npm` to it. Global packages are the directories
+        next to it, and their versions are in the `package.json` each holds:
+
+        ```{code-block} shell-session
+
+        $ readlink -f /opt/homebrew/bin/npm
+        /opt/homebrew/lib/node_modules/npm/bin/npm-cli.js
+        $ ls /opt/homebrew/lib/node_modules /opt/homebrew/lib/node_modules/@*
+        /opt/homebrew/lib/node_modules:
+        @mermaid-js  corepack  npm  wrangler
+
+        /opt/homebrew/lib/node_modules/@mermaid-js:
+        mermaid-cli
+        ```
+
+        Returns `None` whenever the global prefix may differ from the one npm is
+        installed in, for {attr}`installed` to ask npm instead: npm outside of
+        such a layout (like Debian's), or a `prefix` set by the environment or
+        by a configuration file. Also returns `None` for a package whose
+        version cannot be read.
+        """
+        if not self.cli_path or is_any_windows():
+            return None
+        env = {key.lower() for key in (*os.environ, *(self.extra_env or {}))}
+        if env & self._PREFIX_ENV_VARS:
+            return None
+        npm_dir = self.cli_path.resolve().parent.parent
+        modules = npm_dir.parent
+        prefix = modules.parent.parent
+        if (
+            (npm_dir.name, modules.name, modules.parent.name)
+            != ("npm", "node_modules", "lib")
+            or not (prefix / "bin" / "node").exists()
+        ):
+            return None
+        # The user, global and built-in configuration files, in npm's order.
+        for config in (
+            Path.home() / ".npmrc",
+            prefix / "etc" / "npmrc",
+            npm_dir / "npmrc",
+        ):
+            try:
+                content = config.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            except (OSError, UnicodeDecodeError):
+                return None
+            if self._PREFIX_SETTING_REGEXP.search(content):
+                return None
+
+        packages: dict[str, str] = {}
+        try:
+            for entry in sorted(modules.iterdir()):
+                if entry.name.startswith("."):
+                    continue
+                package_dirs = [entry]
+                if entry.name.startswith("@"):
+                    package_dirs = sorted(
+                        path
+                        for path in entry.iterdir()
+                        if not path.name.startswith(".")
+                    )
+                for package_dir in package_dirs:
+                    if not package_dir.is_dir():
+                        continue
+                    manifest = loads((package_dir / "package.json").read_bytes())
+                    version = manifest.get("version")
+                    if not isinstance(version, str):
+                        msg = f"no version in {package_dir / 'package.json'}"
+                        raise ValueError(msg)
+                    packages[package_dir.relative_to(modules).as_posix()] = version
+        except (AttributeError, OSError, ValueError) as exc:
+            logging.debug(
+                f"Unrecognized global packages layout: {exc}", extra={"label": self.id}
+            )
+            return None
+        return packages
+
     @property
     def installed(self) -> Iterator[Package]:
         """Fetch installed packages.
 
+        Read from the `package.json` of each global package, which saves the
+        boot of Node.js. npm is only asked when the layout of its global
+        packages is not recognized:
+
         ```{code-block} shell-session
 
         $ npm --global --no-progress --no-update-notifier --no-fund --no-audit \
@@ -199,6 +314,12 @@ class NPM(PackageManager):
         }
         ```
         """
+        packages = self._global_packages()
+        if packages is not None:
+            for pkg_id, version in packages.items():
+                yield self.package(id=pkg_id, installed_version=version)
+            return
+
         output = self.run_cli("--json", "--depth", "0", "list", must_succeed=True)
 
         data = self.parse_json(output)
@@ -209,6 +330,118 @@ class NPM(PackageManager):
                     installed_version=pkg_infos["version"],
                 )
 
+    def bulk_metadata(self) -> dict[str, PackageMetadata]:
+        """Rich metadata of all global packages, from a single `npm list` call.
+
+        `--long` makes npm inline each top-level package's `package.json`
+        fields into the listing, so one call covers the whole inventory:
+
+        ```{code-block} shell-session
+
+        $ npm --global --no-progress --no-update-notifier --no-fund --no-audit \
+            --json --long --depth 0 list
+        {
+          "name": "lib",
+          "dependencies": {
+            "wrangler": {
+              "version": "3.51.2",
+              "resolved": "https://registry.npmjs.org/wrangler/-/wrangler-3.51.2.tgz",
+              "integrity": "sha512-8TRUwzPHj6+uPDzY0hBJ+/a5ljmRBMyiA3ZWJl9MG9nFH4A4Q==",
+              "description": "Command-line interface for all things Cloudflare Workers",
+              "homepage": "https://github.com/cloudflare/workers-sdk#readme",
+              "license": "MIT OR Apache-2.0",
+              "repository": {
+                "type": "git",
+                "url": "git+https://github.com/cloudflare/workers-sdk.git"
+              },
+              "bugs": {"url": "https://github.com/cloudflare/workers-sdk/issues"},
+              "author": "wrangler@cloudflare.com",
+              "_dependencies": {"esbuild": "0.17.19", "miniflare": "3.20240404.0"},
+              (...)
+            }
+          }
+        }
+        ```
+        """
+        output = self.run_cli(
+            "--json", "--long", "--depth", "0", "list", must_succeed=True
+        )
+        data = self.parse_json(output)
+        if not data:
+            return {}
+        return {
+            pkg_id: self._package_json_metadata(pkg_infos)
+            for pkg_id, pkg_infos in data.get("dependencies", {}).items()
+            if isinstance(pkg_infos, dict)
+        }
+
+    def _package_json_metadata(self, infos: dict) -> PackageMetadata:
+        """Map one package entry of `npm list --long --json` into the portable
+        {class}`PackageMetadata`.
+        """
+
+        def url_of(value: object) -> str | None:
+            """`repository` and `bugs` are either a bare URL or an object."""
+            if isinstance(value, dict):
+                value = value.get("url")
+            return value if isinstance(value, str) and value else None
+
+        license_str = infos.get("license")
+        if isinstance(license_str, dict):
+            license_str = license_str.get("type")
+        if not isinstance(license_str, str):
+            license_str = None
+
+        originator = None
+        author = infos.get("author")
+        if isinstance(author, dict) and author.get("name"):
+            originator = Originator(name=author["name"], email=author.get("email"))
+        elif isinstance(author, str) and author:
+            match = self._AUTHOR_REGEXP.match(author)
+            if match and match.group("name"):
+                originator = Originator(
+                    name=match.group("name"), email=match.group("email")
+                )
+
+        # Subresource Integrity string: `<algorithm>-<base64 digest>`.
+        checksums: list[Checksum] = []
+        algorithm, _, digest = str(infos.get("integrity") or "").partition("-")
+        if algorithm.upper() in ("SHA1", "SHA512") and digest:
+            try:
+                checksums.append(
+                    Checksum(
+                        ChecksumAlgorithm(algorithm.upper()),
+                        base64.b64decode(digest).hex(),
+                    )
+                )
+            except (binascii.Error, ValueError):
+                pass
+
+        # `_dependencies` is the raw `dependencies` field of `package.json`,
+        # mapping each dependency to its declared version range.
+        declared = infos.get("_dependencies")
+        dependencies = tuple(
+            Dependency(target_id=dep_id, version_constraint=constraint or None)
+            for dep_id, constraint in (
+                declared.items() if isinstance(declared, dict) else ()
+            )
+        )
+
+        description = infos.get("description") or None
+        return PackageMetadata(
+            download_url=infos.get("resolved") or None,
+            homepage=infos.get("homepage") or None,
+            vcs_url=url_of(infos.get("repository")),
+            issue_tracker_url=url_of(infos.get("bugs")),
+            license_declared=license_str,
+            supplier=Supplier(name="npm registry", url="https://www.npmjs.com"),
+            originator=originator,
+            description=description,
+            summary=description,
+            dependencies=dependencies,
+            checksums=tuple(checksums),
+        )
+
     @property
     def outdated(self) -> Iterator[Package]:
         """Fetch outdated packages.
@@ -103,6 +103,9 @@ class Pacman(PackageManager):
     `DkpPacman` ships for macOS too.
     """
 
+    watch_paths = ("/var/lib/pacman/local",)
+    """The local database, holding one directory per installed package."""
+
     default_sudo = True
 
     requirement = ">=5.0.0"
@@ -207,6 +210,33 @@ class Pacman(PackageManager):
         output = self.run_cli("--query", "--deps", "--unrequired")
         yield from self.parse_regex_lines(self._INSTALLED_REGEXP, output)
 
+    @property
+    def installable(self) -> Iterator[Package]:
+        """Fetch all packages available from the synced repositories.
+
+        A search without any term lists the whole sync databases, in the same
+        shape as {meth}`search`.
+
+        ```{code-block} shell-session
+
+        $ pacman --noconfirm --color never --sync --search
+        core/acl 2.3.2-1 [installed]
+            Access control list utilities, libraries and headers
+        core/amd-ucode 20240409.1addd7dc-1
+            Microcode update image for AMD CPUs
+        ```
+        """
+        output = self.run_cli("--sync", "--search")
+
+        for _repo_id, package_id, version, description in self._SEARCH_REGEXP.findall(
+            output,
+        ):
+            yield self.package(
+                id=package_id,
+                description=description,
+                latest_version=version,
+            )
+
     @search_capabilities(extended_support=False)
     def search(self, query: str, extended: bool, exact: bool) -> Iterator[Package]:
         """Fetch matching packages.
@@ -378,6 +408,9 @@ class DkpPacman(Pacman):
     a different binary this manager does not claim.
     """
 
+    watch_paths = ("/opt/devkitpro/pacman/var/lib/pacman/local",)
+    """devkitPro's pacman keeps its own database, under its install root."""
+
     requirement = ">=6.0.0"
     """The series aligned with upstream pacman 6, which every parser inherited
     here was written against. devkitPro's own `v1.0.x` releases of 2020 predate
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import email.message
 import importlib.metadata
+import json
 import re
 import subprocess
 import sys
@@ -28,7 +29,8 @@ from typing import cast
 from extra_platforms import ALL_PLATFORMS
 
 from ..capabilities import version_not_implemented
-from ..execution import READ_ONLY_TIMEOUT, VERSION_PROBE
+from ..dependency_graph import DependencyGraph
+from ..execution import READ_ONLY_TIMEOUT, VERSION_PROBE, CLIError
 from ..manager import PackageManager
 from ..package import (
     EMPTY_METADATA,
@@ -38,10 +40,11 @@ from ..package import (
     PackageMetadata,
     Supplier,
 )
+from ..version import parse_version
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable, Iterator
+    from collections.abc import Generator, Iterable, Iterator, Sequence
 
     from ..package import Package
     from ..version import TokenizedString
@@ -62,6 +65,11 @@ into without `--break-system-packages`. Prints `0` otherwise.
 """
 
 
+_SYS_PATH_PROBE = "import json, sys; print(json.dumps(sys.path))"
+"""One-liner run inside the target interpreter to print its import path as JSON,
+which is where its installed distributions are found."""
+
+
 _DEP_SPEC_SPLIT_REGEX = re.compile(
     r"^(?P<name>[A-Za-z0-9_.\-]+)(?P<extras>\[[^\]]+\])?(?P<rest>.*)$"
 )
@@ -81,6 +89,15 @@ def _split_dep_spec(spec: str) -> tuple[str, str, str]:
     return match["name"], match["extras"] or "", match["rest"].strip()
 
 
+def _canonical_name(name: str) -> str:
+    """Normalize a distribution name per {pep}`503`.
+
+    `Requires-Dist` lines spell their targets as the requiring project wrote
+    them, so `Foo_Bar` has to resolve to the installed `foo-bar`.
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
 class Pip(PackageManager):
     """The pip package installer for Python, driven as a module (`python -m pip`)
     rather than through the `pip` executable.
@@ -304,6 +321,74 @@ class Pip(PackageManager):
             return False
         return result.stdout.strip() == "1"
 
+    @cached_property
+    def _site_paths(self) -> list[str] | None:
+        """Import path of the interpreter pip runs in, {attr}`cli_path`.
+
+        The interpreter mpm runs in is often not the one it drives pip with: a
+        bundled mpm, or an externally-managed interpreter skipped for another
+        one on `PATH`, as {meth}`search_all_cli` does. Distributions are looked
+        up on this path, not on mpm's own {data}`sys.path`.
+
+        Runs the interpreter with {data}`_SYS_PATH_PROBE`, unless it is the
+        running one. `None` if the probe fails or prints something unexpected.
+        """
+        if not self.cli_path:
+            return None
+        if self.cli_path == Path(sys.executable):
+            return list(sys.path)
+        timeout = self.timeout if self.timeout is not None else READ_ONLY_TIMEOUT
+        try:
+            result = subprocess.run(
+                (str(self.cli_path), "-c", _SYS_PATH_PROBE),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False,
+            )
+            paths = json.loads(result.stdout)
+        except (OSError, subprocess.SubprocessError, ValueError):
+            return None
+        if not isinstance(paths, list) or not all(isinstance(p, str) for p in paths):
+            return None
+        return paths
+
+    def _distribution(self, package_id: str) -> importlib.metadata.Distribution:
+        """Installed distribution of `package_id` in the target interpreter.
+
+        Raises {exc}`importlib.metadata.PackageNotFoundError` if it is not found
+        there, or if the import path of the interpreter is unknown.
+        """
+        if self._site_paths is not None:
+            for dist in importlib.metadata.distributions(
+                name=package_id, path=self._site_paths
+            ):
+                return dist
+        raise importlib.metadata.PackageNotFoundError(package_id)
+
+    @cached_property
+    def _requested_markers(self) -> bool:
+        """Whether the `REQUESTED` markers of the target interpreter tell which
+        distributions were asked for by name.
+
+        pip only writes them since 20.2, and not for every install: tooling
+        bypassing the marker, or `--no-user-supplied` runs, leave none behind. A
+        site whose pip predates the marker, or in which no distribution carries
+        one, says nothing about why its distributions were installed.
+        """
+        if self._site_paths is None:
+            return False
+        for pip_dist in importlib.metadata.distributions(
+            name="pip", path=self._site_paths
+        ):
+            if parse_version(pip_dist.version) < parse_version("20.2"):
+                return False
+            break
+        return any(
+            dist.read_text("REQUESTED") is not None
+            for dist in importlib.metadata.distributions(path=self._site_paths)
+        )
+
     @cached_property
     def version(self) -> TokenizedString | None:
         """Print Python's own version before Pip's.
@@ -395,9 +480,9 @@ class Pip(PackageManager):
         Each installed distribution exposes its `METADATA` file (the
         `Core Metadata` from {pep}`621`) plus `RECORD`, `WHEEL`,
         and `INSTALLER` files in its `.dist-info` directory. This
-        method reads them in-process: no shell-outs, no network, fast
-        enough to enumerate hundreds of distributions in a fraction of a
-        second.
+        method reads them in-process, from the import path of the target
+        interpreter: a single shell-out, no network, fast enough to enumerate
+        hundreds of distributions in a fraction of a second.
 
         Maps `Home-page` / `Project-URL` lines into the portable
         `homepage` / `vcs_url` / `issue_tracker_url` slots, walks
@@ -411,21 +496,27 @@ class Pip(PackageManager):
 
         for package in package_list:
             try:
-                dist = importlib.metadata.distribution(package.id)
+                dist = self._distribution(package.id)
             except importlib.metadata.PackageNotFoundError:
                 yield package, EMPTY_METADATA
                 continue
             try:
-                yield package, self._distribution_metadata(dist)
+                yield package, self._distribution_metadata(
+                    dist, self._requested_markers
+                )
             except Exception:  # noqa: BLE001
                 yield package, EMPTY_METADATA
 
     @staticmethod
     def _distribution_metadata(
         dist: importlib.metadata.Distribution,
+        requested_markers: bool = True,
     ) -> PackageMetadata:
         """Translate an `importlib.metadata.Distribution` into
         {class}`PackageMetadata`.
+
+        `requested_markers` tells whether the `REQUESTED` markers of the
+        distribution's site can be trusted (see {attr}`_requested_markers`).
         """
         # `Distribution.metadata` returns an `email.message.Message` at
         # runtime, but the typeshed protocol omits `.get()` on the older
@@ -506,6 +597,13 @@ class Pip(PackageManager):
                     )
                 )
 
+        # pip drops a `REQUESTED` marker in the `.dist-info` of the distributions
+        # asked for by name ({pep}`376`), and none in those pulled as
+        # dependencies. Other installers do not follow the convention.
+        installed_on_request = None
+        if requested_markers and (dist.read_text("INSTALLER") or "").strip() == "pip":
+            installed_on_request = dist.read_text("REQUESTED") is not None
+
         extras: dict[str, object] = {}
         for keyword_header in ("Keywords",):
             value = meta.get(keyword_header)
@@ -527,6 +625,7 @@ class Pip(PackageManager):
             summary=meta.get("Summary") or None,
             description=meta.get("Summary") or None,
             dependencies=tuple(deps),
+            installed_on_request=installed_on_request,
             extras=extras,
         )
 
@@ -619,6 +718,26 @@ class Pip(PackageManager):
                     latest_version=package["latest_version"],
                 )
 
+    def dependency_graph(self) -> DependencyGraph:
+        """Link installed distributions by their `Requires-Dist` requirements.
+
+        Read in-process by {meth}`package_metadata_batch`, with requirement names
+        normalized per {pep}`503`. Only distributions pip itself installed as a
+        dependency (no `REQUESTED` marker) can be orphans, and none at all in a
+        site whose markers cannot be trusted.
+
+        Raises {exc}`~meta_package_manager.execution.CLIError` if the import path
+        of the target interpreter cannot be read: distributions missing from the
+        graph would pass for dependency-free roots, and their dependencies for
+        orphans.
+        """
+        if self._site_paths is None:
+            msg = f"Could not read the import path of {self.cli_path}"
+            raise CLIError(None, "", msg)
+        return DependencyGraph.from_metadata(
+            self.package_metadata_batch(self.installed), key=_canonical_name
+        )
+
     # No search operation: PyPI disabled its server-side search API in 2020 because of
     # unmanageable load, so `pip search` no longer works.
     # See https://github.com/pypa/pip/issues/5216#issuecomment-744605466.
@@ -674,6 +793,19 @@ class Pip(PackageManager):
         """
         return self.build_cli("install", "--upgrade", package_id, sudo=True)
 
+    def upgrade_many_cli(self, package_ids: Sequence[str]) -> tuple[str, ...]:
+        """Generates the CLI to upgrade all packages provided as parameter at once.
+
+        A single resolution over the whole set, instead of one `pip install` per
+        package.
+
+        ```{code-block} shell-session
+
+        $ python -m pip --no-color install --upgrade boltons graphviz six
+        ```
+        """
+        return self.build_cli("install", "--upgrade", *package_ids, sudo=True)
+
     def remove(self, package_id: str) -> str:
         """Remove one package.
 
@@ -684,6 +816,16 @@ class Pip(PackageManager):
         """
         return self.run_cli("uninstall", "--yes", package_id, sudo=True)
 
+    def remove_many(self, package_ids: Sequence[str]) -> str:
+        """Remove several packages at once.
+
+        ```{code-block} shell-session
+
+        $ python -m pip --no-color uninstall --yes arrow python-dateutil six
+        ```
+        """
+        return self.run_cli("uninstall", "--yes", *package_ids, sudo=True)
+
     def cleanup_cache(self) -> None:
         """Removes things we don't need anymore.
 
@@ -64,6 +64,15 @@ class Pipx(PackageManager):
 
     platforms = ALL_PLATFORMS
 
+    watch_paths = (
+        "$PIPX_HOME/venvs",
+        "~/.local/share/pipx/venvs",
+        "~/Library/Application Support/pipx/venvs",
+        "~/.local/pipx/venvs",
+    )
+    """One virtual environment per installed application: the default home since
+    pipx 1.3 on Linux, then on macOS, then the legacy one."""
+
     requirement = ">=1.0.0"
     """
     ```{code-block} shell-session
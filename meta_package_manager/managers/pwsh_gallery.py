@@ -51,7 +51,9 @@ class PWSH_Gallery(PackageManager):
     with no user profile loaded. Reads emit `ConvertTo-Json -AsArray` and
     are parsed as JSON; `outdated` has no native cmdlet, so its
     installed-versus-gallery comparison runs inside that single `pwsh`
-    call rather than as one round trip per installed module.
+    call rather than as one round trip per installed module. All the
+    expressions of an {program}`mpm` invocation are fed to the same `pwsh`
+    process (see {attr}`session_args`).
     ```
 
     ```{note}
@@ -123,6 +125,40 @@ class PWSH_Gallery(PackageManager):
     ```
     """
 
+    session_args = ("-NoProfile", "-NonInteractive", "-Command", "-")
+    """Keep one `pwsh` reading expressions from `<stdin>`, one per line, so the
+    second-long startup of PowerShell is paid once per {program}`mpm` invocation
+    instead of once per operation.
+    """
+
+    def session_script(self, args: tuple[str, ...]) -> str | None:
+        """Run the `-Command` expression of `args` in the session.
+
+        The expression runs in a script block, so a terminating error cannot
+        abort the trailer, and its output is streamed as plain lines rather than
+        formatted once the pipeline ends. The exit status mirrors the one of a
+        one-shot `pwsh -Command`: `1` if the expression failed, `0` otherwise.
+        Its success is read inside the block, right after the expression: past
+        the `Out-String` pipe, `$?` would only report on `Out-String` itself.
+
+        Multi-line expressions are left to one-shot runs: `-Command -` needs a
+        blank line to end a multi-line statement.
+        """
+        if args[1:-1] != self.pre_args or "\n" in args[-1]:
+            return None
+        return (
+            "$mpmStatus = 0; try {"
+            f" & {{ {args[-1].rstrip().rstrip(';')};"
+            " if (-not $?) { $global:mpmStatus = 1 } } | Out-String -Stream"
+            " } catch { $mpmStatus = 1; [Console]::Error.WriteLine($_) }\n"
+        )
+
+    def session_trailer(self, marker: str) -> str:
+        return (
+            f"[Console]::Out.WriteLine('{marker} ' + $mpmStatus);"
+            f" [Console]::Error.WriteLine('{marker}')\n"
+        )
+
     @property
     def installed(self) -> Iterator[Package]:
         """Fetch installed PowerShell resources.
@@ -16,16 +16,21 @@
 
 from __future__ import annotations
 
+import logging
 import re
+import threading
+from pathlib import Path
 
 from extra_platforms import UNIX_WITHOUT_MACOS
 
 from ..capabilities import search_capabilities, version_not_implemented
 from ..manager import PackageManager
+from ..snapd import SnapdClient, SnapdError
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from typing import Any
 
     from ..package import Package
 
@@ -51,6 +56,14 @@ class Snap(PackageManager):
     parser.
     ```
 
+    ```{note}
+    The read operations skip the `snap` CLI when they can: `installed`,
+    `outdated` and `search` query the REST API `snapd` serves on
+    `/run/snapd.socket`, over a single connection for the whole run (see
+    {mod}`meta_package_manager.snapd`). mpm falls back to the CLI when the
+    socket is missing or the daemon does not answer.
+    ```
+
     ```{note}
     `snap refresh --list` reports only the available version, so
     `outdated` looks each installed version up by ID from the cached
@@ -64,6 +77,21 @@ class Snap(PackageManager):
 
     platforms = UNIX_WITHOUT_MACOS
 
+    watch_paths = ("/var/lib/snapd/state.json",)
+    """snapd's state, rewritten on every change to the installed snaps."""
+
+    snapd_socket = Path("/run/snapd.socket")
+    """Unix socket of the `snapd` REST API."""
+
+    _snapd: SnapdClient | None = None
+    """Connection to {attr}`snapd_socket`, opened by the first query."""
+
+    _snapd_failed: bool = False
+    """Set once {attr}`snapd_socket` could not be reached, so the rest of the
+    invocation sticks to the CLI rather than retrying."""
+
+    _snapd_lock = threading.Lock()
+
     default_sudo = True
 
     requirement = ">=2.0.0"
@@ -88,10 +116,50 @@ class Snap(PackageManager):
     ```
     """
 
+    def _snapd_get(self, path: str, **params: str) -> list[dict[str, Any]] | None:
+        """List of snaps returned by the `snapd` API at `path`.
+
+        Returns `None` for the caller to run the CLI instead, when the socket is
+        missing, unreachable, or the daemon answers with an error. Only a
+        transport failure disables the API for the rest of the invocation: an
+        error answer is left for the CLI to report the way it always does.
+        """
+        if self._snapd_failed or not self.snapd_socket.exists():
+            return None
+        with self._snapd_lock:
+            if self._snapd is None:
+                self._snapd = SnapdClient(
+                    self.snapd_socket, timeout=self.timeout, label=self.id
+                )
+        try:
+            result = self._snapd.get(path, **params)
+        except SnapdError as ex:
+            logging.debug(
+                f"snapd API unusable, falling back to the CLI: {ex}",
+                extra={"label": self.id},
+            )
+            if ex.kind is None:
+                self._snapd_failed = True
+                self._snapd.close()
+            return None
+        if not isinstance(result, list) or not all(
+            isinstance(snap, dict)
+            and isinstance(snap.get("name"), str)
+            and isinstance(snap.get("version"), str)
+            for snap in result
+        ):
+            logging.debug(
+                f"Unexpected snapd result for {path}", extra={"label": self.id}
+            )
+            return None
+        return result
+
     @property
     def installed(self) -> Iterator[Package]:
         """Fetch installed packages.
 
+        Read from `snapd`'s `/v2/snaps` endpoint, or from the CLI:
+
         ```{code-block} shell-session
 
         $ snap list --color=never
@@ -101,6 +169,13 @@ class Snap(PackageManager):
         pdftk   2.02-4     9     latest/stable  smoser          -
         ```
         """
+        snaps = self._snapd_get("/v2/snaps")
+        if snaps is not None:
+            # Sorted by name, like the table of the CLI.
+            for snap in sorted(snaps, key=lambda snap: snap["name"]):
+                yield self.package(id=snap["name"], installed_version=snap["version"])
+            return
+
         output = self.run_cli("list")
 
         for package in output.splitlines()[1:]:
@@ -111,6 +186,8 @@ class Snap(PackageManager):
     def outdated(self) -> Iterator[Package]:
         """Fetch outdated packages.
 
+        Read from `snapd`'s `/v2/find?select=refresh` endpoint, or from the CLI:
+
         ```{code-block} shell-session
 
         $ snap refresh --list --color=never
@@ -118,9 +195,23 @@ class Snap(PackageManager):
         standard-notes  3.3.5    8    standardnotes✓  -
         ```
         """
-        output = self.run_cli("refresh", "--list")
 
-        installed_versions = self.installed_version_map
+        def refreshes() -> list[dict[str, Any]] | str:
+            snaps = self._snapd_get("/v2/find", select="refresh")
+            return self.run_cli("refresh", "--list") if snaps is None else snaps
+
+        # The listing lacks installed versions: fetch them alongside.
+        output, installed_versions = self.gather(
+            refreshes, lambda: self.installed_version_map
+        )
+        if isinstance(output, list):
+            for snap in output:
+                yield self.package(
+                    id=snap["name"],
+                    latest_version=snap["version"],
+                    installed_version=installed_versions.get(snap["name"]),
+                )
+            return
 
         for package in output.splitlines()[1:]:
             parts = package.split()
@@ -141,6 +232,8 @@ class Snap(PackageManager):
         refine them.
         ```
 
+        Read from `snapd`'s `/v2/find?q=<query>` endpoint, or from the CLI:
+
         ```{code-block} shell-session
 
         $ snap find doc --color=never
@@ -150,6 +243,16 @@ class Snap(PackageManager):
         skype      8.58.0.93    skype✓       classic   One Skype for all.
         ```
         """
+        snaps = self._snapd_get("/v2/find", q=query)
+        if snaps is not None:
+            for snap in snaps:
+                yield self.package(
+                    id=snap["name"],
+                    description=snap.get("summary") or None,
+                    latest_version=snap["version"],
+                )
+            return
+
         output = self.run_cli("find", query)
         headerless_table = None
         if output:
@@ -26,7 +26,7 @@ from ..manager import PackageManager
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
 
     from ..package import Package
 
@@ -222,6 +222,16 @@ class UV(UVBase):
         package_specs = self._build_package_spec(package_id, version)
         return self.build_cli("pip", "install", "--upgrade", package_specs)
 
+    def upgrade_many_cli(self, package_ids: Sequence[str]) -> tuple[str, ...]:
+        """Generates the CLI to upgrade all packages provided as parameter at once.
+
+        ```{code-block} shell-session
+
+        $ uv --color never --no-progress pip install --upgrade arrow boltons six
+        ```
+        """
+        return self.build_cli("pip", "install", "--upgrade", *package_ids)
+
     def remove(self, package_id: str) -> str:
         """Remove one package.
 
@@ -143,9 +143,11 @@ class XBPS(PackageManager):
         python3-3.11.6_2 update x86_64 https://repo-default.voidlinux.org/current 30MB 8MB
         ```
         """
-        installed_versions = self.installed_version_map
-
-        output = self.run_cli("--update", "--dry-run")
+        # The dry run lacks installed versions: fetch them alongside.
+        installed_versions, output = self.gather(
+            lambda: self.installed_version_map,
+            lambda: self.run_cli("--update", "--dry-run"),
+        )
 
         for match in self._OUTDATED_REGEXP.finditer(output):
             if split := self.split_name_version(match.group("pkgver")):
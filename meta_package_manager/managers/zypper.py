@@ -73,6 +73,9 @@ class Zypper(PackageManager):
 
     platforms = UNIX_WITHOUT_MACOS
 
+    watch_paths = ("/usr/lib/sysimage/rpm", "/var/lib/rpm")
+    """The RPM database, under `/usr` since openSUSE Tumbleweed moved it there."""
+
     default_sudo = True
 
     requirement = ">=1.14.0"
@@ -20,7 +20,7 @@ itself.
 
 Defines the lightweight representation of a package (ID, name, installed and latest
 versions, architecture) that every manager operation yields, plus
-{func}`meta_package_manager.package.packages_asdict` to serialize a subset of its
+{func}`meta_package_manager.package.packages_asdict` to project a subset of its
 fields for output.
 
 {class}`Package` is the inventory plane: what the package manager itself
@@ -42,9 +42,10 @@ manager engine ({mod}`meta_package_manager.manager`).
 from __future__ import annotations
 
 import re
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from functools import cached_property
+from functools import lru_cache
+from typing import Final
 
 from packageurl import PackageURL
 
@@ -52,16 +53,20 @@ from .version import parse_version
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator
     from datetime import datetime
     from pathlib import Path
 
     from .version import TokenizedString
 
 
-@dataclass
+@dataclass(slots=True)
 class Package:
-    """Lightweight representation of a package and its metadata."""
+    """Lightweight representation of a package and its metadata.
+
+    Slotted, as a full inventory creates one per installed package of every
+    manager: no per-instance `__dict__` to allocate.
+    """
 
     id: str
     """ID is required and is the primary key used by the manager."""
@@ -100,9 +105,14 @@ class Package:
         self.installed_version = parse_version(self.installed_version)  # type: ignore[arg-type]
         self.latest_version = parse_version(self.latest_version)  # type: ignore[arg-type]
 
-    @cached_property
+    @property
     def purl(self) -> PackageURL:
-        """Returns the package's pURL object."""
+        """Returns the package's pURL object.
+
+        Built on each access rather than cached: only the SBOM export reads it, a
+        couple of times per package, and caching it would cost every instance a
+        slot.
+        """
         qualifiers = {}
         if self.arch:
             qualifiers["arch"] = self.arch
@@ -147,28 +157,139 @@ class Package:
 
         A query with no alphanumeric segment (empty or punctuation-only) never
         matches.
+
+        Callers testing many packages against the same query should compile it
+        once into a {class}`QueryMatcher` instead.
         """
-        # Look by default into package ID and name.
-        content = {self.id, self.name}
+        return QueryMatcher.compile(query, extended, exact).matches(self)
 
-        # Reject fuzzy results: only keep packages strictly matching ID or name.
-        if exact and query not in content:
-            return False
 
-        # Add description to the content to look into.
-        if extended:
-            content.add(self.description)
+class QueryMatcher:
+    """A free-form query compiled once, to test many packages against it.
+
+    Implements the matching semantics documented in {meth}`Package.matches`, with
+    all the per-query work done up front: the query is split into its
+    {meth}`Package.query_parts`, which are lowercased and deduplicated. A single
+    part is then looked up with a plain substring test, and several parts with one
+    pre-compiled regular expression alternating all of them, so a package costs a
+    single scan of its lowercased content however long the query.
 
-        serialized_content = "".join(s.lower() for s in content if s)
-        return any(
-            part.lower() in serialized_content for part in self.query_parts(query)
+    Shared by the `installed`, `outdated`, `orphans` and `search` filters
+    ({func}`meta_package_manager.cli._filter_matches`,
+    {meth}`meta_package_manager.manager.PackageManager.refiltered_search`) and by
+    the highlighting of their results.
+    """
+
+    __slots__ = ("_contains", "exact", "extended", "parts", "query")
+
+    def __init__(self, query: str, extended: bool = False, exact: bool = False):
+        self.query = query
+        self.extended = extended
+        self.exact = exact
+        # Longest parts first, so the alternation does not stop on a shorter one.
+        self.parts: tuple[str, ...] = tuple(
+            sorted(
+                {part.lower() for part in Package.query_parts(query)},
+                key=lambda part: (-len(part), part),
+            )
         )
+        self._contains: Callable[[str], object]
+        if not self.parts:
+            self._contains = lambda content: False
+        elif len(self.parts) == 1:
+            part = self.parts[0]
+            self._contains = lambda content: part in content
+        else:
+            pattern = re.compile("|".join(map(re.escape, self.parts)))
+            self._contains = pattern.search
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def compile(
+        query: str, extended: bool = False, exact: bool = False
+    ) -> QueryMatcher:
+        """Cached constructor, for callers handed a raw query on each call."""
+        return QueryMatcher(query, extended, exact)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.query!r}, "
+            f"extended={self.extended}, exact={self.exact})"
+        )
 
-def packages_asdict(packages: Iterable[Package], keep_fields: tuple[str, ...]):
-    """Returns a list of packages casted to a `dict` with only a subset of its
-    fields."""
-    return ({k: v for k, v in asdict(p).items() if k in keep_fields} for p in packages)
+    @property
+    def highlight_patterns(self) -> set[str]:
+        """Substrings to emphasize in rendered results: the raw query, plus each of
+        its alphanumeric parts."""
+        return {self.query}.union(Package.query_parts(self.query))
+
+    def contains(self, content: str) -> bool:
+        """Whether any query part appears in the already-lowercased `content`."""
+        return bool(self._contains(content))
+
+    def matches_fields(
+        self, id: str, name: str | None, description: str | None = None
+    ) -> bool:
+        """Match the raw fields of a package, without a {class}`Package`."""
+        # Reject fuzzy results: only keep packages strictly matching ID or name.
+        if self.exact and self.query != id and self.query != name:
+            return False
+        # Look into package ID and name, plus the description if extended. Fields
+        # are joined by a NUL byte, which no alphanumeric part can span.
+        content = f"{id}\0{name}" if name else id
+        if self.extended and description:
+            content = f"{content}\0{description}"
+        return bool(self._contains(content.lower()))
+
+    def matches(self, package: Package) -> bool:
+        """Tell whether `package` matches the query. See {meth}`Package.matches`."""
+        return self.matches_fields(package.id, package.name, package.description)
+
+    def filter(self, packages: Iterable[Package]) -> Iterator[Package]:
+        """Yield only the `packages` matching the query."""
+        matches_fields = self.matches_fields
+        for package in packages:
+            if matches_fields(package.id, package.name, package.description):
+                yield package
+
+
+PACKAGE_FIELDS: Final = tuple(f.name for f in fields(Package))
+"""Names of the {class}`Package` fields, in declaration order."""
+
+VERSION_FIELDS: Final = frozenset(("installed_version", "latest_version"))
+"""{class}`Package` fields holding a
+{class}`meta_package_manager.version.TokenizedString`."""
+
+
+def packages_asdict(
+    packages: Iterable[Package], keep_fields: tuple[str, ...]
+) -> Iterator[dict[str, str | None]]:
+    """Project each package to a `dict` holding only `keep_fields`.
+
+    Keys follow the declaration order of the {class}`Package` fields, whatever
+    the order of `keep_fields`, so serialized outputs are stable.
+
+    Versions are rendered to their string form, the one every table, diff and
+    serialization format ends up printing. It is the original string the
+    {class}`meta_package_manager.version.TokenizedString` kept at parsing time,
+    so no token is copied nor re-joined.
+
+    ```{note}
+    Fields are read straight off each instance. {func}`dataclasses.asdict` used
+    to deep-copy the whole package first, tokens of both versions included,
+    only to throw most of the fields away: a cost paid per package and quickly
+    dominating the post-processing of inventories tens of thousands of packages
+    long.
+    ```
+    """
+    kept = tuple(name for name in PACKAGE_FIELDS if name in keep_fields)
+    versions = VERSION_FIELDS.intersection(kept)
+    for package in packages:
+        row = {name: getattr(package, name) for name in kept}
+        for name in versions:
+            if row[name] is not None:
+                row[name] = str(row[name])
+        yield row
 
 
 class DependencyScope(str, Enum):
@@ -300,6 +421,15 @@ class PackageMetadata:
     cpe: str | None = None
 
     dependencies: tuple[Dependency, ...] = ()
+    installed_on_request: bool | None = None
+    """Whether the package was installed on request (`True`), or only to satisfy
+    the dependencies of another package (`False`). `None` when the manager does
+    not record it.
+
+    Feeds the orphan detection of
+    {class}`meta_package_manager.dependency_graph.DependencyGraph`.
+    """
+
     checksums: tuple[Checksum, ...] = ()
     files: tuple[FileEntry, ...] = ()
     files_analyzed: bool = False
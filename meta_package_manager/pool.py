@@ -24,7 +24,7 @@ from boltons.iterutils import unique
 from click_extra import get_current_context
 
 from . import definitions
-from .capabilities import implements
+from .capabilities import capability_matrix
 from .dispatch import warm_availability
 from .managers.am import AM
 from .managers.antidote import Antidote
@@ -203,6 +203,7 @@ class ManagerPool:
             "cooldown_policy",
             "dry_run",
             "ignore_auto_updates",
+            "jobs",
             "plan",
             "progress",
             "stop_on_error",
@@ -459,13 +460,21 @@ class ManagerPool:
         # unavailable managers still reads the very same probes, just later. `mpm
         # managers` is the one such caller, and it reads them one row at a time
         # while rendering its table, which is the slowest way to get them.
-        candidates = [
-            self.register[manager_id]
+        #
+        # Support of the operation is read off the capability matrix, computed
+        # once per manager class.
+        supported_ids = {
+            manager_id
             for manager_id in selected_ids
             if not implements_operation
-            or implements(self.register[manager_id], implements_operation)
-        ]
-        warm_availability(candidates)
+            or implements_operation
+            in capability_matrix(self.register[manager_id]).operations
+        }
+        warm_availability([
+            self.register[manager_id]
+            for manager_id in selected_ids
+            if manager_id in supported_ids
+        ])
 
         # Deduplicate managers IDs while preserving order, then remove excluded
         # managers.
@@ -474,7 +483,7 @@ class ManagerPool:
 
             # Check if operation is not implemented before calling `.available`. It
             # saves one call to the package manager CLI.
-            if implements_operation and not implements(manager, implements_operation):
+            if manager_id not in supported_ids:
                 # An unsupported operation is narration, not a problem: keep it at INFO
                 # (matching the not-available skip below), hidden by the WARNING default.
                 logging.log(
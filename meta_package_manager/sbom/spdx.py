@@ -25,6 +25,13 @@ will not function (every public method depends on the missing imports).
 because they both touch `spdx_tools` types; {mod}`.cyclonedx`
 imports the former for its own license normalization, which is one-way
 and acyclic.
+
+Reading the upstream per-package documents is split from splicing them:
+{func}`load_upstream_sbom` reduces one file to the {class}`UpstreamSBOM` slice
+the merge consumes, caching it on disk by content digest, and
+{func}`preload_upstream_sboms` runs a batch of those loads in a worker pool so
+the CLI can do it during its concurrent fetch phase instead of on the main
+thread at `add_package` time.
 """
 
 from __future__ import annotations
@@ -34,10 +41,14 @@ import io
 import json
 import logging
 import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import cast
 
 from boltons.ecoutils import get_profile
+from boltons.iterutils import unique
+from click_extra.execution import run_jobs
 from extra_platforms import current_platform
 
 from .. import __version__
@@ -87,9 +98,15 @@ except ImportError:
         "install meta-package-manager[sbom-offline] to enable it.",
     )
 
+upstream_cache_support = True
+try:
+    from platformdirs import user_cache_dir
+except ImportError:
+    upstream_cache_support = False
+
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
     from typing import Any
 
     from ..manager import PackageManager
@@ -174,6 +191,208 @@ def _coerce_spdx_string(raw):
     return raw
 
 
+UPSTREAM_CACHE_FORMAT = 1
+"""Version of the on-disk {class}`UpstreamSBOM` cache entries.
+
+Bump it whenever {meth}`UpstreamSBOM.from_document` starts keeping a field it
+used to drop: entries written under another version are read as misses, so the
+next run re-parses every upstream file instead of splicing a stale reduction.
+"""
+
+_UPSTREAM_PACKAGE_FIELDS = (
+    "SPDXID",
+    "name",
+    "versionInfo",
+    "downloadLocation",
+    "homepage",
+    "licenseDeclared",
+    "licenseConcluded",
+    "copyrightText",
+    "summary",
+    "description",
+)
+"""Keys of an upstream package entry that {meth}`SPDX._merge_external_sbom` reads.
+
+Everything else (file lists, checksums, external refs, annotations) is dropped at
+load time, which is what keeps the cache entries a fraction of the source file.
+"""
+
+
+@dataclass(frozen=True)
+class UpstreamSBOM:
+    """The slice of a per-package upstream SPDX document the merge consumes.
+
+    Plain strings, dicts and tuples only, so it crosses threads freely and
+    round-trips through JSON for the on-disk cache. Relocation under the
+    aggregate's ID namespace is *not* baked in: it depends on which IDs the
+    document already holds, so {meth}`SPDX._merge_external_sbom` still does it at
+    splice time, on this already-reduced data.
+    """
+
+    digest: str
+    """SHA-1 of the source file, carried into the `ExternalDocumentRef` checksum
+    and used as the cache key."""
+
+    namespace: str | None
+    """The upstream `documentNamespace`, if any."""
+
+    root_id: str | None
+    """First `documentDescribes` entry: the package the inventory already lists."""
+
+    packages: tuple[dict[str, Any], ...]
+    """Upstream package entries, reduced to {data}`_UPSTREAM_PACKAGE_FIELDS`."""
+
+    relationships: tuple[tuple[str, str, str], ...]
+    """`(source, relationship type, target)` triples, `DESCRIBES` edges dropped."""
+
+    @classmethod
+    def from_document(cls, digest: str, upstream: dict) -> UpstreamSBOM:
+        """Reduce a decoded upstream SPDX JSON document."""
+        upstream_root = upstream.get("documentDescribes") or []
+        packages = tuple(
+            {k: pkg[k] for k in _UPSTREAM_PACKAGE_FIELDS if k in pkg}
+            for pkg in upstream.get("packages") or []
+            if isinstance(pkg, dict)
+        )
+        relationships = []
+        for rel in upstream.get("relationships") or []:
+            if not isinstance(rel, dict):
+                continue
+            edge = (
+                rel.get("spdxElementId"),
+                rel.get("relationshipType"),
+                rel.get("relatedSpdxElement"),
+            )
+            if not all(isinstance(part, str) and part for part in edge):
+                continue
+            if edge[1] == "DESCRIBES":
+                continue
+            relationships.append(cast("tuple[str, str, str]", edge))
+        return cls(
+            digest=digest,
+            namespace=upstream.get("documentNamespace"),
+            root_id=upstream_root[0] if upstream_root else None,
+            packages=packages,
+            relationships=tuple(relationships),
+        )
+
+    def to_cache(self) -> dict[str, object]:
+        """Serialize to the JSON payload of an on-disk cache entry."""
+        return {
+            "format": UPSTREAM_CACHE_FORMAT,
+            "digest": self.digest,
+            "namespace": self.namespace,
+            "root_id": self.root_id,
+            "packages": list(self.packages),
+            "relationships": [list(rel) for rel in self.relationships],
+        }
+
+    @classmethod
+    def from_cache(cls, raw: dict) -> UpstreamSBOM:
+        """Rebuild from a cache payload written by {meth}`to_cache`.
+
+        Raises `ValueError` on a payload written under another
+        {data}`UPSTREAM_CACHE_FORMAT`, and lets `KeyError`/`TypeError` through
+        on a malformed one: the caller reads both as a cache miss.
+        """
+        if raw.get("format") != UPSTREAM_CACHE_FORMAT:
+            raise ValueError(f"Unsupported cache format: {raw.get('format')!r}")
+        return cls(
+            digest=raw["digest"],
+            namespace=raw["namespace"],
+            root_id=raw["root_id"],
+            packages=tuple(raw["packages"]),
+            relationships=tuple(
+                cast("tuple[str, str, str]", tuple(rel))
+                for rel in raw["relationships"]
+            ),
+        )
+
+
+def upstream_cache_dir() -> Path | None:
+    """Directory holding the parsed upstream SBOM cache, created on demand.
+
+    Sits next to the `--network` response cache, under
+    `<user-cache>/meta-package-manager/sbom/upstream`. Returns `None`, which
+    disables the cache, when `platformdirs` is not installed or the directory
+    cannot be created: like the response cache, it is an optimization, never a
+    requirement.
+    """
+    if not upstream_cache_support:
+        return None
+    cache_dir = Path(user_cache_dir("meta-package-manager")) / "sbom" / "upstream"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        logging.debug(f"Upstream SBOM cache disabled ({cache_dir}): {exc}")
+        return None
+    return cache_dir
+
+
+def load_upstream_sbom(sbom_path: Path, cache_dir: Path | None = None) -> UpstreamSBOM:
+    """Read a per-package upstream SPDX file and reduce it to an {class}`UpstreamSBOM`.
+
+    The file is always read and hashed, as its SHA-1 is both the
+    `ExternalDocumentRef` checksum and the cache key. The expensive part is the
+    `json.loads` of a document carrying the formula's full dependency closure, and
+    that only runs on a cache miss: with `cache_dir` set, a formula whose
+    `sbom.spdx.json` did not change since the previous run is served from
+    `<cache_dir>/<digest>.json`.
+
+    A corrupt or stale cache entry is a miss, and a failed cache write is logged
+    and ignored. Errors reading or decoding `sbom_path` itself propagate.
+    """
+    data = Path(sbom_path).read_bytes()
+    digest = hashlib.sha1(data).hexdigest()
+
+    cache_path = cache_dir / f"{digest}.json" if cache_dir is not None else None
+    if cache_path is not None and cache_path.is_file():
+        try:
+            return UpstreamSBOM.from_cache(
+                json.loads(cache_path.read_text(encoding="utf-8"))
+            )
+        except (ValueError, KeyError, TypeError, OSError) as exc:
+            logging.debug(f"Ignore unreadable upstream SBOM cache {cache_path}: {exc}")
+
+    upstream = UpstreamSBOM.from_document(digest, json.loads(data))
+    if cache_path is not None:
+        try:
+            cache_path.write_text(json.dumps(upstream.to_cache()), encoding="utf-8")
+        except (OSError, TypeError) as exc:
+            logging.debug(f"Could not cache upstream SBOM {sbom_path}: {exc}")
+    return upstream
+
+
+def preload_upstream_sboms(
+    sbom_paths: Iterable[Path],
+    *,
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+) -> dict[Path, UpstreamSBOM]:
+    """Load a batch of upstream SPDX files with {func}`load_upstream_sbom`.
+
+    Runs up to `jobs` loads at once through
+    {func}`click_extra.execution.run_jobs`: the reads release the GIL, and with a
+    warm cache the work left per file is a hash and a small JSON decode. Returns a
+    `path -> UpstreamSBOM` map for {attr}`SPDX.upstream_sboms`. A file that fails
+    to load is logged and left out, so the merge retries it synchronously and
+    reports the failure at the point it always has.
+    """
+
+    def load(sbom_path: Path) -> tuple[Path, UpstreamSBOM | None]:
+        try:
+            return sbom_path, load_upstream_sbom(sbom_path, cache_dir)
+        except Exception as exc:  # noqa: BLE001
+            logging.debug(f"Failed to preload external SBOM {sbom_path}: {exc}")
+            return sbom_path, None
+
+    return {
+        sbom_path: upstream
+        for sbom_path, upstream in run_jobs(load, unique(sbom_paths), jobs=jobs)
+        if upstream is not None
+    }
+
+
 def _vuln_comment(vuln) -> str:
     """Render a one-line human summary for an SPDX security `externalRef`.
 
@@ -212,6 +431,7 @@ class SPDX(SBOM):
     # because that enum is only importable when the `[sbom-offline]` extra is.
     pending_relationships: list[tuple[str, str, str, Any]]
     merged_docs: dict[str, str]
+    upstream_sboms: dict[Path, UpstreamSBOM]
 
     @classmethod
     def normalize_spdx_id(cls, value: str) -> str:
@@ -256,6 +476,11 @@ class SPDX(SBOM):
         # consumers can trace which slice of our aggregate doc came from
         # which Homebrew formula's `sbom.spdx.json`.
         self.merged_docs = {}
+        # `sbom_path -> UpstreamSBOM` handed in by the CLI, which loads the
+        # upstream files concurrently during its fetch phase (see
+        # {func}`preload_upstream_sboms`). A path missing here is loaded
+        # synchronously by {meth}`_merge_external_sbom`.
+        self.upstream_sboms = {}
         self.document = Document(
             CreationInfo(
                 spdx_version="SPDX-2.3",
@@ -494,23 +719,22 @@ class SPDX(SBOM):
         rewire any relationships that pointed at it so they point at our
         already-emitted `package_docid`.
 
+        The upstream file itself is read from {attr}`upstream_sboms` when the
+        CLI preloaded it, and loaded (uncached) here otherwise.
+
         Errors are caught one level up: a single malformed upstream file
         must not abort the entire scan.
         """
-        with open(sbom_path, "rb") as fh:
-            data = fh.read()
-        digest = hashlib.sha1(data).hexdigest()
-        upstream = json.loads(data)
+        upstream = self.upstream_sboms.get(Path(sbom_path))
+        if upstream is None:
+            upstream = load_upstream_sbom(sbom_path)
+        digest = upstream.digest
 
         doc_ref_id = self.normalize_spdx_id(f"DocumentRef-{manager_id}-{package.id}")
         # SPDX IDs are matched textually. Keep the prefix terse but
         # collision-free across formulae sharing common dep names.
         local_prefix = self.normalize_spdx_id(f"SPDXRef-{manager_id}-{package.id}")
-        upstream_packages = upstream.get("packages") or []
-        upstream_relationships = upstream.get("relationships") or []
-
-        upstream_root = upstream.get("documentDescribes") or []
-        upstream_root_id = upstream_root[0] if upstream_root else None
+        upstream_root_id = upstream.root_id
         # Map upstream IDs to their relocated counterparts in our document.
         id_map: dict[str, str] = {}
         if upstream_root_id:
@@ -519,7 +743,7 @@ class SPDX(SBOM):
         # Pass 1: register every transitive package under our prefix and
         # add it to the document. Skip the root (already represented in
         # the aggregate by our inventory entry).
-        for upstream_pkg in upstream_packages:
+        for upstream_pkg in upstream.packages:
             upstream_id = upstream_pkg.get("SPDXID")
             if not upstream_id or upstream_id == upstream_root_id:
                 continue
@@ -567,16 +791,13 @@ class SPDX(SBOM):
         # Pass 2: rewrite relationships. We only port the dependency-type
         # edges; the upstream DESCRIBES relationships are already covered
         # by our own DESCRIBES emission above.
-        for rel in upstream_relationships:
-            rel_type_str = rel.get("relationshipType")
-            if not rel_type_str or rel_type_str == "DESCRIBES":
-                continue
+        for upstream_src, rel_type_str, upstream_tgt in upstream.relationships:
             try:
                 rel_type = RelationshipType[rel_type_str]
             except KeyError:
                 continue
-            src = id_map.get(rel.get("spdxElementId"))
-            tgt = id_map.get(rel.get("relatedSpdxElement"))
+            src = id_map.get(upstream_src)
+            tgt = id_map.get(upstream_tgt)
             if not src or not tgt:
                 continue
             self.document.relationships.append(Relationship(src, rel_type, tgt))
@@ -592,7 +813,7 @@ class SPDX(SBOM):
         self.document.creation_info.external_document_refs.append(
             ExternalDocumentRef(
                 document_ref_id=doc_ref_id,
-                document_uri=upstream.get("documentNamespace") or f"file://{sbom_path}",
+                document_uri=upstream.namespace or f"file://{sbom_path}",
                 checksum=SPDXChecksum(SPDXChecksumAlgorithm.SHA1, digest),
             )
         )
@@ -0,0 +1,237 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Long-lived interpreter sessions, for CLIs with an expensive startup.
+
+Some managers are driven through an interpreter that takes far longer to start
+than to answer: `pwsh` loads for about a second before running a one-line
+expression. A manager setting
+{attr}`~meta_package_manager.execution.CLIExecutor.session_args` gets one
+{class}`CLISession` per {program}`mpm` invocation instead, a child process
+kept alive and fed one request per call on its `<stdin>`.
+
+The line protocol is the manager's to define, through
+{meth}`~meta_package_manager.execution.CLIExecutor.session_script`. Each request
+ends by printing the session's {attr}`~CLISession.marker` on both output
+streams, followed on `<stdout>` by the request's exit code: everything read
+before the markers is the request's output.
+
+A session only ever replaces a spawn, never the semantics around it: the
+timeout, the logging and the failure gate of
+{meth}`~meta_package_manager.execution.CLIExecutor.run` apply unchanged, and a
+session that cannot start or dies mid-request hands over to one-shot spawns.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+import uuid
+import weakref
+
+from click_extra.execution import env_copy
+from extra_platforms import is_any_windows
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import IO
+
+    from click_extra.envvar import TEnvVars
+
+
+class SessionError(Exception):
+    """The session process exited, or stopped answering the line protocol."""
+
+
+_live_sessions: weakref.WeakSet[CLISession] = weakref.WeakSet()
+"""Sessions still running, closed when {program}`mpm` exits."""
+
+
+@atexit.register
+def close_sessions() -> None:
+    """Close all running sessions."""
+    for session in tuple(_live_sessions):
+        session.close()
+
+
+def _pump(stream: IO[str], lines: queue.Queue[str | None]) -> None:
+    """Forward each line of `stream` to `lines`, then `None` on end of file."""
+    try:
+        for line in stream:
+            lines.put(line.rstrip("\r\n"))
+    except (OSError, ValueError):
+        # The stream was closed under our feet by close().
+        pass
+    lines.put(None)
+
+
+class CLISession:
+    """A child process answering requests over its standard streams.
+
+    Both output streams are drained by threads from the start, so a chatty
+    request cannot fill a pipe and deadlock the child. Requests from concurrent
+    threads are serialized: each one has the child to itself until its markers
+    are read.
+    """
+
+    def __init__(
+        self,
+        args: Sequence[str],
+        extra_env: TEnvVars | None = None,
+        label: str | None = None,
+    ) -> None:
+        self.args = tuple(args)
+        self.label = label
+        self.marker = f"mpm-session-{uuid.uuid4().hex}"
+        """Line ending each request, unlikely to be printed by anything else."""
+        logging.debug(f"Start session: {' '.join(self.args)}", extra={"label": label})
+        self.process = subprocess.Popen(
+            self.args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env_copy(extra_env),
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            # Out of the terminal's process group, like the one-shot spawns: a
+            # Ctrl+C is handled by mpm, which closes the session.
+            start_new_session=True,
+        )
+        self._stdout: queue.Queue[str | None] = queue.Queue()
+        self._stderr: queue.Queue[str | None] = queue.Queue()
+        self._lock = threading.Lock()
+        for stream, lines in (
+            (self.process.stdout, self._stdout),
+            (self.process.stderr, self._stderr),
+        ):
+            threading.Thread(target=_pump, args=(stream, lines), daemon=True).start()
+        _live_sessions.add(self)
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _read_until_marker(
+        self, lines: queue.Queue[str | None], deadline: float | None
+    ) -> tuple[list[str], str]:
+        """Lines of `lines` up to the marker, and what follows it on its line."""
+        collected: list[str] = []
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, 0)
+            try:
+                line = lines.get(timeout=remaining)
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(self.args, 0) from None
+            if line is None:
+                raise SessionError(f"session exited with code {self.process.wait()}")
+            if line.startswith(self.marker):
+                return collected, line[len(self.marker) :].strip()
+            logging.debug(line, extra={"label": self.label})
+            collected.append(line)
+
+    def request(
+        self, script: str, args: Sequence[str], timeout: float | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """Send `script` and collect its result, standing for a run of `args`.
+
+        Raises {exc}`subprocess.TimeoutExpired` after `timeout` seconds, and
+        {exc}`SessionError` if the child exits before answering. Either way the
+        session is closed: a request left running would garble the next one.
+        The time spent waiting for another thread's request counts toward
+        `timeout`, but running out of it then leaves the session untouched.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise subprocess.TimeoutExpired(list(args), timeout or 0)
+        try:
+            return self._request(script, args, timeout, deadline)
+        finally:
+            self._lock.release()
+
+    def _request(
+        self,
+        script: str,
+        args: Sequence[str],
+        timeout: float | None,
+        deadline: float | None,
+    ) -> subprocess.CompletedProcess[str]:
+        """Body of {meth}`request`, run while holding the session's lock."""
+        try:
+            assert self.process.stdin is not None
+            try:
+                self.process.stdin.write(script)
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError, ValueError) as ex:
+                raise SessionError(f"cannot write to session: {ex}") from ex
+            stdout, status = self._read_until_marker(self._stdout, deadline)
+            stderr, _ = self._read_until_marker(self._stderr, deadline)
+        except subprocess.TimeoutExpired:
+            self.close(force=True)
+            raise subprocess.TimeoutExpired(list(args), timeout or 0) from None
+        except BaseException:
+            self.close(force=True)
+            raise
+        try:
+            code = int(status)
+        except ValueError:
+            self.close(force=True)
+            raise SessionError(f"unexpected exit status: {status!r}") from None
+        return subprocess.CompletedProcess(
+            list(args), code, "\n".join(stdout), "\n".join(stderr)
+        )
+
+    def _kill(self) -> None:
+        """Kill the child along with its process group, on POSIX."""
+        if is_any_windows():
+            self.process.kill()
+        else:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                self.process.kill()
+        self.process.wait()
+
+    def close(self, force: bool = False) -> None:
+        """Stop the child: end of input first, then a kill if it lingers.
+
+        `force` kills it straight away, for a child stuck on a request.
+        """
+        _live_sessions.discard(self)
+        if self.alive:
+            if force:
+                self._kill()
+            else:
+                try:
+                    assert self.process.stdin is not None
+                    self.process.stdin.close()
+                    self.process.wait(timeout=1)
+                except (OSError, ValueError, subprocess.TimeoutExpired):
+                    self._kill()
+        for stream in (self.process.stdin, self.process.stdout, self.process.stderr):
+            if stream is not None:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
@@ -0,0 +1,138 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Client of the REST API snapd serves on its Unix socket.
+
+The `snap` CLI is itself a thin client of the `snapd` daemon: `snap list` is a
+`GET /v2/snaps` on `/run/snapd.socket`, rendered as a localized table. Asking
+the daemon directly returns the same data as JSON, without spawning `snap` nor
+parsing its table.
+
+A {class}`SnapdClient` keeps its connection open between requests, so all the
+queries of an {program}`mpm` invocation share a single one. Reads only need
+the socket to be world-writable, which it is: no privilege is required.
+"""
+
+from __future__ import annotations
+
+import http.client
+import logging
+import socket
+import threading
+from urllib.parse import urlencode
+
+from .json_decoder import loads
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+class SnapdError(Exception):
+    """The daemon could not be reached, or did not answer with a result."""
+
+    def __init__(self, message: str, kind: str | None = None) -> None:
+        super().__init__(message)
+        self.kind = kind
+        """Error kind reported by snapd, like `snap-not-found`. `None` for a
+        transport failure."""
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection to a Unix socket instead of a TCP port."""
+
+    def __init__(self, socket_path: Path, timeout: float | None = None) -> None:
+        super().__init__("localhost")
+        self.socket_path = socket_path
+        self.socket_timeout = timeout
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.socket_timeout)
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class SnapdClient:
+    """Keep-alive HTTP client of snapd, safe to share between threads.
+
+    Requests are serialized on the single connection: snapd answers reads in a
+    few milliseconds, far below the cost of opening a connection per thread.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        timeout: float | None = None,
+        label: str | None = None,
+    ) -> None:
+        self.socket_path = socket_path
+        self.label = label
+        self._connection = _UnixHTTPConnection(socket_path, timeout)
+        self._lock = threading.Lock()
+
+    def _request(self, url: str) -> tuple[int, bytes]:
+        """Status and body of a `GET` of `url`.
+
+        A connection left idle may have been closed by snapd in the meantime:
+        the request is then retried once on a fresh connection.
+        """
+        reused = self._connection.sock is not None
+        try:
+            self._connection.request("GET", url, headers={"Accept": "application/json"})
+            response = self._connection.getresponse()
+            return response.status, response.read()
+        except (ConnectionError, http.client.BadStatusLine) as ex:
+            self._connection.close()
+            if not reused:
+                raise SnapdError(f"snapd connection failed: {ex}") from ex
+        except (OSError, http.client.HTTPException) as ex:
+            self._connection.close()
+            raise SnapdError(f"snapd connection failed: {ex}") from ex
+        return self._request(url)
+
+    def get(self, path: str, **params: str) -> Any:
+        """Result of a `GET` of the API endpoint at `path`, decoded from JSON.
+
+        Raises {exc}`SnapdError` on a transport failure, and on an answer that
+        is not a successful synchronous response.
+        """
+        url = f"{path}?{urlencode(params)}" if params else path
+        logging.info(f"GET {url} on {self.socket_path}", extra={"label": self.label})
+        with self._lock:
+            status, body = self._request(url)
+        try:
+            response = loads(body)
+        except ValueError as ex:
+            raise SnapdError(f"unexpected snapd response: {ex}") from ex
+        if not isinstance(response, dict) or "result" not in response:
+            raise SnapdError(f"unexpected snapd response: {body[:100]!r}")
+        result = response["result"]
+        if response.get("type") == "error" or status >= 400:
+            error = result if isinstance(result, dict) else {}
+            raise SnapdError(
+                str(error.get("message") or f"snapd returned HTTP {status}"),
+                kind=error.get("kind"),
+            )
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
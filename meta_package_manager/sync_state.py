@@ -0,0 +1,309 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Freshness tracking of the `sync` operation.
+
+A `sync` refreshes a manager's view of its remote indexes (`apt update`, `brew
+update`, `pkg update`), the slowest read-adjacent step of a routine `outdated`
+check. Recording when each manager last synced successfully lets a caller skip
+the managers whose indexes are still fresh enough for its purpose: the
+`--max-sync-age` option of `sync` and `outdated` consults {class}`SyncState` for
+exactly that.
+
+The same state file carries the managers a detached background worker
+({func}`start_background_sync`) is currently syncing. A later invocation leaves
+those alone instead of piling up a second sync behind the first, and picks up
+their fresh timestamps as soon as the worker records them.
+
+The state lives in a small JSON document next to the configuration file, in the
+{func}`click.get_app_dir` folder, so it needs no optional dependency:
+
+```{code-block} json
+{
+  "synced": {"apt": "2026-10-18T08:12:44+00:00", "brew": "2026-10-18T07:58:02+00:00"},
+  "pending": {"snap": {"pid": 48210, "started": "2026-10-18T08:20:00+00:00"}}
+}
+```
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import subprocess
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Final
+
+import click
+from extra_platforms import is_any_windows
+
+from .execution import MUTATING_TIMEOUT
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+SYNC_STATE_FILENAME: Final = "sync-state.json"
+"""Name of the state file, in the {func}`click.get_app_dir` folder of `mpm`."""
+
+BACKGROUND_LOG_FILENAME: Final = "sync-background.log"
+"""Name of the file collecting the output of the last background sync worker."""
+
+PENDING_SYNC_TTL: Final = timedelta(seconds=MUTATING_TIMEOUT)
+"""Age beyond which a recorded background sync is presumed dead.
+
+A worker is bounded by the timeout of its `sync` calls, so one still pending
+after that long crashed or was killed before clearing its entry. Also the only
+liveness check on Windows, where probing a PID with `os.kill` would terminate
+it."""
+
+
+def sync_state_path() -> Path:
+    """Location of the sync state file."""
+    return Path(click.get_app_dir("mpm")) / SYNC_STATE_FILENAME
+
+
+def _parse_timestamp(value: object) -> datetime | None:
+    """Parse an ISO 8601 timestamp of the state file, `None` if malformed."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _pid_alive(pid: object) -> bool:
+    """Whether a process with `pid` still exists.
+
+    Always `True` on Windows, where only {data}`PENDING_SYNC_TTL` applies.
+    """
+    if not isinstance(pid, int) or pid <= 0:
+        return False
+    if is_any_windows():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists, but owned by someone else.
+        return True
+    return True
+
+
+class SyncState:
+    """Per-manager timestamps of the last successful `sync`, and the syncs a
+    background worker has in flight.
+
+    Every write holds an exclusive lock while it re-reads the file, merges into
+    it and atomically replaces it, so the foreground invocation and a background
+    worker recording their own managers at the same time do not erase each
+    other's entries. A missing or corrupted file reads as empty, and a lock that
+    cannot be taken is skipped: the worst outcome is a redundant sync.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path if path is not None else sync_state_path()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on the state for a read-modify-write.
+
+        The lock is taken on a sidecar file, as the state file itself is replaced
+        by each write. It is released when its file is closed, including by the
+        OS if the process dies while holding it.
+        """
+        lock_path = self.path.with_name(f"{self.path.name}.lock")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            lock_file = lock_path.open("a+b")
+        except OSError as exc:
+            logging.warning(f"Cannot lock sync state {lock_path}: {exc}")
+            yield
+            return
+        with lock_file:
+            try:
+                if sys.platform == "win32":
+                    import msvcrt
+
+                    lock_file.seek(0)
+                    # Retries for 10 seconds before giving up.
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                else:
+                    import fcntl
+
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            except OSError as exc:
+                logging.warning(f"Cannot lock sync state {lock_path}: {exc}")
+            yield
+
+    def _read(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="UTF-8"))
+        except (OSError, ValueError):
+            return {"synced": {}, "pending": {}}
+        if not isinstance(data, dict):
+            data = {}
+        for key in ("synced", "pending"):
+            if not isinstance(data.get(key), dict):
+                data[key] = {}
+        return data
+
+    def _write(self, data: dict) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, indent=2), encoding="UTF-8")
+            tmp_path.replace(self.path)
+        except OSError as exc:
+            logging.warning(f"Cannot record sync state to {self.path}: {exc}")
+
+    def last_synced(self, manager_id: str) -> datetime | None:
+        """When `manager_id` last synced successfully, if ever recorded."""
+        return _parse_timestamp(self._read()["synced"].get(manager_id))
+
+    def is_fresh(
+        self, manager_id: str, max_age: timedelta, now: datetime | None = None
+    ) -> bool:
+        """Whether `manager_id` synced successfully less than `max_age` ago."""
+        last = self.last_synced(manager_id)
+        if last is None:
+            return False
+        now = now or datetime.now(timezone.utc)
+        return now - last < max_age
+
+    def is_pending(self, manager_id: str, now: datetime | None = None) -> bool:
+        """Whether a live background worker is currently syncing `manager_id`."""
+        entry = self._read()["pending"].get(manager_id)
+        if not isinstance(entry, dict):
+            return False
+        started = _parse_timestamp(entry.get("started"))
+        if started is None:
+            return False
+        now = now or datetime.now(timezone.utc)
+        return now - started < PENDING_SYNC_TTL and _pid_alive(entry.get("pid"))
+
+    def record_synced(
+        self, manager_ids: Iterable[str], when: datetime | None = None
+    ) -> None:
+        """Stamp `manager_ids` as freshly synced."""
+        manager_ids = list(manager_ids)
+        if not manager_ids:
+            return
+        stamp = (when or datetime.now(timezone.utc)).isoformat()
+        with self._locked():
+            data = self._read()
+            for manager_id in manager_ids:
+                data["synced"][manager_id] = stamp
+            self._write(data)
+
+    def record_pending(
+        self, manager_ids: Iterable[str], pid: int, when: datetime | None = None
+    ) -> None:
+        """Register `manager_ids` as being synced by the worker process `pid`."""
+        with self._locked():
+            self._record_pending(manager_ids, pid, when)
+
+    def _record_pending(
+        self, manager_ids: Iterable[str], pid: int, when: datetime | None = None
+    ) -> None:
+        """{meth}`record_pending`, for a caller already holding the lock."""
+        manager_ids = list(manager_ids)
+        if not manager_ids:
+            return
+        entry = {"pid": pid, "started": (when or datetime.now(timezone.utc)).isoformat()}
+        data = self._read()
+        for manager_id in manager_ids:
+            data["pending"][manager_id] = entry
+        self._write(data)
+
+    def clear_pending(self, manager_ids: Iterable[str]) -> None:
+        """Drop the in-flight markers of `manager_ids`."""
+        with self._locked():
+            data = self._read()
+            cleared = [mid for mid in manager_ids if data["pending"].pop(mid, None)]
+            if cleared:
+                self._write(data)
+
+
+def start_background_sync(
+    manager_ids: Iterable[str], state: SyncState | None = None
+) -> int | None:
+    """Spawn a detached `mpm sync` worker for `manager_ids` and return its PID.
+
+    The worker re-enters the running interpreter (or the compiled binary itself,
+    mirroring
+    {attr}`meta_package_manager.bar_plugin_renderer.BarPluginRenderer.mpm_cli`)
+    in a new session, so it outlives the invocation that started it and is not
+    reached by its terminal's signals. Its output lands in
+    {data}`BACKGROUND_LOG_FILENAME`, next to the state file.
+
+    The state stays locked from the spawn until the worker's pending markers are
+    recorded. A worker done before that waits on the lock to clear them, instead
+    of clearing nothing and leaving markers that only expire with
+    {data}`PENDING_SYNC_TTL`.
+
+    With no terminal to prompt on, a manager needing `sudo` only syncs if the
+    credential cache is warm or a `NOPASSWD` rule applies; it fails fast
+    otherwise, and keeps its stale timestamp.
+    """
+    manager_ids = list(manager_ids)
+    if not manager_ids:
+        return None
+    state = state if state is not None else SyncState()
+
+    if "__compiled__" in globals():
+        mpm_cli: tuple[str, ...] = (sys.executable,)
+    else:
+        mpm_cli = (sys.executable, "-m", "meta_package_manager")
+    cmd = (
+        *mpm_cli,
+        "--no-color",
+        "--no-summary",
+        *(f"--{manager_id}" for manager_id in manager_ids),
+        "sync",
+    )
+
+    log_path = state.path.with_name(BACKGROUND_LOG_FILENAME)
+    detach: dict = (
+        {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}  # type: ignore[attr-defined]
+        if is_any_windows()
+        else {"start_new_session": True}
+    )
+    with state._locked():
+        try:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with log_path.open("wb") as log:
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    **detach,
+                )
+        except OSError as exc:
+            logging.warning(f"Cannot start background sync: {exc}")
+            return None
+        state._record_pending(manager_ids, process.pid)
+    logging.info(
+        f"Background sync started (PID {process.pid}), logging to {log_path}."
+    )
+    return process.pid
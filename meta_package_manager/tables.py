@@ -294,6 +294,84 @@ WHICH_COLUMNS: tuple[tuple[ColumnSpec, str | None], ...] = (
 )
 """Columns of the `mpm which` table."""
 
+DIFF_COLUMNS: tuple[tuple[ColumnSpec, str | None], ...] = (
+    (
+        ColumnSpec("manager_id", "Manager", "Manager reporting the package."),
+        SortableField.MANAGER_ID,
+    ),
+    (
+        ColumnSpec("package_id", "Package ID", "Package's identifier."),
+        SortableField.PACKAGE_ID,
+    ),
+    (
+        ColumnSpec(
+            "change",
+            "Change",
+            "One of added, removed, upgraded or downgraded.",
+        ),
+        None,
+    ),
+    (
+        ColumnSpec(
+            "old_version",
+            "Old version",
+            "Version in the old snapshot.",
+            max_width=AUTO_WIDTH,
+        ),
+        None,
+    ),
+    (
+        ColumnSpec(
+            "new_version",
+            "New version",
+            "Version in the new snapshot, or installed.",
+            max_width=AUTO_WIDTH,
+        ),
+        SortableField.VERSION,
+    ),
+)
+"""Columns of the `mpm diff` table."""
+
+AGGREGATE_COLUMNS: tuple[tuple[ColumnSpec, str | None], ...] = (
+    (
+        ColumnSpec("manager_id", "Manager", "Manager reporting the package."),
+        SortableField.MANAGER_ID,
+    ),
+    (
+        ColumnSpec("package_id", "Package ID", "Package's identifier."),
+        SortableField.PACKAGE_ID,
+    ),
+    (
+        ColumnSpec(
+            "newest_version",
+            "Newest version",
+            "Highest version seen across the fleet.",
+            max_width=AUTO_WIDTH,
+        ),
+        SortableField.VERSION,
+    ),
+    (
+        ColumnSpec("hosts", "Hosts", "Number of hosts carrying the package."),
+        None,
+    ),
+    (
+        ColumnSpec(
+            "lagging", "Lagging", "Number of hosts holding an older version."
+        ),
+        None,
+    ),
+    (
+        ColumnSpec(
+            "versions",
+            "Versions",
+            "Host count of each version, newest first.",
+            max_width=AUTO_WIDTH,
+        ),
+        None,
+    ),
+)
+"""Columns of the `mpm aggregate` table."""
+
 
 def column_specs(
     columns: Sequence[tuple[ColumnSpec, str | None]],
@@ -116,7 +116,8 @@ from __future__ import annotations
 import operator
 import re
 from copy import deepcopy
-from functools import total_ordering
+from functools import lru_cache, total_ordering
+from typing import Final
 
 from boltons import strutils
 from click_extra import style
@@ -191,10 +192,15 @@ class Token:
 
     Supports natural comparison with `str` and `int` types.
     Used to compare versions and package IDs.
+
+    Slotted, as every parsed version holds a handful of them: no per-instance
+    `__dict__` to allocate.
     """
 
+    __slots__ = ("integer", "string")
+
     string: str
-    integer: int | None = None
+    integer: int | None
 
     def __hash__(self):
         """A Token is made unique by a tuple of its immutable internal data."""
@@ -246,7 +252,7 @@ class Token:
     def __repr__(self) -> str:
         """Prints internal string and number values for debug."""
         return "<Token:{}>".format(
-            ",".join(f"{k}={v!r}" for k, v in self.__dict__.items()),
+            ",".join(f"{k}={getattr(self, k)!r}" for k in ("string", "integer")),
         )
 
     def __str__(self) -> str:
@@ -315,18 +321,34 @@ class Token:
 class TokenizedString:
     """Tokenize a string for user-friendly sorting.
 
-    Essentially a wrapper around a list of `Token` instances.
+    Essentially a wrapper around a list of `Token` instances. Slotted like
+    {class}`Token`: an inventory holds two of them per package.
     """
 
+    __slots__ = (
+        "epoch",
+        "original_segments",
+        "release",
+        "separators",
+        "sort_key",
+        "string",
+        "tokens",
+    )
+
     string: str
-    tokens: tuple[Token, ...] = ()
-    separators: tuple[str, ...] = ()
-    original_segments: tuple[str, ...] = ()
+    tokens: tuple[Token, ...]
+    separators: tuple[str, ...]
+    original_segments: tuple[str, ...]
     """Original-case token strings for lossless `pretty_print()`."""
-    epoch: int = 0
+    epoch: int
     """Leading epoch (`N:` or `N!`); dominates comparison, `0` when absent."""
-    release: tuple[Token, ...] = ()
+    release: tuple[Token, ...]
     """Comparison tokens with the epoch removed. See `_split_epoch()`."""
+    sort_key: tuple | None
+    """Natively comparable form of the version. See `_build_sort_key()`.
+
+    `None` for the versions carrying a post-release tag, which only
+    `_compare_tuples()` orders properly."""
 
     def __hash__(self):
         """A `TokenizedString` is made unique by its original string and tuple of
@@ -353,18 +375,24 @@ class TokenizedString:
         # Returns the instance as-is if of the same class. Do not reparse it.
         if value and isinstance(value, TokenizedString):
             return value
+        # Share the parsed instance of a value already seen.
+        if isinstance(value, (str, int)):
+            return _intern(cls, value)
         # Create a brand new instance. __init__() will be auto-magiccaly called
         # after that.
         return super().__new__(cls)
 
     def __init__(self, value: str | int) -> None:
         """Parse and tokenize the provided raw `value`."""
-        if isinstance(value, TokenizedString):
-            # Skip initialization for instance of the class, as this __init__() gets
-            # called auto-magiccaly eveytime the __new__() method above returns a
-            # TokenizedString instance.
+        if isinstance(value, TokenizedString) or hasattr(self, "string"):
+            # Skip initialization for already parsed instances, as this __init__()
+            # gets called auto-magiccaly eveytime the __new__() method above returns
+            # a TokenizedString instance.
             return
-        # Our canonical __init__() starts here.
+        self._parse(value)
+
+    def _parse(self, value: str | int) -> None:
+        """Tokenize `value` and precompute its comparison data."""
         if isinstance(value, int):
             self.string = str(value)
         elif isinstance(value, str):
@@ -376,6 +404,7 @@ class TokenizedString:
             self.string,
         )
         self.epoch, self.release = self._split_epoch(self.tokens, self.separators)
+        self.sort_key = self._build_sort_key(self.epoch, self.release)
 
     def __deepcopy__(self, memo):
         """Generic recursive deep copy of the current instance.
@@ -395,9 +424,9 @@ class TokenizedString:
         # Create a new instance of the object based on extracted class
         instance = super().__new__(cls)
         memo[id(self)] = instance
-        for k, v in self.__dict__.items():
+        for k in self.__slots__:
             # Recursively copy the whole tree of objects.
-            setattr(instance, k, deepcopy(v, memo))
+            setattr(instance, k, deepcopy(getattr(self, k), memo))
         return instance
 
     def __repr__(self) -> str:
@@ -446,7 +475,7 @@ class TokenizedString:
         # replacement happens on the lowered split parts, before Token
         # creation. original_segments (used by pretty_print) are unaffected.
         tokens = tuple(
-            Token(TOKEN_ALIASES.get(parts[i], parts[i]))
+            _intern_token(TOKEN_ALIASES.get(parts[i], parts[i]))
             for i in range(1, len(parts), 2)
         )
         separators = tuple(parts[i] for i in range(2, len(parts) - 1, 2))
@@ -455,7 +484,12 @@ class TokenizedString:
         # is already ASCII lowercase (the common case), the normalized split
         # is identical and we skip the second regex.
         if normalized_str == string:
-            orig_segments = tuple(parts[i] for i in range(1, len(parts), 2))
+            # Reuse the strings of the shared tokens rather than keeping a second
+            # copy of each segment.
+            orig_segments = tuple(
+                token.string if token.string == parts[i] else parts[i]
+                for token, i in zip(tokens, range(1, len(parts), 2))
+            )
         else:
             orig_parts = ALNUM_EXTRACTOR_CI.split(string)
             orig_segments = tuple(orig_parts[i] for i in range(1, len(orig_parts), 2))
@@ -576,6 +610,48 @@ class TokenizedString:
             longer_wins = -1
         return -longer_wins if len(a) < len(b) else longer_wins
 
+    @staticmethod
+    def _build_sort_key(epoch: int, release: tuple[Token, ...]) -> tuple | None:
+        """Encode the version into a tuple ordered like `_cmp()`.
+
+        Precomputed once at parsing, so comparing two versions is a native tuple
+        comparison instead of a walk through their `Token` pairs.
+
+        The epoch comes first. Each non-zero token of the `v`-stripped release
+        then adds three items, tagged with the count of zero tokens before it:
+
+        - an integer `n` after `z` zeros encodes as `2, -z, n`,
+        - a string `s` after `z` zeros encodes as `0, z, s`.
+
+        A trailing `1, 0, ""` marks the end of the release, and the zeros
+        preceding it are dropped. This is the padding rule of `_compare_tuples()`
+        spelled out: a version running out of tokens compares as an endless run of
+        zeros, which an integer beats and a pre-release tag loses to.
+
+        Items are laid flat rather than nested in one tuple per token, which
+        would cost every parsed version a tuple per token on top of its `Token`
+        instances. Every group being three items long keeps them aligned.
+
+        Post-release tags beat that end marker, but compare as plain strings
+        against other tags in the middle of a version. No element can be both,
+        so versions carrying one get no key and fall back to `_cmp()`.
+        """
+        key: list = [epoch]
+        zeros = 0
+        for token in TokenizedString._strip_v(release):
+            if token.integer == 0:
+                zeros += 1
+                continue
+            if token.isint:
+                key += (2, -zeros, token.integer)
+            elif token.string in POST_RELEASE_TAGS:
+                return None
+            else:
+                key += (0, zeros, token.string)
+            zeros = 0
+        key += (1, 0, "")
+        return tuple(key)
+
     def _cmp(self, other: TokenizedString) -> int:
         """Three-way comparison with epoch dominance.
 
@@ -598,6 +674,8 @@ class TokenizedString:
         if other is None:
             return False
         if isinstance(other, TokenizedString):
+            if self.sort_key is not None and other.sort_key is not None:
+                return self.sort_key == other.sort_key
             return self._cmp(other) == 0
         if isinstance(other, tuple):
             return tuple(self) == tuple(other)
@@ -607,10 +685,36 @@ class TokenizedString:
         if other is None:
             return False
         if isinstance(other, TokenizedString):
+            if self.sort_key is not None and other.sort_key is not None:
+                return self.sort_key < other.sort_key
             return self._cmp(other) < 0
         return NotImplemented
 
 
+VERSION_CACHE_SIZE: Final = 2**16
+"""Number of distinct raw versions whose parsed {class}`TokenizedString` is kept.
+
+The same version strings come back over and over, from one manager to the next
+(`1.0.0`) and within a single one (a Debian revision shared by every package of a
+source). Each one is only tokenized the first time it is seen, and all its
+occurrences share one instance. Bounded, as a long-lived process like the bar
+plugin may see an unbounded stream of them."""
+
+
+@lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _intern_token(value: str) -> Token:
+    """Share one {class}`Token` between all the versions made of the same word."""
+    return Token(value)
+
+
+@lru_cache(maxsize=VERSION_CACHE_SIZE, typed=True)
+def _intern(cls: type[TokenizedString], value: str | int) -> TokenizedString:
+    """Parse `value` once, and return the same instance on every later call."""
+    instance = object.__new__(cls)
+    instance._parse(value)
+    return instance
+
+
 parse_version = TokenizedString
 """Alias for `TokenizedString` used in version-comparison contexts."""
 
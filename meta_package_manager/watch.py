@@ -0,0 +1,377 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Filesystem watches on the state of package managers.
+
+`mpm watch` keeps a snapshot of each manager's packages and only re-queries a
+manager when one of its
+{attr}`~meta_package_manager.manager.PackageManager.watch_paths` changes, like
+`/var/lib/dpkg/status` after an `apt install`.
+
+Changes are detected by a {class}`Watcher`:
+
+- {class}`InotifyWatcher` subscribes to kernel notifications on Linux, through
+  `ctypes` bindings to the C library ({data}`inotify_support`);
+- {class}`PollingWatcher` compares `stat()` signatures at a fixed interval
+  everywhere else.
+
+Both follow the same rules: a directory is watched along with its immediate
+subdirectories, so a new version folder in the Homebrew Cellar is seen, and a
+file is watched through its parent directory, so its atomic replacement by a
+rename is seen too.
+
+A single transaction touches the same path many times: dpkg rewrites its status
+file once per unpacked package. {func}`coalesce` merges such bursts, so each
+manager is re-queried once the burst is over.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import stat
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Final
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+    from .manager import PackageManager
+
+
+WATCH_DEBOUNCE: Final = 2.0
+"""Seconds without any change closing a burst of changes."""
+
+WATCH_MAX_DELAY: Final = 30.0
+"""Seconds after which a burst is closed anyway, so a manager busy for long is
+still reported while it works."""
+
+POLL_INTERVAL: Final = 2.0
+"""Seconds between two scans of {class}`PollingWatcher`."""
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    """The C library, if it provides the inotify API (Linux only)."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_init1.argtypes = (ctypes.c_int,)
+        libc.inotify_add_watch.argtypes = (
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        )
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_libc: Final = _load_libc()
+
+inotify_support: Final = _libc is not None
+"""Whether changes can be awaited from the kernel instead of polled."""
+
+
+# Event masks, from <sys/inotify.h>.
+IN_MODIFY: Final = 0x00000002
+IN_ATTRIB: Final = 0x00000004
+IN_CLOSE_WRITE: Final = 0x00000008
+IN_MOVED_FROM: Final = 0x00000040
+IN_MOVED_TO: Final = 0x00000080
+IN_CREATE: Final = 0x00000100
+IN_DELETE: Final = 0x00000200
+IN_DELETE_SELF: Final = 0x00000400
+IN_MOVE_SELF: Final = 0x00000800
+IN_IGNORED: Final = 0x00008000
+IN_ISDIR: Final = 0x40000000
+
+WATCH_MASK: Final = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+"""Every event changing the content, metadata or presence of an entry."""
+
+_EVENT_HEADER: Final = struct.Struct("iIII")
+"""`wd`, `mask`, `cookie` and `len` fields of a `struct inotify_event`."""
+
+
+def resolve_watch_paths(manager: PackageManager) -> tuple[Path, ...]:
+    """Expand the watch paths of `manager`, keeping the ones that can be watched.
+
+    A path referencing an unset environment variable, or whose parent directory
+    does not exist, is dropped. Duplicates are removed, first occurrence first.
+    """
+    paths: list[Path] = []
+    for raw_path in manager.watch_paths:
+        expanded = os.path.expandvars(os.path.expanduser(raw_path))
+        if "$" in expanded:
+            continue
+        path = Path(expanded)
+        if path.parent.is_dir() and path not in paths:
+            paths.append(path)
+    return tuple(paths)
+
+
+def diff_packages(
+    before: Mapping[str, str | None], after: Mapping[str, str | None]
+) -> dict[str, list[dict[str, str | None]]]:
+    """Compare two `{package_id: version}` snapshots of a manager.
+
+    Returns the `added`, `removed` and `changed` packages, each sorted by ID.
+    """
+    return {
+        "added": [
+            {"id": package_id, "version": after[package_id]}
+            for package_id in sorted(after.keys() - before.keys())
+        ],
+        "removed": [
+            {"id": package_id, "version": before[package_id]}
+            for package_id in sorted(before.keys() - after.keys())
+        ],
+        "changed": [
+            {"id": package_id, "from": before[package_id], "to": after[package_id]}
+            for package_id in sorted(before.keys() & after.keys())
+            if before[package_id] != after[package_id]
+        ],
+    }
+
+
+def _subdirectories(directory: Path) -> Iterator[Path]:
+    """Immediate subdirectories of `directory`, symlinks excluded."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield Path(entry.path)
+    except OSError:
+        return
+
+
+class Watcher:
+    """Reports the managers whose watch paths changed.
+
+    `targets` maps manager IDs to their resolved watch paths (see
+    {func}`resolve_watch_paths`). Several managers may share a path, like the RPM
+    database read by both `dnf` and `zypper`.
+    """
+
+    def __init__(self, targets: Mapping[str, Sequence[Path]]) -> None:
+        self.targets = targets
+
+    def read(self, timeout: float | None) -> set[str]:
+        """Wait up to `timeout` seconds (forever if `None`) for changes.
+
+        Returns the IDs of the managers concerned, or an empty set on timeout.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> Watcher:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class InotifyWatcher(Watcher):
+    """Awaits changes from the Linux kernel's inotify API."""
+
+    def __init__(self, targets: Mapping[str, Sequence[Path]]) -> None:
+        super().__init__(targets)
+        assert _libc is not None
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+        self._directories: dict[int, Path] = {}
+        # Subscribers of each watched directory: the entry name they are
+        # interested in (`None` for any), and their manager ID.
+        self._subscribers: dict[Path, list[tuple[str | None, str]]] = {}
+        # Managers watching a directory with its subdirectories.
+        self._roots: dict[Path, set[str]] = {}
+        for manager_id, paths in targets.items():
+            for path in paths:
+                if path.is_dir():
+                    self._roots.setdefault(path, set()).add(manager_id)
+                    self._add(path, None, manager_id)
+                    for subdirectory in _subdirectories(path):
+                        self._add(subdirectory, None, manager_id)
+                else:
+                    self._add(path.parent, path.name, manager_id)
+
+    def _add(self, directory: Path, name: str | None, manager_id: str) -> None:
+        assert _libc is not None
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            logging.debug(
+                f"Cannot watch {directory}: {os.strerror(ctypes.get_errno())}",
+                extra={"label": manager_id},
+            )
+            return
+        self._directories[wd] = directory
+        self._subscribers.setdefault(directory, []).append((name, manager_id))
+
+    def read(self, timeout: float | None) -> set[str]:
+        changed: set[str] = set()
+        if not select.select((self._fd,), (), (), timeout)[0]:
+            return changed
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                self._dispatch(wd, mask, name, changed)
+
+    def _dispatch(self, wd: int, mask: int, name: str, changed: set[str]) -> None:
+        directory = self._directories.get(wd)
+        if directory is None:
+            return
+        if mask & IN_IGNORED:
+            del self._directories[wd]
+            return
+        for wanted, manager_id in self._subscribers[directory]:
+            if wanted is None or wanted == name:
+                changed.add(manager_id)
+        # A new subdirectory of a watched root is watched too.
+        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+            for manager_id in self._roots.get(directory, ()):
+                self._add(directory / name, None, manager_id)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def _signature(path: Path) -> tuple:
+    """Inode, modification time, size and link count of `path` and, for a
+    directory, of its entries. Empty if `path` does not exist."""
+    try:
+        path_stat = path.stat()
+    except OSError:
+        return ()
+    signature: list[tuple] = [
+        (
+            "",
+            path_stat.st_ino,
+            path_stat.st_mtime_ns,
+            path_stat.st_size,
+            path_stat.st_nlink,
+        )
+    ]
+    if stat.S_ISDIR(path_stat.st_mode):
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    signature.append((
+                        entry.name,
+                        entry_stat.st_ino,
+                        entry_stat.st_mtime_ns,
+                        entry_stat.st_size,
+                        entry_stat.st_nlink,
+                    ))
+        except OSError:
+            pass
+    return tuple(sorted(signature))
+
+
+class PollingWatcher(Watcher):
+    """Scans the watch paths every `interval` seconds, on any platform."""
+
+    def __init__(
+        self, targets: Mapping[str, Sequence[Path]], interval: float = POLL_INTERVAL
+    ) -> None:
+        super().__init__(targets)
+        self.interval = interval
+        self._signatures = {
+            path: _signature(path) for paths in targets.values() for path in paths
+        }
+
+    def read(self, timeout: float | None) -> set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed_paths = set()
+            for path, previous in self._signatures.items():
+                current = _signature(path)
+                if current != previous:
+                    self._signatures[path] = current
+                    changed_paths.add(path)
+            if changed_paths:
+                return {
+                    manager_id
+                    for manager_id, paths in self.targets.items()
+                    if changed_paths.intersection(paths)
+                }
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, deadline - time.monotonic())
+                if delay <= 0:
+                    return set()
+            time.sleep(delay)
+
+
+def make_watcher(targets: Mapping[str, Sequence[Path]]) -> Watcher:
+    """The best {class}`Watcher` available on this platform."""
+    if inotify_support:
+        return InotifyWatcher(targets)
+    return PollingWatcher(targets)
+
+
+def coalesce(
+    watcher: Watcher,
+    debounce: float = WATCH_DEBOUNCE,
+    max_delay: float = WATCH_MAX_DELAY,
+) -> Iterator[set[str]]:
+    """Yield the managers changed by each burst of changes, endlessly.
+
+    A burst starts with the first change and ends after `debounce` seconds
+    without any other, or `max_delay` seconds after it started.
+    """
+    while True:
+        changed = watcher.read(None)
+        if not changed:
+            continue
+        deadline = time.monotonic() + max_delay
+        while (remaining := deadline - time.monotonic()) > 0:
+            more = watcher.read(min(debounce, remaining))
+            if not more:
+                break
+            changed |= more
+        yield changed
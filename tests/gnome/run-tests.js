@@ -89,6 +89,10 @@ function testArgvBuilders() {
         '/usr/bin/mpm', '--no-color', '--verbosity', 'CRITICAL',
         '--timeout', '42', '--table-format', 'json', 'outdated',
     ]);
+    check('outdatedArgv pipelined sync', Mpm.outdatedArgv(mpm, 42, true), [
+        '/usr/bin/mpm', '--no-color', '--verbosity', 'CRITICAL',
+        '--timeout', '42', '--table-format', 'json', 'outdated', '--sync',
+    ]);
     check('upgradePackageArgv',
         Mpm.upgradePackageArgv(mpm, 'brew', 'wget'),
         ['/usr/bin/mpm', '--brew', 'upgrade', 'wget']);
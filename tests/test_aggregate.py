@@ -0,0 +1,146 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+
+from __future__ import annotations
+
+import json
+
+import pytest
+import tomli_w
+
+from meta_package_manager import aggregate as aggregate_module
+from meta_package_manager.aggregate import aggregate_files, read_inventory
+
+
+def _write_json(path, inventory):
+    """Write `inventory` in the shape of `mpm --table-format json installed`."""
+    path.write_text(
+        json.dumps({
+            manager_id: {
+                "id": manager_id,
+                "name": manager_id,
+                "packages": [
+                    {"id": package_id, "name": None, "installed_version": version}
+                    for package_id, version in packages.items()
+                ],
+                "errors": [],
+            }
+            for manager_id, packages in inventory.items()
+        })
+    )
+    return path
+
+
+def _write_toml(path, inventory):
+    """Write `inventory` in the shape of `mpm dump`."""
+    path.write_text("# Generated by mpm.\n" + tomli_w.dumps(inventory))
+    return path
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    """Ten hosts, half of them exported as JSON. `host-9` lags on everything."""
+    paths = []
+    for index in range(10):
+        inventory = {
+            "apt": {"sed": "4.9", "curl": "8.5.0"},
+            "pip": {"requests": "2.31.0"},
+        }
+        if index == 3:
+            inventory["apt"]["curl"] = "8.10.0"
+        if index == 9:
+            inventory = {
+                "apt": {"sed": "4.8", "curl": "7.88.1"},
+                "pip": {"requests": "2.28.0"},
+            }
+        write = _write_json if index % 2 else _write_toml
+        suffix = ".json" if index % 2 else ".toml"
+        paths.append(str(write(tmp_path / f"host-{index}{suffix}", inventory)))
+    return paths
+
+
+def test_read_inventory_formats(tmp_path):
+    inventory = {"apt": {"sed": "4.9"}, "npm": {"@scope/pkg": "1.0.0"}}
+    expected = [("apt", "sed", "4.9"), ("npm", "@scope/pkg", "1.0.0")]
+    assert list(read_inventory(_write_json(tmp_path / "a.json", inventory))) == expected
+    assert list(read_inventory(_write_toml(tmp_path / "a.toml", inventory))) == expected
+    # Unknown extensions are sniffed.
+    assert list(read_inventory(_write_toml(tmp_path / "a.txt", inventory))) == expected
+    assert list(read_inventory(_write_json(tmp_path / "b.txt", inventory))) == expected
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_aggregate(fleet, monkeypatch, jobs):
+    # Small batches, so the parallel run folds several of them.
+    monkeypatch.setattr(aggregate_module, "BATCH_SIZE", 3)
+    packages, outliers = aggregate_files(fleet, jobs=jobs).report()
+
+    curl = packages["apt"]["curl"]
+    assert curl["hosts"] == 10
+    # 8.10.0 is newer than 8.5.0, whatever the lexicographic order says.
+    assert curl["newest"] == "8.10.0"
+    assert curl["versions"] == {"8.10.0": 1, "8.5.0": 8, "7.88.1": 1}
+    assert curl["lagging"] == sorted(path for path in fleet if "host-3" not in path)
+
+    assert packages["apt"]["sed"]["lagging"] == [fleet[9]]
+    assert packages["pip"]["requests"] == {
+        "hosts": 10,
+        "newest": "2.31.0",
+        "versions": {"2.31.0": 9, "2.28.0": 1},
+        "lagging": [fleet[9]],
+    }
+
+    assert [outlier["host"] for outlier in outliers] == [fleet[9]]
+    assert outliers[0]["lagging"] == 3
+
+
+def test_aggregate_unreadable_inventory(fleet, tmp_path):
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json")
+    fleet = aggregate_files([*fleet, str(broken)])
+    assert list(fleet.failures) == [10]
+    packages, outliers = fleet.report()
+    assert packages["apt"]["sed"]["hosts"] == 10
+    assert [outlier["host"] for outlier in outliers] == [fleet.hosts[9]]
+
+
+def test_no_outlier_in_uniform_fleet(tmp_path):
+    paths = [
+        str(_write_toml(tmp_path / f"host-{index}.toml", {"apt": {"sed": "4.9"}}))
+        for index in range(5)
+    ]
+    packages, outliers = aggregate_files(paths).report()
+    assert packages["apt"]["sed"]["lagging"] == []
+    assert outliers == []
+
+
+def test_cli_aggregate(invoke, fleet, tmp_path):
+    result = invoke("--table-format", "json", "aggregate", str(tmp_path))
+    assert result.exit_code == 0
+    report = json.loads(result.stdout)
+    assert report["packages"]["apt"]["sed"]["versions"] == {"4.9": 9, "4.8": 1}
+    assert [outlier["host"] for outlier in report["outliers"]] == [fleet[9]]
+
+    result = invoke("--table-format", "csv", "aggregate", *fleet)
+    assert result.exit_code == 0
+    assert 'apt,curl,8.10.0,10,9,"8.10.0: 1, 8.5.0: 8, 7.88.1: 1"' in result.stdout
+    assert "host-9.json lags on 3 packages" in result.stderr
+
+
+def test_cli_aggregate_empty_directory(invoke, tmp_path):
+    result = invoke("aggregate", str(tmp_path))
+    assert result.exit_code == 2
+    assert "No inventory to aggregate." in result.stderr
@@ -28,7 +28,7 @@ from boltons.iterutils import flatten
 from boltons.strutils import strip_ansi
 from click_extra.color import color_envvars
 from click_extra.execution import args_cleanup
-from extra_platforms.pytest import unless_macos
+from extra_platforms.pytest import skip_all_windows, unless_macos
 
 from meta_package_manager import bar_plugin
 from meta_package_manager.bar_plugin_renderer import (
@@ -110,6 +110,61 @@ def test_search_mpm_stops_at_home(monkeypatch, tmp_path):
     assert uv_candidate(tmp_path) not in candidates
 
 
+def _write_fake_mpm(path, version, counter):
+    """Write an `mpm` script reporting `version` and counting its runs."""
+    path.write_text(
+        f"#!/bin/sh\necho run >> '{counter}'\necho 'mpm, version {version}'\n",
+        encoding="utf-8",
+    )
+    path.chmod(0o755)
+
+
+@skip_all_windows
+def test_ranked_mpm_cache(monkeypatch, tmp_path):
+    """Candidates are only probed again once their fingerprint changed."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    mpm_path = bin_dir / "mpm"
+    counter = tmp_path / "runs"
+    _write_fake_mpm(mpm_path, "6.0.0", counter)
+
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setenv("SWIFTBAR_PLUGIN_CACHE_PATH", str(tmp_path / "cache"))
+    monkeypatch.setattr(
+        bar_plugin.MPMPlugin, "search_mpm", lambda self: iter(((str(mpm_path),),))
+    )
+
+    def ranked():
+        return bar_plugin.MPMPlugin().ranked_mpm
+
+    def probes():
+        return len(counter.read_text().splitlines())
+
+    assert ranked() == [((str(mpm_path),), True, True, (6, 0, 0), None)]
+    assert probes() == 1
+    assert ranked() == [((str(mpm_path),), True, True, (6, 0, 0), None)]
+    assert probes() == 1
+
+    # An upgrade rewrites the script.
+    _write_fake_mpm(mpm_path, "4.2.0", counter)
+    os.utime(mpm_path, ns=(0, 0))
+    assert ranked() == [((str(mpm_path),), True, False, (4, 2, 0), None)]
+    assert probes() == 2
+    assert ranked()[0][3] == (4, 2, 0)
+    assert probes() == 2
+
+    # A new plugin version drops the whole state.
+    monkeypatch.setattr(bar_plugin.MPMPlugin, "plugin_version", "99.0.0")
+    assert ranked()[0][3] == (4, 2, 0)
+    assert probes() == 3
+
+    # A vanished candidate is probed for the error.
+    mpm_path.unlink()
+    ((_, runnable, _, _, error),) = ranked()
+    assert not runnable
+    assert "No such file or directory" in error
+
+
 def _pin_plugin_env(
     monkeypatch, table_rendering: bool, os_appearance: str | None = None
 ) -> None:
@@ -337,6 +392,32 @@ def test_plugin_empty_mpm_output(monkeypatch, capsys, hide, reports_error):
     assert ("\u2757\ufe0f" in capsys.readouterr().out) is reports_error
 
 
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    (
+        ((7, 9, 0), [("sync",), ("outdated", "--plugin-output")]),
+        ((8, 0, 0), [("outdated", "--sync", "--plugin-output")]),
+    ),
+)
+def test_plugin_pipelined_sync(monkeypatch, version, expected):
+    """Recent `mpm` syncs and lists outdated packages in a single call."""
+    monkeypatch.delenv("SWIFTBAR", raising=False)
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="0 packages", stderr="")
+
+    monkeypatch.setattr(bar_plugin, "run", fake_run)
+
+    plugin = bar_plugin.MPMPlugin()
+    plugin.__dict__["best_mpm"] = (("mpm",), True, True, version, None)
+    plugin.print_menu()
+
+    # Strip the mpm argv and global options, up to the --timeout value.
+    assert [args[args.index("--timeout") + 2 :] for args in calls] == expected
+
+
 def _invocation_matrix(*iterables):
     """Pre-compute a matrix of all possible options for invocation."""
     for args in product(*iterables):
@@ -0,0 +1,255 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from meta_package_manager import catalog as catalog_module
+from meta_package_manager.catalog import Catalog
+from meta_package_manager.package import Package
+from meta_package_manager.pool import pool
+
+from .conftest import _patch_pool_with
+from .fake_manager import FakeManager
+
+AVAILABLE = (
+    ("sed", "GNU Sed", "stream editor for filtering text", "4.9"),
+    ("gsed-extra", None, "extra scripts for sed", "1.0"),
+    ("awk", "GNU Awk", "pattern scanning language", "5.2"),
+    ("vim", None, "Vi IMproved, a programmer's text editor", "9.0"),
+    ("x", None, "single letter package", "0.1"),
+)
+
+
+def _packages(manager_id, rows=AVAILABLE):
+    return [
+        Package(
+            id=id_,
+            manager_id=manager_id,
+            name=name,
+            description=description,
+            latest_version=version,
+        )
+        for id_, name, description, version in rows
+    ]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    with Catalog(tmp_path / "catalog.sqlite") as catalog:
+        catalog.refresh("apt", _packages("apt"))
+        catalog.refresh("flatpak", _packages("flatpak", AVAILABLE[:2]))
+        yield catalog
+
+
+def _ids(packages):
+    return [(package.manager_id, package.id) for package in packages]
+
+
+@pytest.mark.parametrize("fts5", [True, False])
+@pytest.mark.parametrize(
+    ("query", "extended", "exact", "expected"),
+    [
+        ("sed", False, False, ["gsed-extra", "sed"]),
+        ("SED", False, False, ["gsed-extra", "sed"]),
+        ("gnu", False, False, ["awk", "sed"]),
+        ("editor", False, False, []),
+        ("editor", True, False, ["sed", "vim"]),
+        ("sed", False, True, ["sed"]),
+        ("GNU Awk", False, True, ["awk"]),
+        # Short parts go through the fallback scan.
+        ("x", False, False, ["gsed-extra", "x"]),
+        ("vi", True, False, ["vim"]),
+        ("awk vim", False, False, ["awk", "vim"]),
+    ],
+)
+def test_search(catalog, monkeypatch, fts5, query, extended, exact, expected):
+    if not fts5:
+        monkeypatch.setattr(catalog_module, "fts5_support", False)
+    found = list(catalog.search(query, extended, exact, ["apt"]))
+    assert [package.id for package in found] == expected
+    assert {package.manager_id for package in found} <= {"apt"}
+
+
+def test_search_matches_refiltered_search(catalog):
+    """Offline results are the online refiltering applied to the full listing."""
+    for query, extended, exact in (("sed", True, False), ("e", False, False)):
+        expected = sorted(
+            package.id
+            for package in _packages("apt")
+            if package.matches(query, extended=extended, exact=exact)
+        )
+        found = catalog.search(query, extended, exact, ["apt"])
+        assert [package.id for package in found] == expected
+
+
+def test_search_restricted_to_managers(catalog):
+    assert _ids(catalog.search("sed", False, False, ["apt", "flatpak"])) == [
+        ("apt", "gsed-extra"),
+        ("apt", "sed"),
+        ("flatpak", "gsed-extra"),
+        ("flatpak", "sed"),
+    ]
+    assert _ids(catalog.search("sed", False, False, ["flatpak"])) == [
+        ("flatpak", "gsed-extra"),
+        ("flatpak", "sed"),
+    ]
+    assert not list(catalog.search("sed", False, False, []))
+    assert catalog.managers() == {"apt", "flatpak"}
+
+
+def test_refresh_replaces_listing(catalog):
+    assert not catalog.refresh("apt", reversed(_packages("apt")))
+    assert catalog.refresh("apt", _packages("apt", AVAILABLE[2:3]))
+    assert not list(catalog.search("sed", False, False, ["apt"]))
+    (awk,) = catalog.search("awk", False, False, ["apt"])
+    assert awk.name == "GNU Awk"
+    assert str(awk.latest_version) == "5.2"
+    # The full-text index follows the deletions.
+    assert _ids(catalog.search("sed", False, False, ["apt", "flatpak"])) == [
+        ("flatpak", "gsed-extra"),
+        ("flatpak", "sed"),
+    ]
+
+
+
+def test_refresh_duplicate_ids(catalog):
+    """Rows sharing an ID, like an app listed by two remotes, still sort."""
+    rows = (
+        ("org.app", "App", "An app", "1.0"),
+        ("org.app", "App", None, None),
+    )
+    assert catalog.refresh("flatpak", _packages("flatpak", rows))
+    assert not catalog.refresh("flatpak", reversed(_packages("flatpak", rows)))
+    assert len(list(catalog.search("org.app", False, False, ["flatpak"]))) == 2
+
+def test_is_stale(catalog):
+    now = datetime.now(timezone.utc)
+    assert catalog.is_stale("brew", None)
+    assert not catalog.is_stale("apt", None)
+    assert not catalog.is_stale("apt", now - timedelta(hours=1))
+    assert catalog.is_stale("apt", now + timedelta(hours=1))
+
+
+class CatalogFakeManager(FakeManager):
+    """Fake manager with an installable listing, counting its calls."""
+
+    installable_calls = 0
+
+    @property
+    def installable(self):
+        self.installable_calls += 1
+        for package in _packages(self.id):
+            yield self.package(
+                id=package.id,
+                name=package.name,
+                description=package.description,
+                latest_version=package.latest_version,
+            )
+
+    def search(self, query, extended, exact):
+        raise AssertionError("offline search must not query the manager")
+
+    def sync(self) -> None:
+        pass
+
+
+@pytest.fixture
+def catalog_pool(monkeypatch):
+    return _patch_pool_with(monkeypatch, CatalogFakeManager())
+
+
+def test_sync_catalog_and_offline_search(invoke, catalog_pool):
+    result = invoke("search", "--offline", "sed")
+    assert result.exit_code == 0
+    assert "Not in catalog yet" in result.stderr
+    assert "sed" not in result.stdout
+
+    result = invoke("sync", "--catalog")
+    assert result.exit_code == 0
+    assert catalog_pool.installable_calls == 1
+
+    # Nothing synced since the ingestion: the listing is not fetched again.
+    result = invoke("sync", "--catalog", "--max-sync-age", "1h")
+    assert result.exit_code == 0
+    assert catalog_pool.installable_calls == 1
+
+    # A fresh sync makes the listing stale again.
+    result = invoke("sync", "--catalog")
+    assert result.exit_code == 0
+    assert catalog_pool.installable_calls == 2
+
+    result = invoke("--table-format", "json", "search", "--offline", "sed")
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)[catalog_pool.id]
+    assert [package["id"] for package in payload["packages"]] == ["gsed-extra", "sed"]
+
+
+@pytest.mark.parametrize(
+    ("manager_id", "output", "expected"),
+    [
+        (
+            "apt",
+            "Package: sed\n"
+            "Version: 4.9-2\n"
+            "Description: GNU stream editor\n"
+            " sed reads the specified files.\n"
+            "\n"
+            "Package: sendmail-bin\n"
+            "Description: powerful Mail Transport Agent\n",
+            [
+                ("sed", None, "GNU stream editor", "4.9-2"),
+                ("sendmail-bin", None, "powerful Mail Transport Agent", None),
+            ],
+        ),
+        (
+            "pacman",
+            "core/acl 2.3.2-1 [installed]\n"
+            "    Access control list utilities\n"
+            "extra/firefox 99.0-1\n"
+            "    Standalone web browser from mozilla.org\n",
+            [
+                ("acl", None, "Access control list utilities", "2.3.2-1"),
+                ("firefox", None, "Standalone web browser from mozilla.org", "99.0-1"),
+            ],
+        ),
+        (
+            "flatpak",
+            "gitg\tGUI for git\torg.gnome.gitg\t3.32.1\n"
+            "Builder\t\torg.flatpak.Builder\t\n",
+            [
+                ("org.gnome.gitg", "gitg", "GUI for git", "3.32.1"),
+                ("org.flatpak.Builder", "Builder", None, None),
+            ],
+        ),
+    ],
+)
+def test_installable_parsing(stub_run_cli, manager_id, output, expected):
+    manager = pool[manager_id]
+    stub_run_cli(manager, output)
+    assert [
+        (
+            package.id,
+            package.name,
+            package.description,
+            str(package.latest_version) if package.latest_version else None,
+        )
+        for package in manager.installable
+    ] == expected
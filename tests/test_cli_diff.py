@@ -0,0 +1,141 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+
+from __future__ import annotations
+
+import json
+
+import tomli_w
+
+from meta_package_manager.cli_snapshots import diff_inventories
+from meta_package_manager.execution import CLIError
+from meta_package_manager.pool import pool
+
+from .fake_manager import FakeManager
+
+
+def _change(manager_id, package_id, change, old_version, new_version):
+    return {
+        "manager_id": manager_id,
+        "package_id": package_id,
+        "change": change,
+        "old_version": old_version,
+        "new_version": new_version,
+    }
+
+
+def test_diff_inventories():
+    old = {
+        "brew": {"curl": "8.5.0", "wget": "1.21", "jq": "1.7", "git": "2.44.0"},
+        "pip": {"requests": "2.31.0", "unknown": "None"},
+    }
+    new = {
+        "brew": {"curl": "8.10.0", "jq": "1.6", "git": "2.44.0", "xz": "5.6"},
+        "npm": {"npm": "10.5.0"},
+        "pip": {"requests": "2.31.0", "unknown": None},
+    }
+    assert diff_inventories(old, new) == [
+        # 8.10.0 is ordered after 8.5.0, unlike their strings.
+        _change("brew", "curl", "upgraded", "8.5.0", "8.10.0"),
+        _change("brew", "jq", "downgraded", "1.7", "1.6"),
+        _change("brew", "wget", "removed", "1.21", None),
+        _change("brew", "xz", "added", None, "5.6"),
+        _change("npm", "npm", "added", None, "10.5.0"),
+    ]
+    assert diff_inventories(new, new) == []
+
+
+def _snapshot(tmp_path, name, inventory):
+    path = tmp_path / name
+    path.write_text(tomli_w.dumps(inventory))
+    return str(path)
+
+
+def test_diff_snapshots(invoke, tmp_path):
+    old = _snapshot(tmp_path, "old.toml", {"apt": {"sed": "4.8"}, "pip": {"a": "1"}})
+    new = _snapshot(tmp_path, "new.toml", {"apt": {"sed": "4.9"}, "pip": {"b": "1"}})
+    result = invoke("--table-format", "json", "diff", old, new)
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == [
+        _change("apt", "sed", "upgraded", "4.8", "4.9"),
+        _change("pip", "a", "removed", "1", None),
+        _change("pip", "b", "added", None, "1"),
+    ]
+
+    # The manager selection applies to snapshots too.
+    result = invoke("--table-format", "json", "--apt", "diff", old, new)
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == [
+        _change("apt", "sed", "upgraded", "4.8", "4.9"),
+    ]
+
+
+def test_diff_live(invoke, monkeypatch, tmp_path):
+    fake = FakeManager()
+    selections = []
+
+    def select_managers(*args, **kwargs):
+        selections.append(kwargs["keep"])
+        yield fake
+
+    monkeypatch.setattr(pool, "select_managers", select_managers)
+    snapshot = _snapshot(
+        tmp_path,
+        "snapshot.toml",
+        {
+            "apt": {"sed": "4.9"},
+            fake.id: {"fake-pkg-alpha": "1.1.0", "fake-pkg-gone": "0.1"},
+        },
+    )
+    result = invoke("--table-format", "json", "diff", snapshot)
+    assert result.exit_code == 0
+    # Only the managers of the snapshot are probed.
+    assert selections == [["apt"]]
+    # Sections of managers that were not queried are left out.
+    assert json.loads(result.stdout) == [
+        _change(fake.id, "fake-pkg-alpha", "downgraded", "1.1.0", "1.0.0"),
+        _change(fake.id, "fake-pkg-beta", "added", None, "2.5.3"),
+        _change(fake.id, "fake-pkg-gone", "removed", "0.1", None),
+    ]
+
+
+class FailingFakeManager(FakeManager):
+    """Fake manager whose installed listing fails, like a broken CLI."""
+
+    @property
+    def installed(self):
+        error = CLIError(1, "", "broken")
+        self.cli_errors.append(error)
+        raise error
+
+
+def test_diff_live_failed_query(invoke, monkeypatch, tmp_path):
+    """A manager that could not be queried is left out, and the run fails."""
+    fake = FailingFakeManager()
+    monkeypatch.setattr(pool, "select_managers", lambda *args, **kwargs: [fake])
+    snapshot = _snapshot(tmp_path, "snapshot.toml", {fake.id: {"fake-pkg-gone": "1"}})
+
+    result = invoke("--table-format", "json", "diff", snapshot)
+    assert result.exit_code == 1
+    assert json.loads(result.stdout) == []
+
+    result = invoke("diff", snapshot)
+    assert result.exit_code == 1
+    assert "fake-pkg-gone" not in result.stdout
+    assert f"Could not compare the installed packages of {fake.id}." in result.stderr
+
+    result = invoke("--zero-exit", "--table-format", "json", "diff", snapshot)
+    assert result.exit_code == 0
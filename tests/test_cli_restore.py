@@ -16,15 +16,19 @@
 
 from __future__ import annotations
 
-from functools import partial
+import sys
+from functools import cached_property, partial
+from pathlib import Path
 
 import pytest
 
 from meta_package_manager.capabilities import Operations
+from meta_package_manager.cli_snapshots import _restore_levels
 from meta_package_manager.pool import pool
 
 from .conftest import default_manager_ids
 from .destructive_plan import destructive_group
+from .fake_manager import FakeManager
 from .test_cli import assert_no_manager_selected, check_manager_selection
 
 
@@ -189,3 +193,101 @@ def test_empty_manager(invoke, create_config):
     assert result.exit_code == 0
     assert "uv-empty.toml" in result.stderr
     assert ":uv: Restore packages..." in result.stderr
+
+
+@pytest.mark.parametrize(
+    ("dependencies", "expected"),
+    (
+        ({}, []),
+        ({"brew": set(), "npm": set()}, [["brew", "npm"]]),
+        ({"mas": {"brew"}, "brew": set(), "npm": set()}, [["brew", "npm"], ["mas"]]),
+        ({"a": {"b"}, "b": {"c"}, "c": set()}, [["c"], ["b"], ["a"]]),
+        # A dependency outside the plan does not hold its dependent back.
+        ({"mas": {"brew"}}, [["mas"]]),
+        # A cycle is pushed to a last level.
+        ({"a": {"b"}, "b": {"a"}, "c": set()}, [["c"], ["a", "b"]]),
+    ),
+)
+def test_restore_levels(dependencies, expected):
+    assert _restore_levels(dependencies) == expected
+
+
+class ProviderFakeManager(FakeManager):
+    """Fake manager installing the CLI of {class}`BootstrappedFakeManager`."""
+
+    id = "fake-provider"
+
+    def __init__(self, journal):
+        super().__init__()
+        self.journal = journal
+
+    def install(self, package_id, version=None):
+        self.journal.append((self.id, package_id, version))
+        return ""
+
+
+class BootstrappedFakeManager(ProviderFakeManager):
+    """Fake manager whose CLI only shows up once its provider installed it."""
+
+    id = "fake-bootstrapped"
+
+    bootstrapped_by = ("fake-provider", "fake-bootstrapped-cli")
+
+    @cached_property
+    def cli_path(self):
+        if ("fake-provider", "fake-bootstrapped-cli", "1.0") in self.journal:
+            return Path(sys.executable)
+        return None
+
+
+def test_restore_bootstraps_and_skips_installed(invoke, create_config, monkeypatch):
+    journal: list[tuple[str, str, str | None]] = []
+    managers = (BootstrappedFakeManager(journal), ProviderFakeManager(journal))
+    monkeypatch.setattr(pool, "select_managers", lambda *args, **kwargs: managers)
+    for manager in managers:
+        monkeypatch.setitem(pool.register, manager.id, manager)
+    toml_path = create_config(
+        "bootstrap.toml",
+        """
+        [fake-bootstrapped]
+        fake-app = "2.0"
+
+        [fake-provider]
+        fake-pkg-alpha = "1.0.0"
+        fake-pkg-beta = "3.0.0"
+        fake-bootstrapped-cli = "1.0"
+        """,
+    )
+
+    result = invoke("--verbosity", "INFO", "restore", str(toml_path), color=False)
+    assert result.exit_code == 0
+    assert ":fake-provider: fake-pkg-alpha@1.0.0 already installed." in result.stderr
+    # The bootstrapped section waits for its CLI, the provider's lane stays serial.
+    assert journal == [
+        ("fake-provider", "fake-pkg-beta", "3.0.0"),
+        ("fake-provider", "fake-bootstrapped-cli", "1.0"),
+        ("fake-bootstrapped", "fake-app", "2.0"),
+    ]
+
+
+def test_restore_unbootstrapped_manager(invoke, create_config, monkeypatch):
+    journal: list[tuple[str, str, str | None]] = []
+    managers = (BootstrappedFakeManager(journal), ProviderFakeManager(journal))
+    monkeypatch.setattr(pool, "select_managers", lambda *args, **kwargs: managers)
+    for manager in managers:
+        monkeypatch.setitem(pool.register, manager.id, manager)
+    toml_path = create_config(
+        "no-bootstrap.toml",
+        """
+        [fake-bootstrapped]
+        fake-app = "2.0"
+
+        [fake-provider]
+        fake-pkg-alpha = "1.0.0"
+        """,
+    )
+
+    result = invoke("--verbosity", "DEBUG", "restore", str(toml_path), color=False)
+    assert result.exit_code == 0
+    assert ":fake-bootstrapped: Skipped: no executable named" in result.stderr
+    assert not journal
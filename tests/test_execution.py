@@ -22,14 +22,16 @@ import re
 import shutil
 import threading
 import time
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 from click_extra.execution import _LIVE_PROCESSES, terminate_live_processes
 from extra_platforms import ALL_PLATFORMS, UNIX, is_any_windows
-from extra_platforms.pytest import write_fake_executable
+from extra_platforms.pytest import skip_all_windows, write_fake_executable
 
+from meta_package_manager import execution
 from meta_package_manager.capabilities import Operations
 from meta_package_manager.execution import (
     _DIAGNOSIS_EXEMPT_OPERATIONS,
@@ -38,6 +40,7 @@ from meta_package_manager.execution import (
     DIAGNOSIS_TAIL_LINES,
     MUTATING_TIMEOUT,
     OPERATION_TIMEOUTS,
+    PATH_INDEX,
     PLAN_RECORDER,
     READ_ONLY_TIMEOUT,
     SPINNER_DELAY,
@@ -802,3 +805,136 @@ def test_windows_pathext_tracks_cpython():
         f"CPython now defaults PATHEXT to {cpython_value!r}, but "
         f"WIN_DEFAULT_PATHEXT still copies {WIN_DEFAULT_PATHEXT!r}."
     )
+
+
+def _age(directory: Path, seconds: int = 60) -> None:
+    """Backdate `directory` past the racy window, so its listing gets cached."""
+    past = time.time() - seconds
+    os.utime(directory, (past, past))
+
+
+def test_path_index_tracks_directory_changes(tmp_path):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    bin_dir.joinpath("tool").touch()
+    _age(bin_dir)
+    directory = PATH_INDEX.normalize(str(bin_dir))
+
+    assert PATH_INDEX.entries(directory) == {os.path.normcase("tool")}
+    # The cached listing is served as long as the directory is untouched.
+    assert PATH_INDEX.entries(directory) is PATH_INDEX.entries(directory)
+
+    bin_dir.joinpath("other").touch()
+    _age(bin_dir, 30)
+    assert os.path.normcase("other") in PATH_INDEX.entries(directory)
+
+    assert PATH_INDEX.entries(str(tmp_path / "missing")) == frozenset()
+    assert PATH_INDEX.entries(str(bin_dir / "tool")) == frozenset()
+
+
+def test_path_index_folds_case_on_macos(tmp_path, monkeypatch):
+    """APFS and HFS+ ignore case, which `os.path.normcase` does not fold."""
+    monkeypatch.setattr(execution, "is_macos", lambda: True)
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    bin_dir.joinpath("Tool").touch()
+    PATH_INDEX.clear()
+    try:
+        assert PATH_INDEX.entries(PATH_INDEX.normalize(str(bin_dir))) == {"tool"}
+    finally:
+        PATH_INDEX.clear()
+
+
+@skip_all_windows
+def test_search_all_cli_unlistable_directory(tmp_path, monkeypatch):
+    """A directory that can be searched but not listed is probed name by name."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = write_fake_executable(bin_dir / "tool")
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    def scandir(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(execution.os, "scandir", scandir)
+    PATH_INDEX.clear()
+    try:
+        assert PATH_INDEX.entries(PATH_INDEX.normalize(str(bin_dir))) is None
+        assert FakeManager().which("tool") == tool
+        assert FakeManager().which("absent") is None
+    finally:
+        PATH_INDEX.clear()
+
+
+@skip_all_windows
+def test_search_all_cli_through_path_index(tmp_path, monkeypatch):
+    first = tmp_path / "first"
+    first.mkdir()
+    tool = write_fake_executable(first / "tool")
+    # An alias of the first directory is searched once.
+    alias = tmp_path / "alias"
+    alias.symlink_to(first)
+    # Empty files are not CLIs.
+    second = tmp_path / "second"
+    second.mkdir()
+    second.joinpath("tool").touch()
+    third = tmp_path / "third"
+    third.mkdir()
+    other_tool = write_fake_executable(third / "tool")
+    for directory in (first, second, third):
+        _age(directory)
+    monkeypatch.setenv(
+        "PATH",
+        os.pathsep.join(
+            map(str, (first, alias, tmp_path / "missing", second, third, tool))
+        ),
+    )
+
+    manager = FakeManager()
+    assert list(manager.search_all_cli(["tool", "absent"])) == [tool, other_tool]
+    assert manager.which("tool") == tool
+
+    # A CLI appearing later is found, without any explicit invalidation.
+    late = write_fake_executable(second / "late")
+    assert manager.which("late") == late
+
+
+def _reference_search_all_cli(directories, cli_names):
+    """The historical `search_all_cli` loop: resolve every directory, then probe
+    every candidate filename in each of them."""
+    found = []
+    seen = set()
+    for directory in map(Path, directories):
+        key = os.path.normcase(directory.resolve())
+        if key in seen:
+            continue
+        seen.add(key)
+        if not directory.is_dir():
+            continue
+        for cli_name in cli_names:
+            file = directory / cli_name
+            if file.is_file() and os.path.getsize(file):
+                found.append(file)
+    return found
+
+
+def test_search_all_cli_long_path(tmp_path, monkeypatch):
+    """The CLI detection of the whole pool agrees with a plain walk of a long
+    `PATH`."""
+    directories = []
+    for index in range(40):
+        directory = tmp_path / f"bin{index}"
+        directory.mkdir()
+        for entry in range(100):
+            directory.joinpath(f"entry-{entry}").write_text("x")
+        directories.append(directory)
+    directories[-1].joinpath("apt").write_text("x")
+    for directory in directories:
+        _age(directory)
+    monkeypatch.setenv("PATH", os.pathsep.join(map(str, directories)))
+    lookups = [manager.cli_names for manager in pool.values() if manager.cli_names]
+    manager = FakeManager()
+
+    assert [list(manager.search_all_cli(names)) for names in lookups] == [
+        _reference_search_all_cli(directories, names) for names in lookups
+    ]
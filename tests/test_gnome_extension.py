@@ -236,6 +236,22 @@ def test_install_bootstrap_matches_the_bar_plugin():
     assert _install_argv(_extension_source("mpm.js")) == _install_argv(plugin)
 
 
+def test_pipelined_sync_matches_the_bar_plugin():
+    """Both frontends switch to `outdated --sync` from the same `mpm` release."""
+    plugin = (PROJECT_ROOT / "meta_package_manager" / "bar_plugin.py").read_text(
+        encoding="UTF-8"
+    )
+    versions = [
+        re.search(r"MPM_PIPELINED_SYNC_VERSION = [\[(]([\d, ]+)[\])]", source)
+        for source in (_extension_source("mpm.js"), plugin)
+    ]
+    assert all(versions)
+    extension, bar_plugin = (
+        tuple(map(int, match.group(1).split(","))) for match in versions
+    )
+    assert extension == bar_plugin
+
+
 def test_pack_whitelists_are_identical():
     """Both packing workflows declare the same sources.
 
@@ -0,0 +1,131 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+
+from __future__ import annotations
+
+import json
+import logging
+import tracemalloc
+
+import pytest
+
+from meta_package_manager import json_decoder
+from meta_package_manager.json_decoder import iter_json_items, loads
+
+from .fake_manager import FakeManager
+
+
+@pytest.mark.parametrize(
+    ("document", "list_path", "expected"),
+    [
+        ('[{"a": 1}, 2, "three", null]', None, [{"a": 1}, 2, "three", None]),
+        (" \n[ ]\n ", None, []),
+        ('{"a": {"b": [1, [2, 3]]}}', "a.b", [1, [2, 3]]),
+        # Keys before the path are skipped, whatever their values.
+        ('{"x": {"b": [0]}, "y": "[", "a": {"b": [{"c": "]"}]}}', "a.b", [{"c": "]"}]),
+        ('{"a": {"b": {}}}', "a.b", []),
+        ('{"a": [1]}', "b", []),
+        ('{"a": [1]}', "a.b", []),
+        ("{}", "a", []),
+        ('{"a": 1}', None, []),
+        ('"text"', "a", []),
+    ],
+)
+def test_iter_json_items(document, list_path, expected):
+    assert list(iter_json_items(document, list_path)) == expected
+
+
+def test_iter_json_items_malformed():
+    document = '{"packages": [{"id": "a"}, {"id": "b"}, {"id": }]}'
+    items = iter_json_items(document, "packages")
+    assert next(items) == {"id": "a"}
+    assert next(items) == {"id": "b"}
+    with pytest.raises(ValueError):
+        next(items)
+
+    with pytest.raises(ValueError):
+        list(iter_json_items("[1 2]"))
+    with pytest.raises(ValueError):
+        list(iter_json_items('{"a" [1]}', "a"))
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+def test_loads_backends(monkeypatch, backend):
+    if backend != "json":
+        pytest.importorskip(backend)
+    monkeypatch.setattr(json_decoder, "orjson_support", backend == "orjson")
+    monkeypatch.setattr(json_decoder, "msgspec_support", backend == "msgspec")
+    assert loads('{"a": [1, 2.5, "é", null, true]}') == {
+        "a": [1, 2.5, "é", None, True]
+    }
+    assert loads(b"[]") == []
+    with pytest.raises(ValueError):
+        loads("{not json")
+
+
+def test_streaming_memory():
+    """Iterating a multi-megabyte listing never holds the whole decoded tree."""
+    document = json.dumps({
+        "packages": [
+            {"name": f"pkg-{index}", "version": f"1.{index}", "description": "x" * 100}
+            for index in range(20_000)
+        ]
+    })
+    assert len(document) > 2_000_000
+
+    tracemalloc.start()
+    try:
+        assert len(json.loads(document)["packages"]) == 20_000
+        _, full_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        assert sum(1 for _ in iter_json_items(document, "packages")) == 20_000
+        _, streaming_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert streaming_peak * 100 < full_peak
+
+
+@pytest.mark.parametrize("stream", (False, True))
+def test_parse_json_items(stream):
+    manager = FakeManager()
+    output = '{"result": [{"id": "a", "v": "1"}, 2, {"v": "2"}, {"id": "c"}]}'
+    packages = manager.parse_json_items(
+        output,
+        list_path="result",
+        fields={"package_id": "id", "installed_version": "v"},
+        stream=stream,
+    )
+    a, c = packages
+    assert (a.id, str(a.installed_version)) == ("a", "1")
+    assert (c.id, c.installed_version) == ("c", None)
+
+
+@pytest.mark.parametrize("stream", (False, True))
+def test_parse_json_items_malformed(caplog, stream):
+    """A malformed listing yields no packages at all, not the ones before the error."""
+    manager = FakeManager()
+    output = '{"result": [{"id": "a", "v": "1"}, {"v": "2"}, {"id": "c", ]}'
+    with caplog.at_level(logging.WARNING):
+        packages = list(
+            manager.parse_json_items(
+                output,
+                list_path="result",
+                fields={"package_id": "id", "installed_version": "v"},
+                stream=stream,
+            )
+        )
+    assert packages == []
+    assert "Could not parse JSON output" in caplog.text
@@ -41,6 +41,7 @@ from meta_package_manager.config import (
     register_config_managers,
     validate_manager_overrides_section,
 )
+from meta_package_manager import definitions
 from meta_package_manager.definitions import (
     ConfigDrivenManager,
     ManagerDefinition,
@@ -430,6 +431,58 @@ def test_parse_definition_versionless_catalog_manager():
             "non-empty table",
             id="empty-operations",
         ),
+        pytest.param(
+            {
+                "platforms": ["linux"],
+                "operations": {
+                    "installed": {
+                        "args": ["list"],
+                        "regex": r"^(?P<package_id>\S+)$",
+                        "file": {"regex": r"^(?P<package_id>\S+)$"},
+                    },
+                },
+            },
+            "mytool.operations.installed.file.paths: required",
+            id="file-without-paths",
+        ),
+        pytest.param(
+            {
+                "platforms": ["linux"],
+                "operations": {
+                    "installed": {
+                        "args": ["list"],
+                        "regex": r"^(?P<package_id>\S+)$",
+                        "file": {"paths": ["~/db"], "args": ["list"]},
+                    },
+                },
+            },
+            "unknown key",
+            id="file-with-args",
+        ),
+        pytest.param(
+            {
+                "platforms": ["linux"],
+                "operations": {
+                    "outdated": {
+                        "args": ["outdated"],
+                        "regex": r"^(?P<package_id>\S+) (?P<latest_version>\S+)$",
+                        "file": {"paths": ["~/db"], "fields": {"package_id": "id"}},
+                    },
+                },
+            },
+            "missing required field(s): latest_version",
+            id="file-parser-missing-field",
+        ),
+        pytest.param(
+            {
+                "platforms": ["linux"],
+                "operations": {
+                    "sync": {"args": ["s"], "file": {"paths": ["~/db"]}},
+                },
+            },
+            "unknown key",
+            id="file-on-command",
+        ),
     ),
 )
 def test_parse_definition_rejects(section, expected):
@@ -918,6 +971,49 @@ def test_factory_json_array_field(monkeypatch):
     assert packages["scalar"] is None
 
 
+def test_factory_file_source(monkeypatch, tmp_path):
+    """A query declaring a `file` parses it instead of running the CLI, and falls
+    back to the CLI when the first candidate with all its variables set is
+    missing."""
+    manager = build_manager_class(
+        _definition(
+            installed=OperationSpec(
+                args=("list",),
+                parse_mode="regex",
+                regex=r"^(?P<package_id>\S+)@(?P<installed_version>\S+)$",
+                file=OperationSpec(
+                    args=(),
+                    parse_mode="json",
+                    list_path="db.packages",
+                    fields={"package_id": "name", "installed_version": "version"},
+                    paths=("$MYTOOL_HOME/db.json", str(tmp_path / "default.json")),
+                ),
+            ),
+        ),
+    )()
+    runs = []
+
+    def run_cli(*args, **kwargs):
+        runs.append(args)
+        return "ruff@0.1.2"
+
+    monkeypatch.setattr(manager, "run_cli", run_cli)
+    (tmp_path / "default.json").write_text(
+        json.dumps({"db": {"packages": [{"name": "black", "version": "24.1.0"}]}}),
+    )
+    monkeypatch.delenv("MYTOOL_HOME", raising=False)
+    assert [(p.id, str(p.installed_version)) for p in manager.installed] == [
+        ("black", "24.1.0"),
+    ]
+    assert runs == []
+
+    # The variable is set, but its file does not exist: the default location is
+    # not the tool's, so the CLI runs.
+    monkeypatch.setenv("MYTOOL_HOME", str(tmp_path / "home"))
+    assert [p.id for p in manager.installed] == ["ruff"]
+    assert runs == [("list",)]
+
+
 # Trust gate.
 
 
@@ -1108,6 +1204,13 @@ The samples are the source-derived output fixtures feeding
 manager (with its samples) extends those tests without touching this module.
 """
 
+SAMPLED_QUERIES = (
+    *("installed", "outdated", "orphans", "search"),
+    *("installed_file", "outdated_file", "orphans_file", "search_file"),
+)
+"""Sample keys of the query operations: the CLI output of each, or with a
+`_file` suffix the content of the file it reads instead."""
+
 
 def _fresh_bundled(manager_id):
     """Build a throwaway config-defined manager instance so parsing tests can
@@ -1175,13 +1278,13 @@ def test_bundled_registered(toml_path):
 
     # Validate the shape of the sample fixtures consumed by the tests below.
     samples = data.get("samples", {})
-    assert set(samples) <= {"version", "installed", "outdated", "orphans", "search"}
+    assert set(samples) <= {"version", *SAMPLED_QUERIES}
     assert "version" in samples, (
         f"{toml_path.name} must ship a [samples.version] fixture"
     )
     assert set(samples["version"]) == {"output", "expected"}
-    for operation in ("installed", "outdated", "orphans", "search"):
-        for sample in samples.get(operation, ()):
+    for sample_key in SAMPLED_QUERIES:
+        for sample in samples.get(sample_key, ()):
             assert set(sample) == {"output", "packages"}
             assert sample["packages"], "a sample must expect at least one package"
             for package in sample["packages"]:
@@ -1298,39 +1401,51 @@ def _parsing_sample_params():
     for data in BUNDLED_FILE_DATA.values():
         manager_id = next(iter(data["mpm"]["managers"]))
         samples = data.get("samples", {})
-        for operation in ("installed", "outdated", "orphans", "search"):
-            op_samples = samples.get(operation, ())
+        for sample_key in SAMPLED_QUERIES:
+            op_samples = samples.get(sample_key, ())
             for index, sample in enumerate(op_samples):
                 expected = [
                     (package["id"], package.get("version"))
                     for package in sample["packages"]
                 ]
-                param_id = f"{manager_id}-{operation}"
+                param_id = f"{manager_id}-{sample_key}"
                 if len(op_samples) > 1:
                     param_id += f"-{index}"
                 params.append(
                     pytest.param(
-                        manager_id, operation, sample["output"], expected, id=param_id
+                        manager_id,
+                        sample_key,
+                        sample["output"],
+                        expected,
+                        id=param_id,
                     ),
                 )
     return params
 
 
 @pytest.mark.parametrize(
-    ("manager_id", "operation", "output", "expected"),
+    ("manager_id", "sample_key", "output", "expected"),
     _parsing_sample_params(),
 )
-def test_bundled_parsing(manager_id, operation, output, expected):
+def test_bundled_parsing(monkeypatch, manager_id, sample_key, output, expected):
     """Lock each bundled definition's parsers to the output samples shipped in its
     TOML file, derived from the upstream tools' own source code or documentation.
 
     Versions are compared as raw captured strings (omitted from the sample when
     the regex captures no version group). `which` is stubbed so operations
-    declaring a sibling `cli` resolve without the real binary installed.
+    declaring a sibling `cli` resolve without the real binary installed. A
+    `<operation>_file` sample is the content of the file the operation reads in
+    place of the CLI: the other samples are fed with no file to read.
     """
+    operation = sample_key.removesuffix("_file")
     manager = _fresh_bundled(manager_id)
     manager.which = lambda name: Path("/fake/bin") / name
-    manager.run_cli = lambda *args, **kwargs: output
+    if operation != sample_key:
+        monkeypatch.setattr(definitions, "_read_spec_file", lambda *args: output)
+        manager.run_cli = lambda *args, **kwargs: pytest.fail("CLI run")
+    else:
+        monkeypatch.setattr(definitions, "_read_spec_file", lambda *args: None)
+        manager.run_cli = lambda *args, **kwargs: output
     if operation == "search":
         packages = manager.search("query", False, False)
     else:
@@ -0,0 +1,143 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Homebrew-specific tests."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from meta_package_manager.managers.gem import Gem
+
+
+def test_gem_bulk_metadata():
+    manager = Gem()
+    manager.cli_path = Path(sys.executable)
+    manager.run = lambda *args, **kwargs: (
+        "bundler (2.4.10, default: 2.4.1)\n"
+        "    Authors: André Arko, Samuel Giddins, Hiroshi\n"
+        "    Shibata\n"
+        "    Homepage: https://bundler.io\n"
+        "    Licenses: MIT, Ruby\n"
+        "    Installed at (2.4.10): /usr/lib/ruby/gems/3.2.0\n"
+        "                 (default): /usr/lib/ruby/gems/3.2.0\n"
+        "\n"
+        "    The best way to manage your\n"
+        "    application's dependencies\n"
+        "\n"
+        "rake (13.0.6)\n"
+        "    Author: Jim Weirich\n"
+        "    Installed at: /usr/lib/ruby/gems/3.2.0\n"
+        "\n"
+        "    Rake is a Make-like program\n"
+    )
+    index = manager.bulk_metadata()
+    assert set(index) == {"bundler", "rake"}
+    bundler = index["bundler"]
+    assert bundler.originator.name == "André Arko, Samuel Giddins, Hiroshi Shibata"
+    assert bundler.homepage == "https://bundler.io"
+    assert bundler.license_declared == "MIT OR Ruby"
+    assert bundler.summary == "The best way to manage your application's dependencies"
+    assert bundler.extras["gem.installed_at"] == "/usr/lib/ruby/gems/3.2.0"
+    assert index["rake"].homepage is None
+    assert index["rake"].description == "Rake is a Make-like program"
+
+
+def _write_spec(spec_dir, name, version, platform="ruby"):
+    spec_dir.mkdir(parents=True, exist_ok=True)
+    suffix = "" if platform == "ruby" else f"-{platform}"
+    (spec_dir / f"{name}-{version}{suffix}.gemspec").write_text(
+        "# -*- encoding: utf-8 -*-\n"
+        f"# stub: {name} {version} {platform} lib\n\n"
+        "Gem::Specification.new do |s|\nend\n"
+    )
+
+
+@pytest.fixture
+def prefix(tmp_path, monkeypatch):
+    """A Ruby prefix with bundled, system-wide and user-installed gems."""
+    home = tmp_path / "home"
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv("GEM_HOME", raising=False)
+    monkeypatch.delenv("GEM_PATH", raising=False)
+
+    ruby = tmp_path / "ruby"
+    (ruby / "bin").mkdir(parents=True)
+    (ruby / "bin" / "gem").touch()
+    specs = ruby / "lib" / "ruby" / "gems" / "3.3.0" / "specifications"
+    _write_spec(specs / "default", "csv", "3.2.8")
+    _write_spec(specs / "default", "bundler", "2.5.11")
+    _write_spec(specs, "bundler", "2.5.16")
+    _write_spec(specs, "nokogiri", "1.16.6", "x86_64-linux")
+    _write_spec(home / ".gem" / "ruby" / "3.3.0" / "specifications", "Rake", "13.2.1")
+    return ruby
+
+
+def _installed(prefix, output="rake (13.2.1)"):
+    manager = Gem()
+    manager.cli_path = prefix / "bin" / "gem"
+    with patch.object(manager, "run_cli", return_value=output) as run_cli:
+        packages = [(p.id, str(p.installed_version)) for p in manager.installed]
+    return packages, run_cli.called
+
+
+def test_installed_from_specifications(prefix):
+    """Installed gems are read from their specifications, without running Ruby."""
+    assert _installed(prefix) == (
+        [
+            ("bundler", "2.5.16"),
+            ("csv", "3.2.8"),
+            ("nokogiri", "1.16.6"),
+            ("Rake", "13.2.1"),
+        ],
+        False,
+    )
+
+
+def test_installed_gem_home(prefix, monkeypatch):
+    monkeypatch.setenv("GEM_HOME", str(prefix / "elsewhere"))
+    assert _installed(prefix) == ([("rake", "13.2.1")], True)
+
+
+@pytest.mark.parametrize("path", ("home/.gemrc", "ruby/etc/gemrc"))
+def test_installed_gemrc_path(prefix, path):
+    gemrc = prefix.parent / path
+    gemrc.parent.mkdir(exist_ok=True)
+    gemrc.write_text("gem: --no-document\ngempath: /opt/gems\n")
+    assert _installed(prefix)[1]
+    gemrc.write_text("gem: --no-document\n")
+    assert not _installed(prefix)[1]
+
+
+def test_installed_unrecognized_layout(prefix):
+    """Anything unexpected hands over to `gem list`."""
+    operating_system = prefix / "lib" / "ruby" / "vendor_ruby" / "rubygems" / "defaults"
+    operating_system.mkdir(parents=True)
+    (operating_system / "operating_system.rb").touch()
+    assert _installed(prefix)[1]
+    (operating_system / "operating_system.rb").unlink()
+    assert not _installed(prefix)[1]
+
+    (prefix / "lib" / "ruby" / "gems" / "3.2.0").mkdir()
+    assert _installed(prefix)[1]
+    (prefix / "lib" / "ruby" / "gems" / "3.2.0").rmdir()
+
+    specs = prefix / "lib" / "ruby" / "gems" / "3.3.0" / "specifications"
+    (specs / "legacy-1.0.gemspec").write_text("Gem::Specification.new\n")
+    assert _installed(prefix) == ([("rake", "13.2.1")], True)
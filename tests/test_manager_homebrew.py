@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import call, patch
 
 import pytest
@@ -96,3 +97,133 @@ def test_install_routes_through_trust_tap(manager_class):
         "--quiet",
         "gromgit/fuse/ntfs-3g-mac",
     )
+
+
+@pytest.fixture
+def prefix(tmp_path):
+    """A Homebrew prefix with two formulae, one of them pinned, and a cask."""
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "bin" / "brew").touch()
+
+    cellar = tmp_path / "Cellar"
+    for formula, version, receipt in (
+        ("wget", "1.21.4", {"source": {"tap": "homebrew/core"}}),
+        (
+            "wget",
+            "1.24.5",
+            {
+                "installed_on_request": True,
+                "poured_from_bottle": True,
+                "runtime_dependencies": [
+                    {"full_name": "openssl@3", "version": "3.3.1"},
+                    {"full_name": "libidn2", "version": "2.3.7"},
+                ],
+                "source": {"tap": "homebrew/core"},
+            },
+        ),
+        ("ntfs-3g-mac", "2022.10.3_1", {"source": {"tap": "gromgit/fuse"}}),
+    ):
+        keg = cellar / formula / version
+        keg.mkdir(parents=True)
+        (keg / "INSTALL_RECEIPT.json").write_text(json.dumps(receipt))
+    # Hidden entries and formulae without kegs are not installed packages.
+    (cellar / ".keepme").touch()
+    (cellar / "leftover").mkdir()
+    pinned = tmp_path / "var" / "homebrew" / "pinned"
+    pinned.mkdir(parents=True)
+    (pinned / "wget").symlink_to(cellar / "wget" / "1.24.5")
+
+    metadata = tmp_path / "Caskroom" / "firefox" / ".metadata"
+    (metadata / "127.0" / "20240612174218.101").mkdir(parents=True)
+    (metadata / "126.0" / "20240517091511.296").mkdir(parents=True)
+    (metadata / "INSTALL_RECEIPT.json").write_text(
+        json.dumps({"installed_on_request": True, "source": {"tap": "homebrew/cask"}})
+    )
+    return tmp_path
+
+
+def _manager(manager_class, prefix):
+    manager = manager_class()
+    manager.cli_path = prefix / "bin" / "brew"
+    return manager
+
+
+@pytest.mark.parametrize(
+    ("manager_class", "expected"),
+    (
+        (Brew, [("ntfs-3g-mac", "2022.10.3_1"), ("wget", "1.24.5")]),
+        (Cask, [("firefox", "127.0")]),
+    ),
+)
+def test_installed_from_prefix(prefix, manager_class, expected):
+    """Installed packages are read from the prefix, without running `brew`."""
+    manager = _manager(manager_class, prefix)
+    with patch.object(manager, "run_cli", side_effect=AssertionError) as run_cli:
+        packages = [(p.id, str(p.installed_version)) for p in manager.installed]
+    run_cli.assert_not_called()
+    assert packages == expected
+
+
+def test_install_receipts(prefix):
+    receipts = _manager(Brew, prefix).install_receipts()
+    assert receipts["wget"].pinned
+    assert receipts["wget"].tap == "homebrew/core"
+    assert receipts["ntfs-3g-mac"].tap == "gromgit/fuse"
+    assert not receipts["ntfs-3g-mac"].pinned
+
+    metadata = receipts["wget"].metadata
+    assert metadata.installed_on_request
+    assert [d.target_id for d in metadata.dependencies] == ["openssl@3", "libidn2"]
+    assert metadata.extras == {
+        "brew.tap": "homebrew/core",
+        "brew.pinned": True,
+        "brew.installed_on_request": True,
+        "brew.poured_from_bottle": True,
+    }
+
+    (cask,) = _manager(Cask, prefix).install_receipts().values()
+    assert cask.metadata.extras == {
+        "brew.tap": "homebrew/cask",
+        "brew.installed_on_request": True,
+    }
+
+
+@pytest.mark.parametrize("manager_class", (Brew, Cask))
+def test_installed_unrecognized_prefix(prefix, manager_class):
+    """A layout the reader does not know falls back to `brew list`."""
+    (prefix / "Cellar" / "wget" / "1.24.5" / "INSTALL_RECEIPT.json").unlink()
+    (prefix / "Caskroom" / "firefox" / ".metadata" / "127.0").rename(
+        prefix / "Caskroom" / "firefox" / "127.0"
+    )
+    (prefix / "Caskroom" / "firefox" / ".metadata" / "126.0").rename(
+        prefix / "Caskroom" / "firefox" / "126.0"
+    )
+    manager = _manager(manager_class, prefix)
+    with patch.object(manager, "run_cli", return_value="wget 1.21.4 1.24.5") as run_cli:
+        packages = [(p.id, str(p.installed_version)) for p in manager.installed]
+    run_cli.assert_called_once_with("list", "--quiet", "--versions")
+    assert packages == [("wget", "1.24.5")]
+
+
+def test_prefix_from_brew_cli(prefix, tmp_path_factory):
+    """A `brew` outside of its prefix has the prefix asked to `brew --prefix`."""
+    elsewhere = tmp_path_factory.mktemp("elsewhere")
+    manager = Brew()
+    manager.cli_path = elsewhere / "brew"
+    with patch.object(manager, "run_cli", return_value=f"{prefix}\n") as run_cli:
+        assert "wget" in manager.install_receipts()
+        assert manager._brew_prefix == prefix
+    # The prefix is only resolved once.
+    run_cli.assert_called_once_with("--prefix", auto_post_args=False, must_succeed=True)
+
+
+def test_metadata_batch_falls_back_to_receipts(prefix):
+    """Packages `brew info` does not describe get their receipt's metadata."""
+    manager = _manager(Brew, prefix)
+    packages = list(manager.installed)
+    with patch.object(manager, "run_cli", return_value="{not json"):
+        pairs = list(manager.package_metadata_batch(packages))
+    assert {p.id: m.extras["brew.tap"] for p, m in pairs} == {
+        "ntfs-3g-mac": "gromgit/fuse",
+        "wget": "homebrew/core",
+    }
@@ -0,0 +1,143 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Homebrew-specific tests."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from extra_platforms import is_any_windows
+
+from meta_package_manager.managers.npm import NPM
+
+skip_windows = pytest.mark.skipif(
+    is_any_windows(), reason="npm global packages are only read on POSIX"
+)
+
+
+def test_npm_bulk_metadata():
+    manager = NPM()
+    manager.cli_path = Path(sys.executable)
+    manager.run = lambda *args, **kwargs: json.dumps({
+        "name": "lib",
+        "dependencies": {
+            "wrangler": {
+                "version": "3.51.2",
+                "resolved": "https://registry.npmjs.org/wrangler/-/wrangler-3.51.2.tgz",
+                "integrity": "sha512-3q2+7w==",
+                "description": "Cloudflare Workers CLI",
+                "license": {"type": "MIT"},
+                "repository": {"url": "git+https://github.com/cloudflare/workers-sdk.git"},
+                "bugs": "https://github.com/cloudflare/workers-sdk/issues",
+                "author": "Jane Doe <jane@example.com> (https://example.com)",
+                "_dependencies": {"esbuild": "0.17.19"},
+            },
+        },
+    })
+    metadata = manager.bulk_metadata()["wrangler"]
+    assert metadata.download_url.endswith("wrangler-3.51.2.tgz")
+    assert metadata.license_declared == "MIT"
+    assert metadata.vcs_url == "git+https://github.com/cloudflare/workers-sdk.git"
+    assert metadata.issue_tracker_url.endswith("/issues")
+    assert metadata.originator.name == "Jane Doe"
+    assert metadata.originator.email == "jane@example.com"
+    assert metadata.checksums[0].value == "deadbeef"
+    assert metadata.dependencies[0].target_id == "esbuild"
+    assert metadata.dependencies[0].version_constraint == "0.17.19"
+
+
+NPM_LIST = json.dumps({"dependencies": {"npm": {"version": "10.8.1"}}})
+
+
+@pytest.fixture
+def prefix(tmp_path, monkeypatch):
+    """A Node.js prefix with npm, a scoped and a plain global package."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    for key in ("PREFIX", "NPM_CONFIG_PREFIX", "npm_config_prefix"):
+        monkeypatch.delenv(key, raising=False)
+
+    modules = tmp_path / "lib" / "node_modules"
+    for package_id, version in (
+        ("npm", "10.8.1"),
+        ("@mermaid-js/mermaid-cli", "10.9.1"),
+        ("wrangler", "3.60.3"),
+    ):
+        (modules / package_id).mkdir(parents=True)
+        (modules / package_id / "package.json").write_text(
+            json.dumps({"name": package_id, "version": version})
+        )
+    (modules / "npm" / "bin").mkdir()
+    (modules / "npm" / "bin" / "npm-cli.js").touch()
+    (modules / ".package-lock.json").touch()
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "bin" / "node").touch()
+    (tmp_path / "bin" / "npm").symlink_to(modules / "npm" / "bin" / "npm-cli.js")
+    return tmp_path
+
+
+def _installed(prefix, output=NPM_LIST):
+    manager = NPM()
+    manager.cli_path = prefix / "bin" / "npm"
+    with patch.object(manager, "run_cli", return_value=output) as run_cli:
+        packages = [(p.id, str(p.installed_version)) for p in manager.installed]
+    return packages, run_cli.called
+
+
+@skip_windows
+def test_installed_from_prefix(prefix):
+    """Global packages are read from their `package.json`, without running npm."""
+    assert _installed(prefix) == (
+        [
+            ("@mermaid-js/mermaid-cli", "10.9.1"),
+            ("npm", "10.8.1"),
+            ("wrangler", "3.60.3"),
+        ],
+        False,
+    )
+
+
+@skip_windows
+def test_installed_prefix_from_environment(prefix, monkeypatch):
+    monkeypatch.setenv("npm_config_prefix", str(prefix / "elsewhere"))
+    assert _installed(prefix) == ([("npm", "10.8.1")], True)
+
+
+@skip_windows
+@pytest.mark.parametrize("config", ("home/.npmrc", "etc/npmrc"))
+def test_installed_prefix_from_config(prefix, config):
+    (prefix / config).parent.mkdir(exist_ok=True)
+    (prefix / config).write_text("fund=false\n prefix = ~/.npm-global\n")
+    assert _installed(prefix) == ([("npm", "10.8.1")], True)
+
+
+@skip_windows
+def test_installed_unrecognized_layout(prefix):
+    """Anything unexpected hands over to `npm list`."""
+    manifest = prefix / "lib" / "node_modules" / "wrangler" / "package.json"
+    manifest.write_text("{}")
+    assert _installed(prefix) == ([("npm", "10.8.1")], True)
+    manifest.unlink()
+    assert _installed(prefix)[1]
+
+    # npm out of a Node.js prefix, like the one of a Linux distribution.
+    manifest.write_text('{"version": "3.60.3"}')
+    assert not _installed(prefix)[1]
+    (prefix / "bin" / "node").unlink()
+    assert _installed(prefix)[1]
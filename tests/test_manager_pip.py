@@ -18,13 +18,14 @@
 from __future__ import annotations
 
 import importlib.metadata
+import json
 import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from meta_package_manager.execution import CLIExecutor
+from meta_package_manager.execution import CLIError, CLIExecutor
 from meta_package_manager.managers.pip import Pip
 
 PATCH_DIST = "meta_package_manager.managers.pip.importlib.metadata.distribution"
@@ -201,3 +202,120 @@ def test_search_unavailable_when_all_candidates_blocked():
     ):
         found = list(Pip().search_all_cli(("python3", "python")))
     assert found == []
+
+
+# --- Install reason, read from the dist-info records. ------------------------
+
+
+@pytest.mark.parametrize(
+    ("installer", "requested", "expected"),
+    (
+        ("pip", True, True),
+        ("pip", False, False),
+        # Other installers do not write the REQUESTED marker.
+        ("uv", False, None),
+        (None, False, None),
+    ),
+)
+def test_installed_on_request(tmp_path, installer, requested, expected):
+    dist_info = tmp_path / "foo_bar-1.0.dist-info"
+    dist_info.mkdir()
+    dist_info.joinpath("METADATA").write_text(
+        "Metadata-Version: 2.1\nName: Foo_Bar\nVersion: 1.0\n"
+        "Requires-Dist: Some.Lib>=2\n",
+        encoding="UTF-8",
+    )
+    if installer:
+        dist_info.joinpath("INSTALLER").write_text(f"{installer}\n", encoding="UTF-8")
+    if requested:
+        dist_info.joinpath("REQUESTED").touch()
+    dist = importlib.metadata.PathDistribution(dist_info)
+    metadata = Pip._distribution_metadata(dist)
+    assert metadata.installed_on_request is expected
+    assert [dependency.target_id for dependency in metadata.dependencies] == [
+        "Some.Lib"
+    ]
+
+
+# --- Orphans, read from the target interpreter's distributions. ---------------
+
+
+def _dist_info(site, name, requires=(), requested=False, version="1.0"):
+    dist_info = site / f"{name}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    dist_info.joinpath("METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+        + "".join(f"Requires-Dist: {dependency}\n" for dependency in requires),
+        encoding="UTF-8",
+    )
+    dist_info.joinpath("INSTALLER").write_text("pip\n", encoding="UTF-8")
+    if requested:
+        dist_info.joinpath("REQUESTED").touch()
+
+
+def test_dependency_graph_reads_target_interpreter(tmp_path):
+    """Distributions are read from the interpreter pip runs in, not mpm's own."""
+    site = tmp_path / "site-packages"
+    _dist_info(site, "mpm_test_app", ("mpm-test-lib>=1",), requested=True)
+    _dist_info(site, "mpm_test_lib")
+    _dist_info(site, "mpm_test_stale")
+
+    manager = Pip()
+    manager.cli_path = tmp_path / "bin" / "python"
+    listing = json.dumps([
+        {"name": name, "version": "1.0"}
+        for name in ("mpm_test_app", "mpm_test_lib", "mpm_test_stale")
+    ])
+    with (
+        patch(PATCH_RUN, return_value=_completed(json.dumps([str(site)]))) as run,
+        patch.object(manager, "run_cli", return_value=listing),
+    ):
+        assert [package.id for package in manager.orphans] == ["mpm_test_stale"]
+    assert run.call_args.args[0][0] == str(manager.cli_path)
+
+
+@pytest.mark.parametrize(
+    ("pip_version", "app_requested"),
+    (
+        # pip wrote no REQUESTED marker before 20.2.
+        ("20.1", True),
+        # A site without a single marker was not populated by a recent pip.
+        ("24.0", False),
+        (None, False),
+    ),
+)
+def test_dependency_graph_untrusted_markers(tmp_path, pip_version, app_requested):
+    """No orphan is inferred from markers the site's pip could not write."""
+    site = tmp_path / "site-packages"
+    if pip_version:
+        _dist_info(site, "pip", version=pip_version, requested=app_requested)
+    _dist_info(site, "mpm_test_app", ("mpm-test-lib>=1",), requested=app_requested)
+    _dist_info(site, "mpm_test_lib")
+    _dist_info(site, "mpm_test_stale")
+
+    manager = Pip()
+    manager.cli_path = tmp_path / "bin" / "python"
+    listing = json.dumps([
+        {"name": name, "version": "1.0"}
+        for name in ("mpm_test_app", "mpm_test_lib", "mpm_test_stale")
+    ])
+    with (
+        patch(PATCH_RUN, return_value=_completed(json.dumps([str(site)]))),
+        patch.object(manager, "run_cli", return_value=listing),
+    ):
+        assert not manager._requested_markers
+        assert list(manager.orphans) == []
+        metadata = list(manager.package_metadata_batch(manager.installed))
+    assert len(metadata) == 3
+    assert {meta.installed_on_request for _, meta in metadata} == {None}
+
+
+def test_dependency_graph_unknown_import_path(tmp_path):
+    """No graph at all rather than one missing the target's distributions."""
+    manager = Pip()
+    manager.cli_path = tmp_path / "bin" / "python"
+    with (
+        patch(PATCH_RUN, side_effect=OSError("not a python")),
+        pytest.raises(CLIError),
+    ):
+        manager.dependency_graph()
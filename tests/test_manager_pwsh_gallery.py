@@ -16,17 +16,22 @@
 """PowerShell Gallery parsing tests.
 
 These tests cover the pure-Python parsing/quoting logic. They do not invoke
-`pwsh` and are platform-agnostic.
+`pwsh` and are platform-agnostic, except for the session status checks, which
+are skipped where `pwsh` is not installed.
 """
 
 from __future__ import annotations
 
+from shutil import which
+
 import pytest
 
+from meta_package_manager.execution import CLIError
 from meta_package_manager.managers.pwsh_gallery import (
     PWSH_Gallery,
     _pwsh_quote,
 )
+from meta_package_manager.session import close_sessions
 
 
 @pytest.fixture
@@ -186,3 +191,56 @@ def test_install_escapes_embedded_single_quote(manager, capture_run_cli):
     manager.install("O'Brien")
     expression = captured[0][0]
     assert "'O''Brien'" in expression
+
+
+def test_session_script_wraps_command_expression(manager):
+    args = ("/usr/bin/pwsh", *manager.pre_args, "Get-InstalledPSResource")
+    script = manager.session_script(args)
+    assert script.endswith("\n")
+    assert script.count("\n") == 1
+    # The status is read inside the block, before the output is piped away.
+    assert (
+        "& { Get-InstalledPSResource; if (-not $?) { $global:mpmStatus = 1 } }"
+        " | Out-String -Stream }"
+    ) in script
+    assert manager.session_trailer("MARK") == (
+        "[Console]::Out.WriteLine('MARK ' + $mpmStatus);"
+        " [Console]::Error.WriteLine('MARK')\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "args",
+    (
+        # Version probe, which skips pre_args.
+        ("/usr/bin/pwsh", "--version"),
+        ("/usr/bin/pwsh", "-NoProfile", "-NonInteractive", "-Command", "a\nb"),
+    ),
+)
+def test_session_script_declines(manager, args):
+    assert manager.session_script(args) is None
+
+
+@pytest.mark.skipif(not which("pwsh"), reason="pwsh interpreter not available")
+@pytest.mark.parametrize(
+    "expression",
+    (
+        # Non-terminating error.
+        "Get-Item 'mpm-missing-path'",
+        "Get-Item 'mpm-missing-path';",
+        # Terminating error.
+        "throw 'mpm-failure'",
+    ),
+)
+def test_session_reports_failed_command(expression):
+    manager = PWSH_Gallery()
+    try:
+        assert manager.run_cli("Write-Output 'still there'") == "still there"
+        with pytest.raises(CLIError) as excinfo:
+            manager.run_cli(expression, must_succeed=True)
+        assert excinfo.value.code == 1
+        # The failure was reported by the session, which keeps serving.
+        assert manager._sessions
+        assert manager.run_cli("Write-Output 'still there'") == "still there"
+    finally:
+        close_sessions()
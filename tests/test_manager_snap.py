@@ -0,0 +1,182 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Homebrew-specific tests."""
+
+from __future__ import annotations
+
+import json
+import socket
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from meta_package_manager.managers.snap import Snap
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="snapd listens on a Unix socket"
+)
+
+SNAPS = {
+    "/v2/snaps": [
+        {"name": "wechat", "version": "2.0", "revision": "7"},
+        {"name": "core", "version": "16-2.44.1", "revision": "8935"},
+    ],
+    "/v2/find?select=refresh": [{"name": "wechat", "version": "2.1"}],
+    "/v2/find?q=doc": [
+        {"name": "journey", "version": "2.14.3", "summary": "Your private diary."},
+        {"name": "nextcloud", "version": "17.0.5snap1", "summary": ""},
+    ],
+}
+
+
+class _SnapdHandler(BaseHTTPRequestHandler):
+    """Answer the API requests of the client like snapd, from `SNAPS`."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        key = url.path
+        if url.query:
+            key += "?" + "&".join(
+                f"{k}={v[0]}" for k, v in sorted(parse_qs(url.query).items())
+            )
+        self.server.requests.append(key)
+        if key in SNAPS:
+            status = 200
+            payload = {"type": "sync", "status-code": 200, "result": SNAPS[key]}
+        else:
+            status = 404
+            payload = {
+                "type": "error",
+                "status-code": 404,
+                "result": {"message": "not found", "kind": "snap-not-found"},
+            }
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _SnapdServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path):
+        super().__init__(str(path), _SnapdHandler)
+        self.connections = 0
+        self.requests = []
+
+
+@pytest.fixture
+def snapd(tmp_path):
+    server = _SnapdServer(tmp_path / "snapd.socket")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def manager(snapd):
+    manager = Snap()
+    manager.snapd_socket = Path(snapd.server_address)
+    yield manager
+    if manager._snapd is not None:
+        manager._snapd.close()
+
+
+def _results(packages):
+    return [
+        (p.id, p.installed_version and str(p.installed_version), p.description)
+        for p in packages
+    ]
+
+
+def test_api_queries(snapd, manager):
+    """All read operations are answered by snapd, over a single connection."""
+    with patch.object(manager, "run_cli", side_effect=AssertionError) as run_cli:
+        installed = _results(manager.installed)
+        outdated = [(p.id, str(p.latest_version)) for p in manager.outdated]
+        search = [
+            (p.id, str(p.latest_version), p.description)
+            for p in manager.search("doc", extended=False, exact=False)
+        ]
+    run_cli.assert_not_called()
+    assert installed == [("core", "16-2.44.1", None), ("wechat", "2.0", None)]
+    assert outdated == [("wechat", "2.1")]
+    assert search == [
+        ("journey", "2.14.3", "Your private diary."),
+        ("nextcloud", "17.0.5snap1", None),
+    ]
+    assert snapd.connections == 1
+    # outdated fetches the installed versions and the refreshes concurrently.
+    assert sorted(snapd.requests) == [
+        "/v2/find?q=doc",
+        "/v2/find?select=refresh",
+        "/v2/snaps",
+        "/v2/snaps",
+    ]
+
+
+def test_api_error_falls_back(snapd, manager):
+    """An error answer is left to the CLI, which reports it its own way."""
+    with patch.object(manager, "run_cli", return_value="") as run_cli:
+        assert list(manager.search("unknown", extended=False, exact=False)) == []
+        run_cli.assert_called_once_with("find", "unknown")
+        # The API is still used for the next queries.
+        assert len(list(manager.installed)) == 2
+        run_cli.assert_called_once()
+    assert snapd.requests == ["/v2/find?q=unknown", "/v2/snaps"]
+
+
+def test_missing_socket_falls_back(tmp_path):
+    manager = Snap()
+    manager.snapd_socket = tmp_path / "snapd.socket"
+    cli_output = "Name   Version  Rev  Tracking       Publisher  Notes\n" + (
+        "pdftk  2.02-4   9    latest/stable  smoser     -"
+    )
+    with patch.object(manager, "run_cli", return_value=cli_output) as run_cli:
+        assert _results(manager.installed) == [("pdftk", "2.02-4", None)]
+    run_cli.assert_called_once_with("list")
+    assert manager._snapd is None
+
+
+def test_unreachable_socket_falls_back(snapd, manager):
+    """A daemon that stopped answering is not asked again for the whole run."""
+    snapd.shutdown()
+    snapd.server_close()
+    # The socket file is left behind, like the one of a stopped snapd.
+    Path(snapd.server_address).touch()
+    with patch.object(manager, "run_cli", return_value="") as run_cli:
+        assert list(manager.installed) == []
+        assert list(manager.installed) == []
+    assert run_cli.call_count == 2
+    assert manager._snapd_failed
@@ -17,10 +17,17 @@
 from __future__ import annotations
 
 import ast
+import dataclasses
+import gc
 import inspect
+import json
 import os
 import re
 import sys
+import threading
+import tracemalloc
+import weakref
+from operator import attrgetter
 from pathlib import Path, PurePath
 from string import ascii_letters, ascii_lowercase, digits
 
@@ -29,16 +36,26 @@ from boltons.iterutils import unique
 from boltons.urlutils import URL
 from extra_platforms import ALL_PLATFORMS, Platform, is_windows
 
-from meta_package_manager import cli_explore, cli_maintenance
-from meta_package_manager.capabilities import Operations
+from meta_package_manager import cli_explore, cli_maintenance, version
+from meta_package_manager.capabilities import (
+    Operations,
+    _implements,
+    capability_matrix,
+    implements,
+)
 from meta_package_manager.cli import XKCD_MANAGER_ORDER
-from meta_package_manager.execution import CLIExecutor
+from meta_package_manager.execution import CLIError, CLIExecutor
 from meta_package_manager.manager import PackageManager
-from meta_package_manager.package import Package
+from meta_package_manager.package import (
+    Package,
+    QueryMatcher,
+    packages_asdict,
+)
 from meta_package_manager.pool import pool
 from meta_package_manager.version import TokenizedString
 
-from .conftest import all_managers, manager_classes_params
+from .conftest import all_managers, manager_classes, manager_classes_params
+from .fake_manager import FakeManager
 
 """ Test the structure, data and types returned by all package managers.
 
@@ -266,6 +283,39 @@ def test_cli_path(manager):
         assert manager.cli_path.is_file()
 
 
+@all_managers
+def test_capability_matrix(manager):
+    """The precomputed capabilities agree with a walk of the class hierarchy."""
+    capabilities = capability_matrix(manager)
+    assert capabilities is capability_matrix(type(manager))
+    for op in Operations:
+        assert (op in capabilities.operations) is _implements(type(manager), op)
+    for method_name in ("upgrade_all_cli", "cleanup_orphan", "doctor_cli", "search"):
+        assert (method_name in capabilities.methods) is manager._defines(method_name)
+
+
+def test_capability_matrix_routing():
+    """Routing every operation over the whole pool agrees with reflection."""
+    managers = list(pool.values())
+    matrix = [
+        op in capability_matrix(m).operations for m in managers for op in Operations
+    ]
+    assert matrix == [_implements(type(m), op) for m in managers for op in Operations]
+    assert matrix == [implements(m, op) for m in managers for op in Operations]
+
+
+def test_capability_matrix_releases_synthesized_classes():
+    """Classes synthesized one after the other are not all kept alive."""
+    classes = weakref.WeakSet()
+    for index in range(1000):
+        cls = type(f"Synthesized{index}", (PackageManager,), {})
+        capability_matrix(cls)
+        classes.add(cls)
+        del cls
+    gc.collect()
+    assert len(classes) < 1000
+
+
 @pytest.mark.parametrize(
     ("query", "query_parts"),
     (
@@ -313,6 +363,145 @@ def test_package_matches(pkg_id, pkg_name, query, extended, exact, expected):
     assert package.matches(query, extended=extended, exact=exact) is expected
 
 
+def _reference_matches(package, query, extended=False, exact=False):
+    """Uncompiled implementation of the query matching, re-split per package."""
+    content = [package.id, package.name]
+    if exact and query not in content:
+        return False
+    if extended:
+        content.append(package.description)
+    serialized_content = "\0".join(s for s in content if s).lower()
+    return any(
+        part.lower() in serialized_content for part in Package.query_parts(query)
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    ("sed", "gnu sed", "ED-sTr", "s e d", "edit/sed/pkg", "gnu-sed", "", "@@@"),
+)
+@pytest.mark.parametrize("extended", (True, False))
+@pytest.mark.parametrize("exact", (True, False))
+def test_query_matcher(query, extended, exact):
+    packages = [
+        Package(id="gnu-sed", manager_id="fake"),
+        Package(id="pkg-1", manager_id="fake", name="GNU Sed"),
+        Package(id="pkg-2", manager_id="fake", description="a stream editor"),
+        Package(id="perl", manager_id="fake", name="", description="Perl"),
+    ]
+    matcher = QueryMatcher(query, extended, exact)
+    expected = [p for p in packages if _reference_matches(p, query, extended, exact)]
+    assert list(matcher.filter(packages)) == expected
+    assert [p for p in packages if matcher.matches(p)] == expected
+    assert matcher.highlight_patterns == {query} | Package.query_parts(query)
+    # Parts are lowercased, deduplicated, longest first.
+    assert set(matcher.parts) == {p.lower() for p in Package.query_parts(query)}
+    lengths = [len(part) for part in matcher.parts]
+    assert lengths == sorted(lengths, reverse=True)
+
+
+@pytest.mark.parametrize(
+    "query", ("pkg-12 rc9 Package/777 alpha beta gamma", "777 gamma", "rc9 gamma")
+)
+def test_query_matcher_many_parts(query):
+    """Filtering many packages against a many-part query agrees with the
+    reference implementation."""
+    packages = _sample_packages(5_000)
+    expected = [p for p in packages if _reference_matches(p, query)]
+    assert list(QueryMatcher(query).filter(packages)) == expected
+
+
+def _sample_packages(count: int) -> list[Package]:
+    return [
+        Package(
+            id=f"pkg-{i}",
+            manager_id="fake",
+            name=f"Package {i}",
+            installed_version=f"1.{i}.0-rc{i % 7}",
+            latest_version=f"2.{i}.1" if i % 3 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def test_packages_asdict():
+    packages = _sample_packages(4)
+    # Keys follow the field declaration order, not the requested one.
+    rows = list(
+        packages_asdict(packages, ("latest_version", "id", "installed_version"))
+    )
+    assert [list(row) for row in rows] == [
+        ["id", "installed_version", "latest_version"]
+    ] * 4
+    for package, row in zip(packages, rows):
+        expected = {
+            k: v
+            for k, v in dataclasses.asdict(package).items()
+            if k in ("id", "installed_version", "latest_version")
+        }
+        # Same content as the deep-copying projection, with versions as strings.
+        assert row == {
+            k: str(v) if isinstance(v, TokenizedString) else v
+            for k, v in expected.items()
+        }
+        assert type(row["installed_version"]) is str
+    assert rows[0]["latest_version"] is None
+
+
+def test_packages_asdict_matches_dataclasses():
+    """The projection agrees with the former `dataclasses.asdict`
+    implementation, versions aside."""
+    packages = _sample_packages(200)
+    fields = ("id", "name", "installed_version", "latest_version")
+    legacy = [
+        {
+            k: str(v) if isinstance(v, TokenizedString) else v
+            for k, v in dataclasses.asdict(p).items()
+            if k in fields
+        }
+        for p in packages
+    ]
+    assert list(packages_asdict(packages, fields)) == legacy
+
+
+def test_package_memory(record_property):
+    """Measure the bytes held per package of a large inventory.
+
+    Worst case for the version cache: no two packages share a version. Packages,
+    their two versions and the tokens of these were about 1950 bytes each with a
+    `__dict__` per instance, and are about 1050 bytes slotted.
+    """
+    package = _sample_packages(1)[0]
+    installed_version = package.installed_version
+    assert isinstance(installed_version, TokenizedString)
+    for instance in (package, installed_version, installed_version.tokens[0]):
+        assert not hasattr(instance, "__dict__")
+
+    count = 20_000
+    kwargs = [
+        {
+            "id": f"pkg-{i}",
+            "manager_id": "fake",
+            "name": f"Package {i}",
+            "installed_version": f"3.{i}.0",
+            "latest_version": f"3.{i}.1",
+        }
+        for i in range(count)
+    ]
+    tracemalloc.start()
+    try:
+        packages = [Package(**package_kwargs) for package_kwargs in kwargs]
+        # Only count what the packages themselves keep alive.
+        version._intern.cache_clear()
+        version._intern_token.cache_clear()
+        bytes_per_package = tracemalloc.get_traced_memory()[0] / count
+    finally:
+        tracemalloc.stop()
+    assert len(packages) == count
+    record_property("bytes_per_package", round(bytes_per_package))
+    assert bytes_per_package < 1400
+
+
 def _collect_class_members(klass: type, name: str) -> tuple[list[str], list[str]]:
     """Collect a base class's `(attributes, methods)` in declaration order.
 
@@ -349,6 +538,8 @@ CANONICAL_ATTRS = (
     "brewfile_entry_type",
     "brewfile_skip_warning",
     "platforms",
+    "bootstrapped_by",
+    "watch_paths",
     "virtual",
     # Escalation policy.
     "sudo",
@@ -376,10 +567,16 @@ CANONICAL_ATTRS = (
     "timeout",
     "_active_operation",
     "progress",
+    "concurrent_reads",
+    "jobs",
     "cooldown",
     "cooldown_policy",
     "windows_creation_flags",
     "windows_processes_to_cleanup",
+    "session_args",
+    "_sessions",
+    "_sessions_lock",
+    "_session_failed",
     "cli_errors",
     "_last_run",
     "run_cache",
@@ -473,3 +670,170 @@ def test_content_order(manager_class):
     enforced_props = tuple(p for p in collected_props if p in props_ref)
     expected_order = tuple(p for p in props_ref if p in collected_props)
     assert enforced_props == expected_order
+
+
+bulk_metadata_managers = pytest.mark.parametrize(
+    "manager_class",
+    [klass for klass in manager_classes if klass._defines("bulk_metadata")],
+    ids=attrgetter("name"),
+)
+
+
+def _bulk_metadata_sample(manager_id: str, prefix: Path) -> tuple[str, dict]:
+    """Output of the bulk metadata query of `manager_id` describing `pkg-0`, and
+    the metadata fields expected from it."""
+    if manager_id == "conda":
+        prefix.joinpath("conda-meta").mkdir(parents=True)
+        prefix.joinpath("conda-meta", "pkg-0-1.0-0.json").write_text(
+            json.dumps({"name": "pkg-0", "version": "1.0", "license": "MIT"}),
+            encoding="UTF-8",
+        )
+        return json.dumps({"default_prefix": str(prefix)}), {"license_declared": "MIT"}
+    if manager_id == "flatpak":
+        output = "pkg-0\tSample app\tflathub\tsystem\tstable\tx86_64\t8c5a1a6c1b05\n"
+        return output, {"description": "Sample app", "summary": "Sample app"}
+    if manager_id == "gem":
+        output = "pkg-0 (1.0)\n    Licenses: MIT\n\n    Sample gem\n"
+        return output, {"license_declared": "MIT", "summary": "Sample gem"}
+    if manager_id == "npm":
+        output = json.dumps({
+            "dependencies": {"pkg-0": {"version": "1.0", "license": "MIT"}}
+        })
+        return output, {"license_declared": "MIT"}
+    raise AssertionError(f"No bulk metadata sample for {manager_id}.")
+
+
+@bulk_metadata_managers
+@pytest.mark.parametrize("package_count", (1, 50))
+def test_bulk_metadata_process_count(manager_class, package_count, tmp_path):
+    """Enrichment spawns a constant number of processes per manager, whatever the
+    size of its inventory, and none at all once the index is cached."""
+    manager = manager_class()
+    manager.cli_path = Path(sys.executable)
+    output, expected = _bulk_metadata_sample(manager.id, tmp_path)
+    calls = []
+
+    def counting_run(*args, **kwargs):
+        calls.append(args)
+        return output
+
+    manager.run = counting_run
+    packages = [
+        manager.package(id=f"pkg-{i}", installed_version="1.0")
+        for i in range(package_count)
+    ]
+
+    index = {
+        package.id: metadata
+        for package, metadata in manager.package_metadata_batch(packages)
+    }
+    assert len(index) == package_count
+    assert 1 <= len(calls) <= 2
+    # The bulk output is parsed into the metadata of the package it describes.
+    for field_id, value in expected.items():
+        assert getattr(index["pkg-0"], field_id) == value
+    assert all(index[f"pkg-{i}"].is_empty() for i in range(1, package_count))
+    spawned = len(calls)
+    list(manager.package_metadata_batch(packages))
+    assert len(calls) == spawned
+
+
+@pytest.mark.parametrize(
+    ("concurrent_reads", "jobs", "overlap"),
+    (
+        (True, None, True),
+        (True, 2, True),
+        # --jobs 1 and DEBUG verbosity pin every query to the calling thread.
+        (True, 1, False),
+        # So does a manager whose reads contend for a lock.
+        (False, None, False),
+    ),
+)
+def test_gather(concurrent_reads, jobs, overlap):
+    """Independent sub-queries overlap unless the manager or the user forbids it."""
+    manager = type(pool["snap"])()
+    manager.concurrent_reads = concurrent_reads
+    manager.jobs = jobs
+    second_started = threading.Event()
+
+    def first():
+        # Only returns True if the second query started while this one runs.
+        return second_started.wait(timeout=0 if not overlap else 5)
+
+    def second():
+        second_started.set()
+        return "second"
+
+    assert manager.gather(first, second) == (overlap, "second")
+
+
+class BatchUpgradeFakeManager(FakeManager):
+    """Fake manager with no full upgrade one-liner, but a multi-package upgrade.
+
+    Records each batch instead of running it, failing those containing a
+    package of {attr}`broken`.
+    """
+
+    broken: frozenset[str] = frozenset()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[tuple[str, ...]] = []
+
+    @property
+    def outdated(self):
+        for index in range(8):
+            yield self.package(
+                id=f"pkg-{index}", installed_version="1.0", latest_version="2.0"
+            )
+
+    def upgrade_all_cli(self) -> tuple[str, ...]:
+        raise NotImplementedError
+
+    def upgrade_many_cli(self, package_ids) -> tuple[str, ...]:
+        return tuple(package_ids)
+
+    def run(self, *args, extra_env=None, must_succeed=False) -> str:
+        (package_ids,) = args
+        self.batches.append(package_ids)
+        if self.broken.intersection(package_ids):
+            error = CLIError(1, "", f"Cannot upgrade {package_ids}")
+            self.cli_errors.append(error)
+            if self.stop_on_error:
+                raise error
+            return ""
+        return f"Upgraded {len(package_ids)}"
+
+
+@pytest.mark.parametrize(
+    ("broken", "calls", "upgraded"),
+    (
+        # One call for the whole set.
+        ((), 1, 8),
+        # A culprit costs two calls per bisection level.
+        (("pkg-5",), 7, 7),
+        (("pkg-0", "pkg-7"), 11, 6),
+    ),
+)
+def test_batched_upgrade_all(broken, calls, upgraded):
+    manager = BatchUpgradeFakeManager()
+    manager.broken = frozenset(broken)
+    output = manager.upgrade()
+
+    assert len(manager.batches) == calls
+    assert manager.batches[0] == tuple(f"pkg-{index}" for index in range(8))
+    assert sum(int(line.split()[-1]) for line in output.splitlines()) == upgraded
+    # Only the culprits are reported, not the batches bisected to find them.
+    assert [error.error for error in manager.cli_errors] == [
+        f"Cannot upgrade {(package_id,)}" for package_id in broken
+    ]
+
+
+def test_batched_upgrade_all_stop_on_error():
+    manager = BatchUpgradeFakeManager()
+    manager.broken = frozenset(("pkg-5",))
+    manager.stop_on_error = True
+    with pytest.raises(CLIError) as excinfo:
+        manager.upgrade()
+    assert excinfo.value.error == "Cannot upgrade ('pkg-5',)"
+    assert len(manager.cli_errors) == 1
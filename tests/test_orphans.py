@@ -38,7 +38,9 @@ from meta_package_manager.capabilities import (
     supports_cleanup_cache,
     supports_cleanup_repair,
 )
+from meta_package_manager.dependency_graph import DependencyGraph
 from meta_package_manager.manager import PackageManager
+from meta_package_manager.package import Package
 from meta_package_manager.pool import pool
 
 from .conftest import _patch_pool_with
@@ -167,7 +169,7 @@ def test_plain_cleanup_never_sweeps(monkeypatch, manager_id, sweep_token, cache_
     assert cache_token in tokens
 
 
-@pytest.mark.parametrize("manager_id", ("npm", "pip", "snap"))
+@pytest.mark.parametrize("manager_id", ("npm", "snap"))
 def test_cleanup_orphan_unsupported_raises_not_implemented(manager_id):
     """A manager with neither a native sweep nor an `orphans` query propagates
     `NotImplementedError` from the base sweep, so `cleanup --orphans` skips it."""
@@ -196,9 +198,10 @@ def test_cleanup_orphan_unsupported_raises_not_implemented(manager_id):
         ("paru", True, True),
         ("yay", True, True),
         ("zypper", True, True),
+        # Orphans computed from the dependency graph of the installed packages.
+        ("pip", True, True),
         # No orphan support at all.
         ("npm", False, False),
-        ("pip", False, False),
         ("snap", False, False),
     ),
 )
@@ -300,6 +303,106 @@ def test_synthesized_sweep_stops_without_progress(monkeypatch):
     assert removed == [("--remove", "--recursive", "libstuck")]
 
 
+def _graph_package(package_id):
+    return Package(id=package_id, manager_id="pip")
+
+
+def test_dependency_graph_orphan_closure():
+    """One traversal from the roots finds every orphan, including the dependency
+    cycles and the chains a round-by-round listing would peel layer by layer."""
+    graph = DependencyGraph(key=str.lower)
+    for package_id, dependencies, on_request in (
+        ("app", ("Lib-A",), True),
+        ("lib-a", ("lib-b",), False),
+        ("lib-b", (), False),
+        # A removed app left this chain and cycle behind.
+        ("old-plugin", ("old-core", "lib-b"), False),
+        ("old-core", ("old-helper",), False),
+        ("old-helper", ("old-core", "not-installed"), False),
+        # Unknown install reasons are kept.
+        ("mystery", (), None),
+    ):
+        graph.add(_graph_package(package_id), dependencies, on_request)
+
+    assert graph.required() == {"app", "lib-a", "lib-b", "mystery"}
+    # Dependents come before their dependencies; the cycle comes last.
+    assert [package.id for package in graph.orphans()] == [
+        "old-plugin",
+        "old-core",
+        "old-helper",
+    ]
+
+
+def test_dependency_graph_removal_order():
+    graph = DependencyGraph()
+    for package_id, dependencies in (
+        ("a", ("b", "c")),
+        ("b", ("c",)),
+        ("c", ()),
+        ("d", ("c", "d")),
+    ):
+        graph.add(_graph_package(package_id), dependencies)
+    assert graph.removal_order(["c", "b", "a", "d"]) == ["a", "b", "d", "c"]
+    assert graph.removal_order(["c", "b"]) == ["b", "c"]
+
+
+class GraphFakeManager(FakeManager):
+    """Fake manager deriving its orphans from a dependency graph, with a batched
+    removal."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[tuple[str, ...]] = []
+
+    def dependency_graph(self) -> DependencyGraph:
+        graph = DependencyGraph()
+        graph.add(_graph_package("app"), ("lib",), installed_on_request=True)
+        graph.add(_graph_package("lib"), installed_on_request=False)
+        graph.add(_graph_package("stale-lib"), ("lib", "base"), False)
+        graph.add(_graph_package("base"), installed_on_request=False)
+        return graph
+
+    def remove(self, package_id: str) -> str:
+        self.calls.append(("remove", package_id))
+        return ""
+
+    def remove_many(self, package_ids) -> str:
+        self.calls.append(("remove_many", *package_ids))
+        return ""
+
+
+def test_dependency_graph_backfills_orphans(monkeypatch):
+    """Pip has no native orphan listing: the base query walks its graph."""
+    manager = pool["pip"]
+    monkeypatch.setattr(
+        manager, "dependency_graph", GraphFakeManager().dependency_graph
+    )
+    assert [package.id for package in manager.orphans] == ["stale-lib", "base"]
+
+
+def test_synthesized_sweep_from_dependency_graph(monkeypatch):
+    """The graph-backed sweep removes the whole closure in a single batched call,
+    without re-querying."""
+    manager = GraphFakeManager()
+    manager.cleanup_orphan()
+    assert manager.calls == [("remove_many", "stale-lib", "base")]
+
+    # Without a batched removal, packages go one by one, in the same order.
+    manager.calls.clear()
+    monkeypatch.setattr(
+        manager, "remove_many", PackageManager.remove_many.__get__(manager)
+    )
+    manager.cleanup_orphan()
+    assert manager.calls == [("remove", "stale-lib"), ("remove", "base")]
+
+
+def test_pip_batched_removal(monkeypatch):
+    tokens = _capture_run_cli(
+        monkeypatch, "pip", lambda m: m.remove_many(["arrow", "six"])
+    )
+    assert tokens[-3:] == ["--yes", "arrow", "six"]
+
+
 # orphans query: native read-only listings parsed into packages.
 
 
@@ -446,7 +549,7 @@ def test_orphans_parsing(monkeypatch, manager_id, output, expected):
     assert packages == expected
 
 
-@pytest.mark.parametrize("manager_id", ("cask", "npm", "pip", "snap"))
+@pytest.mark.parametrize("manager_id", ("cask", "npm", "snap"))
 def test_orphans_query_unsupported(manager_id):
     """Managers without a native read-only orphan listing (including cask: casks are
     never installed as dependencies) do not advertise the `orphans` operation."""
@@ -463,6 +566,7 @@ def test_orphans_query_unsupported(manager_id):
         "dnf5",
         "emerge",
         "pacman",
+        "pip",
         "pkg",
         "pkg-tools",
         "xbps",
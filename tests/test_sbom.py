@@ -60,7 +60,12 @@ from meta_package_manager.package import (
 )
 from meta_package_manager.sbom.base import SBOM, ExportFormat
 from meta_package_manager.sbom.cyclonedx import CycloneDX
-from meta_package_manager.sbom.spdx import SPDX
+from meta_package_manager.sbom.spdx import (
+    SPDX,
+    UpstreamSBOM,
+    load_upstream_sbom,
+    preload_upstream_sboms,
+)
 from meta_package_manager.sbom.vulnerabilities import Vulnerability
 
 
@@ -493,6 +498,124 @@ def test_stats_track_per_manager_and_merge_counts(tmp_path):
     assert stats["merged_documents"] == 1
 
 
+def _upstream_curl_document() -> dict:
+    """A minimal upstream `sbom.spdx.json` for `curl` depending on `zlib`."""
+    return {
+        "SPDXID": "SPDXRef-DOCUMENT",
+        "spdxVersion": "SPDX-2.3",
+        "documentNamespace": "https://example.org/sbom/curl-8.9.0",
+        "documentDescribes": ["SPDXRef-Package-curl"],
+        "packages": [
+            {
+                "SPDXID": "SPDXRef-Package-curl",
+                "name": "curl",
+                "versionInfo": "8.9.0",
+                "downloadLocation": "NOASSERTION",
+            },
+            {
+                "SPDXID": "SPDXRef-Package-zlib",
+                "name": "zlib",
+                "versionInfo": "1.3",
+                "downloadLocation": "NOASSERTION",
+                "files": [{"fileName": "./lib/libz.dylib"}],
+            },
+        ],
+        "relationships": [
+            {
+                "spdxElementId": "SPDXRef-DOCUMENT",
+                "relationshipType": "DESCRIBES",
+                "relatedSpdxElement": "SPDXRef-Package-curl",
+            },
+            {
+                "spdxElementId": "SPDXRef-Package-curl",
+                "relationshipType": "DEPENDS_ON",
+                "relatedSpdxElement": "SPDXRef-Package-zlib",
+            },
+        ],
+    }
+
+
+def test_upstream_sbom_reduction():
+    """Only the fields and edges the merge reads survive the reduction."""
+    upstream = UpstreamSBOM.from_document("abc", _upstream_curl_document())
+    assert upstream.root_id == "SPDXRef-Package-curl"
+    assert upstream.namespace == "https://example.org/sbom/curl-8.9.0"
+    assert [p["name"] for p in upstream.packages] == ["curl", "zlib"]
+    assert "files" not in upstream.packages[1]
+    assert upstream.relationships == (
+        ("SPDXRef-Package-curl", "DEPENDS_ON", "SPDXRef-Package-zlib"),
+    )
+    assert UpstreamSBOM.from_cache(upstream.to_cache()) == upstream
+
+
+def test_upstream_sbom_cache_keyed_by_digest(tmp_path):
+    """A cached entry is served for an unchanged file, re-parsed once it changes."""
+    sbom_file = tmp_path / "sbom.spdx.json"
+    sbom_file.write_text(json.dumps(_upstream_curl_document()))
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+
+    first = load_upstream_sbom(sbom_file, cache_dir)
+    cache_file = cache_dir / f"{first.digest}.json"
+    assert cache_file.is_file()
+
+    # Tamper with the cache entry: an unchanged source file must be served from
+    # it, proving the upstream document was not decoded again.
+    payload = json.loads(cache_file.read_text())
+    payload["packages"][1]["name"] = "zlib-from-cache"
+    cache_file.write_text(json.dumps(payload))
+    assert load_upstream_sbom(sbom_file, cache_dir).packages[1]["name"] == (
+        "zlib-from-cache"
+    )
+
+    # A changed source file has a new digest, so misses the cache.
+    document = _upstream_curl_document()
+    document["packages"][1]["versionInfo"] = "1.3.1"
+    sbom_file.write_text(json.dumps(document))
+    second = load_upstream_sbom(sbom_file, cache_dir)
+    assert second.digest != first.digest
+    assert second.packages[1] == {
+        "SPDXID": "SPDXRef-Package-zlib",
+        "name": "zlib",
+        "versionInfo": "1.3.1",
+        "downloadLocation": "NOASSERTION",
+    }
+
+    # A corrupt entry is a miss, not an error.
+    (cache_dir / f"{second.digest}.json").write_text("{not json")
+    assert load_upstream_sbom(sbom_file, cache_dir) == second
+
+
+def test_preloaded_upstream_sbom_merge(tmp_path):
+    """A preloaded upstream document splices exactly like a synchronous load."""
+    sbom_file = tmp_path / "sbom.spdx.json"
+    sbom_file.write_text(json.dumps(_upstream_curl_document()))
+    broken_file = tmp_path / "broken.spdx.json"
+    broken_file.write_text("{not json")
+
+    preloaded = preload_upstream_sboms([sbom_file, broken_file, sbom_file], jobs=2)
+    assert list(preloaded) == [sbom_file]
+
+    def render(upstream_sboms) -> dict:
+        s = SPDX()
+        s.init_doc()
+        s.upstream_sboms.update(upstream_sboms)
+        s.add_package(
+            _as_manager(_StubManager("brew", "Homebrew Formulae")),
+            _make_package("brew", "curl", "8.9.0"),
+            PackageMetadata(external_sbom_path=sbom_file),
+        )
+        s.finalize()
+        return s.stats()
+
+    synchronous = render({})
+    # The merge must not touch the file again once it was preloaded.
+    sbom_file.unlink()
+    assert render(preloaded) == synchronous
+    assert synchronous["merged_documents"] == 1
+    assert synchronous["transitive_packages_merged"] == 1
+
+
 def test_cyclonedx_stats_count_external_bom_refs(tmp_path):
     """CycloneDX stats report external BOM refs and dependency edges."""
     sbom_file = tmp_path / "sbom.spdx.json"
@@ -0,0 +1,134 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from meta_package_manager.execution import CLIError
+from meta_package_manager.session import close_sessions
+
+from .fake_manager import FakeManager
+
+REPL = """
+import os, sys, time
+
+def answer(command, argument):
+    if command == "pid":
+        print(os.getpid())
+    elif command == "echo":
+        print(argument)
+    elif command == "fail":
+        print(argument, file=sys.stderr)
+        return 3
+    elif command == "sleep":
+        time.sleep(float(argument))
+    elif command == "crash":
+        sys.exit(9)
+    return 0
+
+if len(sys.argv) > 1:
+    sys.exit(answer(sys.argv[1], " ".join(sys.argv[2:])))
+status = 0
+for line in sys.stdin:
+    command, _, argument = line.strip().partition(" ")
+    if command == "marker":
+        print(f"{argument} {status}", flush=True)
+        print(argument, file=sys.stderr, flush=True)
+    else:
+        status = answer(command, argument)
+"""
+"""Answers one command given as arguments, or a stream of them on `<stdin>`."""
+
+
+class SessionFakeManager(FakeManager):
+    """Fake manager driving the scripted REPL above, in a session when possible."""
+
+    pre_args = ("-c", REPL)
+
+    session_args = ("-u", "-c", REPL)
+
+    def session_script(self, args):
+        if args[1:3] != self.pre_args or args[3] == "unsupported":
+            return None
+        return " ".join(args[3:]) + "\n"
+
+    def session_trailer(self, marker):
+        return f"marker {marker}\n"
+
+
+@pytest.fixture
+def manager():
+    manager = SessionFakeManager()
+    yield manager
+    close_sessions()
+
+
+def test_session_reused(manager):
+    pid = manager.run_cli("pid")
+    assert pid == manager.run_cli("pid")
+    assert manager.run_cli("echo", "hello world") == "hello world"
+    (session,) = manager._sessions.values()
+    assert str(session.process.pid) == pid
+    # A command the session cannot run is spawned on its own.
+    assert manager.run_cli("unsupported") == ""
+    assert manager.run_cli("pid") == pid
+
+
+def test_session_concurrent_requests(manager):
+    pid = manager.run_cli("pid")
+    words = [f"word{index}" for index in range(20)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        answers = list(pool.map(lambda word: manager.run_cli("echo", word), words))
+    # Each request got its own output, from the one shared session.
+    assert answers == words
+    (session,) = manager._sessions.values()
+    assert str(session.process.pid) == pid
+    assert not manager._session_failed
+
+
+def test_session_failure(manager):
+    with pytest.raises(CLIError) as excinfo:
+        manager.run_cli("fail", "broken", must_succeed=True)
+    assert excinfo.value.code == 3
+    assert excinfo.value.error == "broken"
+    # The failed request does not end the session.
+    assert manager.run_cli("echo", "still there") == "still there"
+    assert not manager._session_failed
+
+
+def test_session_timeout(manager):
+    pid = manager.run_cli("pid")
+    manager.timeout = 1
+    assert manager.run_cli("sleep", "10") == ""
+    assert "Timed out after 1s." in str(manager.cli_errors[-1])
+    # The stuck session was killed, and a new one takes over.
+    assert not manager._session_failed
+    assert manager.run_cli("pid") not in ("", pid)
+
+
+def test_session_crash_falls_back(manager):
+    pid = manager.run_cli("pid")
+    # The crashed request is replayed as a one-shot run.
+    assert manager.run_cli("crash") == ""
+    assert manager._last_run == (9, "", "")
+    assert manager._session_failed
+    assert not manager._sessions
+    # Subsequent runs are one-shot spawns.
+    assert manager.run_cli("pid") not in ("", pid)
+    assert manager.run_cli("pid") != manager.run_cli("pid")
@@ -0,0 +1,232 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+
+from __future__ import annotations
+
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from meta_package_manager import cli, sync_state
+from meta_package_manager.sync_state import (
+    PENDING_SYNC_TTL,
+    SyncState,
+    start_background_sync,
+)
+
+from .conftest import _patch_pool_with
+from .fake_manager import FakeManager
+
+
+class SyncingFakeManager(FakeManager):
+    """Fake manager counting its `sync` calls."""
+
+    sync_calls = 0
+
+    def sync(self) -> None:
+        self.sync_calls += 1
+
+
+@pytest.fixture
+def syncing_pool(monkeypatch):
+    return _patch_pool_with(monkeypatch, SyncingFakeManager())
+
+
+def test_freshness(tmp_path):
+    state = SyncState(tmp_path / "state.json")
+    now = datetime.now(timezone.utc)
+    assert state.last_synced("apt") is None
+    assert not state.is_fresh("apt", timedelta(hours=1))
+
+    state.record_synced(["apt"], when=now - timedelta(hours=2))
+    state.record_synced(["brew"], when=now)
+    assert state.last_synced("apt") == now - timedelta(hours=2)
+    assert not state.is_fresh("apt", timedelta(hours=1), now=now)
+    assert state.is_fresh("apt", timedelta(hours=3), now=now)
+    # Recording one manager preserves the others.
+    assert state.is_fresh("brew", timedelta(hours=1), now=now)
+
+
+def test_pending_markers(tmp_path):
+    state = SyncState(tmp_path / "state.json")
+    now = datetime.now(timezone.utc)
+    state.record_pending(["apt", "snap"], os.getpid(), when=now)
+    assert state.is_pending("apt", now=now)
+    # A worker outliving the sync timeout is presumed dead.
+    assert not state.is_pending("apt", now=now + PENDING_SYNC_TTL)
+
+    state.clear_pending(["apt"])
+    assert not state.is_pending("apt", now=now)
+    assert state.is_pending("snap", now=now)
+
+
+def test_concurrent_writers_keep_all_entries(tmp_path):
+    state = SyncState(tmp_path / "state.json")
+    manager_ids = [f"manager{index}" for index in range(16)]
+    threads = [
+        # Each writer has its own instance, like separate processes.
+        threading.Thread(
+            target=SyncState(state.path).record_synced, args=([manager_id],)
+        )
+        for manager_id in manager_ids
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(state.last_synced(manager_id) for manager_id in manager_ids)
+
+
+def test_corrupted_state_reads_empty(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text("{not json", encoding="UTF-8")
+    state = SyncState(path)
+    assert state.last_synced("apt") is None
+    state.record_synced(["apt"])
+    assert state.last_synced("apt") is not None
+
+
+def test_start_background_sync(tmp_path, monkeypatch):
+    spawned = []
+
+    class FakeProcess:
+        pid = os.getpid()
+
+        def __init__(self, cmd, **kwargs):
+            spawned.append((cmd, kwargs))
+
+    monkeypatch.setattr(sync_state.subprocess, "Popen", FakeProcess)
+    state = SyncState(tmp_path / "state.json")
+    assert start_background_sync(["apt", "snap"], state) == os.getpid()
+
+    ((cmd, kwargs),) = spawned
+    assert cmd[-3:] == ("--apt", "--snap", "sync")
+    assert kwargs["stdin"] is sync_state.subprocess.DEVNULL
+    assert state.is_pending("apt")
+    assert state.is_pending("snap")
+    assert tmp_path.joinpath(sync_state.BACKGROUND_LOG_FILENAME).exists()
+
+
+def test_background_sync_outpacing_its_starter(tmp_path, monkeypatch):
+    """A worker done before its markers are recorded still clears them."""
+    state = SyncState(tmp_path / "state.json")
+    workers = []
+
+    class InstantWorker:
+        pid = os.getpid()
+
+        def __init__(self, cmd, **kwargs):
+            worker = threading.Thread(
+                target=SyncState(state.path).clear_pending, args=(["apt"],)
+            )
+            worker.start()
+            # Give the worker every chance to finish before its spawner returns.
+            worker.join(timeout=0.5)
+            workers.append(worker)
+
+    monkeypatch.setattr(sync_state.subprocess, "Popen", InstantWorker)
+    assert start_background_sync(["apt"], state) == os.getpid()
+    for worker in workers:
+        worker.join()
+    assert not state.is_pending("apt")
+
+
+def test_sync_skips_fresh_managers(invoke, syncing_pool):
+    result = invoke("sync", "--max-sync-age", "1h")
+    assert result.exit_code == 0
+    assert syncing_pool.sync_calls == 1
+    assert SyncState().last_synced(syncing_pool.id) is not None
+
+    result = invoke("sync", "--max-sync-age", "1h")
+    assert result.exit_code == 0
+    assert syncing_pool.sync_calls == 1
+
+    # No freshness policy: always sync.
+    result = invoke("sync")
+    assert result.exit_code == 0
+    assert syncing_pool.sync_calls == 2
+
+
+def test_outdated_syncs_stale_managers_only(invoke, syncing_pool):
+    result = invoke("outdated", "--max-sync-age", "1h")
+    assert result.exit_code == 0
+    assert "fake-pkg-alpha" in result.stdout
+    assert syncing_pool.sync_calls == 1
+
+    result = invoke("outdated", "--max-sync-age", "1h")
+    assert result.exit_code == 0
+    assert syncing_pool.sync_calls == 1
+
+    # Without the option, outdated never syncs.
+    long_ago = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    SyncState().record_synced([syncing_pool.id], when=long_ago)
+    result = invoke("outdated")
+    assert result.exit_code == 0
+    assert syncing_pool.sync_calls == 1
+
+
+def test_outdated_background_sync(invoke, syncing_pool, monkeypatch):
+    started = []
+    monkeypatch.setattr(
+        cli,
+        "start_background_sync",
+        lambda manager_ids, state: started.append(list(manager_ids)),
+    )
+    result = invoke("outdated", "--max-sync-age", "1h", "--background-sync")
+    assert result.exit_code == 0
+    assert "fake-pkg-alpha" in result.stdout
+    assert started == [[syncing_pool.id]]
+    assert syncing_pool.sync_calls == 0
+
+
+class PipelinedFakeManager(SyncingFakeManager):
+    """Fake manager logging its `sync` and `outdated` calls in order."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+
+    def sync(self) -> None:
+        super().sync()
+        self.calls.append("sync")
+
+    @property
+    def outdated(self):
+        self.calls.append("outdated")
+        return super().outdated
+
+
+def test_outdated_pipelined_sync(invoke, monkeypatch):
+    manager = _patch_pool_with(monkeypatch, PipelinedFakeManager())
+    result = invoke("outdated", "--sync")
+    assert result.exit_code == 0
+    assert "fake-pkg-alpha" in result.stdout
+    assert manager.calls == ["sync", "outdated"]
+    assert SyncState().last_synced(manager.id) is not None
+
+    # Combined with a freshness policy, only stale managers sync.
+    result = invoke("outdated", "--sync", "--max-sync-age", "1h")
+    assert result.exit_code == 0
+    assert manager.calls == ["sync", "outdated", "outdated"]
+
+
+def test_outdated_sync_excludes_background_sync(invoke, syncing_pool):
+    result = invoke("outdated", "--sync", "--max-sync-age", "1h", "--background-sync")
+    assert result.exit_code == 2
+    assert "mutually exclusive" in result.stderr
+    assert syncing_pool.sync_calls == 0
@@ -17,9 +17,12 @@
 from __future__ import annotations
 
 import copy
+import itertools
 import json
 import operator
+import random
 import re
+from functools import cmp_to_key
 
 import pytest
 from boltons.strutils import strip_ansi
@@ -28,6 +31,7 @@ from meta_package_manager.version import (
     Token,
     TokenizedString,
     VersionRange,
+    _intern,
     diff_versions,
     is_version,
     parse_version,
@@ -289,6 +293,87 @@ def test_tokenized_string_deepcopy():
     assert tok1.pretty_print() == tok2.pretty_print()
 
 
+def test_tokenized_string_interned():
+    """Parsing a value already seen returns the same instance."""
+    assert TokenizedString("1.2.3") is TokenizedString("1.2.3")
+    assert TokenizedString(42) is TokenizedString(42)
+    # Integers and their string form parse alike, but are cached apart.
+    assert TokenizedString("42") == TokenizedString(42)
+    assert TokenizedString(1).string == "1"
+    assert TokenizedString(True).string == "True"  # type: ignore[arg-type]
+    # A deep copy is still a distinct instance.
+    tok = TokenizedString("4.2.1")
+    assert copy.deepcopy(tok) is not tok
+
+
+def _random_versions(seed: int, count: int) -> list[str]:
+    """Generate versions mixing every token kind the comparator special-cases."""
+    atoms = ("0", "00", "1", "2", "10", "007", "a", "alpha", "rc", "dev", "v", "git")
+    atoms += ("ubuntu", "g6cd4c31", "post", "patch")
+    separators = (".", "-", "_", ":", "!", "~", "+", "")
+    rnd = random.Random(seed)
+    versions = []
+    for _ in range(count):
+        parts = [rnd.choice(atoms) for _ in range(rnd.randint(1, 6))]
+        versions.append(
+            "".join(part + rnd.choice(separators) for part in parts[:-1]) + parts[-1]
+        )
+    return versions
+
+
+def test_sort_key_matches_comparator():
+    """The precomputed sort key orders versions exactly like `_cmp()`."""
+    versions = list(map(TokenizedString, _random_versions(0, 400)))
+    assert any(v.sort_key is None for v in versions)
+    keyed = [v for v in versions if v.sort_key is not None]
+    for ver1, ver2 in itertools.combinations(keyed, 2):
+        expected = ver1._cmp(ver2)
+        assert (ver1.sort_key > ver2.sort_key) - (
+            ver1.sort_key < ver2.sort_key
+        ) == expected, (ver1, ver2)
+    # Keyed and key-less versions still sort together.
+    assert sorted(versions) == sorted(versions, key=cmp_to_key(TokenizedString._cmp))
+
+
+def test_version_parsing_corpus():
+    """Parse and sort a corpus of real-world version shapes.
+
+    With the heavy repetition of an actual inventory: a few thousand distinct
+    strings, the popular ones many times.
+    """
+    shapes = (
+        "{a}.{b}.{c}",
+        "{a}.{b}",
+        "v{a}.{b}.{c}",
+        "{a}.{b}.{c}rc{d}",
+        "{a}.{b}.{c}-{d}",
+        "1:{a}.{b}.{c}-{d}ubuntu{e}",
+        "{a}.{b}.{c}+dfsg-{d}",
+        "{a}.{b}.{c}-{d}.fc{e}",
+        "20{a}.{b}.{c}",
+        "{a}.{b}.{c}.post{d}",
+    )
+    rnd = random.Random(0)
+    distinct = [
+        rnd.choice(shapes).format(**{k: rnd.randint(0, 40) for k in "abcde"})
+        for _ in range(2000)
+    ]
+    weights = [1 / rank for rank in range(1, len(distinct) + 1)]
+    corpus = rnd.choices(distinct, weights=weights, k=10_000)
+
+    _intern.cache_clear()
+    cached = list(map(parse_version, corpus))
+    # Cached parses are shared, and identical to fresh ones.
+    assert len({id(version) for version in cached}) <= len(distinct)
+    for value, version in zip(corpus[:1000], cached):
+        uncached = object.__new__(TokenizedString)
+        uncached._parse(value)
+        assert version.tokens == uncached.tokens, value
+
+    versions = [parse_version(value) for value in distinct]
+    assert sorted(versions) == sorted(versions, key=cmp_to_key(TokenizedString._cmp))
+
+
 @pytest.mark.parametrize(
     ("value", "expected"),
     (
@@ -0,0 +1,180 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from meta_package_manager import cli_explore
+from meta_package_manager.watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    Watcher,
+    coalesce,
+    diff_packages,
+    inotify_support,
+    resolve_watch_paths,
+)
+
+from .conftest import _patch_pool_with
+from .fake_manager import FakeManager
+
+
+def test_diff_packages():
+    before = {"a": "1.0", "b": "2.0", "c": None}
+    after = {"b": "2.1", "c": None, "d": "4.0"}
+    assert diff_packages(before, after) == {
+        "added": [{"id": "d", "version": "4.0"}],
+        "removed": [{"id": "a", "version": "1.0"}],
+        "changed": [{"id": "b", "from": "2.0", "to": "2.1"}],
+    }
+    assert not any(diff_packages(after, after).values())
+
+
+def test_resolve_watch_paths(tmp_path, monkeypatch):
+    monkeypatch.setenv("WATCHED_HOME", str(tmp_path))
+    monkeypatch.delenv("UNSET_HOME", raising=False)
+    manager = FakeManager()
+    manager.watch_paths = (
+        "$WATCHED_HOME/status",
+        "$UNSET_HOME/status",
+        str(tmp_path / "missing" / "status"),
+        str(tmp_path / "status"),
+        str(tmp_path),
+    )
+    assert resolve_watch_paths(manager) == (tmp_path / "status", tmp_path)
+
+
+class ScriptedWatcher(Watcher):
+    """Replays a fixed sequence of changes, then interrupts the watch."""
+
+    def __init__(self, changes):
+        super().__init__({})
+        self.changes = list(changes)
+        self.timeouts = []
+
+    def read(self, timeout):
+        self.timeouts.append(timeout)
+        if not self.changes:
+            raise KeyboardInterrupt
+        return self.changes.pop(0)
+
+
+def test_coalesce():
+    watcher = ScriptedWatcher([{"apt"}, {"apt", "snap"}, set(), {"brew"}, set()])
+    bursts = coalesce(watcher, debounce=0.5)
+    assert next(bursts) == {"apt", "snap"}
+    assert next(bursts) == {"brew"}
+    # Each burst is awaited, then closed by a quiet period.
+    assert watcher.timeouts == [None, 0.5, 0.5, None, 0.5]
+
+
+def _watchers():
+    yield pytest.param(lambda targets: PollingWatcher(targets, 0.01), id="polling")
+    yield pytest.param(
+        InotifyWatcher,
+        id="inotify",
+        marks=pytest.mark.skipif(not inotify_support, reason="Linux only"),
+    )
+
+
+@pytest.mark.parametrize("make_watcher", _watchers())
+def test_watcher(tmp_path, make_watcher):
+    status = tmp_path / "dpkg" / "status"
+    status.parent.mkdir()
+    status.write_text("Package: sed\n")
+    cellar = tmp_path / "Cellar"
+    (cellar / "wget" / "1.21").mkdir(parents=True)
+    rpm = tmp_path / "rpm"
+    rpm.mkdir()
+
+    targets = {
+        "apt": (status,),
+        "brew": (cellar,),
+        "dnf": (rpm,),
+        "zypper": (rpm,),
+    }
+    with make_watcher(targets) as watcher:
+        assert watcher.read(0.05) == set()
+
+        # Atomic replacement of a watched file.
+        new_status = status.with_name("status-new")
+        new_status.write_text("Package: sed\nPackage: awk\n")
+        os.replace(new_status, status)
+        assert watcher.read(1) == {"apt"}
+
+        # New version folder inside a subdirectory of a watched directory.
+        (cellar / "wget" / "1.22").mkdir()
+        assert watcher.read(1) == {"brew"}
+
+        # A path shared by two managers reports both.
+        (rpm / "rpmdb.sqlite").write_bytes(b"\0")
+        assert watcher.read(1) == {"dnf", "zypper"}
+
+        # Unrelated files next to a watched one are ignored.
+        (status.parent / "lock").write_text("")
+        assert watcher.read(0.05) == set()
+
+
+class WatchedFakeManager(FakeManager):
+    """Fake manager whose installed packages change between two queries."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queries = 0
+
+    @property
+    def installed(self):
+        self.queries += 1
+        yield self.package(id="fake-pkg-alpha", installed_version="1.0.0")
+        if self.queries > 1:
+            yield self.package(id="fake-pkg-gamma", installed_version="0.1.0")
+
+
+def test_cli_watch(invoke, monkeypatch, tmp_path):
+    manager = _patch_pool_with(monkeypatch, WatchedFakeManager())
+    manager.watch_paths = (str(tmp_path / "status"),)
+    watchers = []
+
+    def make_watcher(targets):
+        watchers.append(targets)
+        return ScriptedWatcher([{manager.id}, set()])
+
+    monkeypatch.setattr(cli_explore, "make_watcher", make_watcher)
+
+    result = invoke("watch", "--debounce", "0")
+    assert result.exit_code == 0
+    assert watchers == [{manager.id: (tmp_path / "status",)}]
+    events = [json.loads(line) for line in result.stdout.splitlines()]
+    assert events == [
+        {"event": "watching", "managers": {manager.id: [str(tmp_path / "status")]}},
+        {
+            "event": "installed",
+            "manager_id": manager.id,
+            "added": [{"id": "fake-pkg-gamma", "version": "0.1.0"}],
+            "removed": [],
+            "changed": [],
+        },
+    ]
+
+
+def test_cli_watch_nothing_to_watch(invoke, fake_pool):
+    result = invoke("watch")
+    assert result.exit_code == 2
+    assert "No manager to watch." in result.stderr